@@ -1,495 +1,1684 @@
 #!usr/bin/env python
 # -*- coding: UTF-8 -*-
 """                                              All types modulo.
-This modulo contains class AllTypes and OnlySelfType descriptor. Almost all magic methods are present in the AllTypes
- class, which means that you can interact with Python literals with an instance of this class. How many class instances
- can be made. You can do this only once, and by default you can make as many instances of the class as you like. More
- detailed documentation is written in the class itself.
+This modulo contains class AllTypes and OnlySelfType descriptor, CompactAllTypes, the same class without an
+ instance __dict__, AllTypesBatch, a column-wise container of many records, and AllTypesStore, a file of records read
+ through mmap. Almost all magic methods are present in the AllTypes class, which means that you can interact with
+ Python literals with an instance of this class. How many class instances can be made. You can do this only once, and
+ by default you can make as many instances of the class as you like. More detailed documentation is written in the
+ class itself.
 """
 
-from typing import Any, AnyStr, NewType, List, Callable, Dict, Tuple, Set, FrozenSet, TypeVar, Literal, Iterator, IO
-
-__all__ = ['AllTypes', 'OnlySelfType']
+import asyncio
+import mmap
+import operator
+import os
+import struct
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Sequence, Set as AbstractSet
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from functools import partial
+from inspect import iscoroutinefunction
+from itertools import chain, count, islice, repeat
+from math import copysign
+from threading import Condition, Lock
+from time import monotonic, perf_counter_ns
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, AnyStr, NewType, List, Callable, Dict, Tuple, Set, FrozenSet, TypeVar, Literal, Iterator, IO, \
+    Iterable, Container
+
+__all__ = ['AllTypes', 'CompactAllTypes', 'BaseAllTypes', 'AllTypesOperators', 'AllTypesBatch', 'OnlySelfType',
+           'SlotSelfType', 'OperatorKernel', 'BroadcastKernel', 'LazyResult', 'LRUCache', 'ResultCache',
+           'CoercionCache', 'OperatorStats', 'SequenceView', 'InstancePool', 'InternTable', 'RecordCodec',
+           'AllTypesExpression', 'FieldSelection', 'AllTypesStream', 'AllTypesStore', 'FieldIterator', 'ListView',
+           'SetView']
 __author__ = '©Pushok8'
 
 # Annotation
 BuiltInTypes = TypeVar('BuiltInTypes', bool, int, float, complex, str, list, tuple, dict, set, frozenset)
 Numbers = TypeVar('Numbers', bool, int, float, complex)
-CodeTemplate = NewType('CodeTemplate', str)
 NumOrSet = TypeVar('NumOrSet', Numbers, set, frozenset)
 ClassInstance = NewType('ClassInsatnce', type)
 NumWithoutComplexOrSet = TypeVar('NumbersWithoutComplexOrSet', bool, int, float, set, frozenset)
 IntString = NewType('IntString', (int, str))
 FileObj = NewType('FileObj', IO)
+KernelKey = Tuple[str, str, type]
+Element = Callable[[Any, Any, Any], Any]
+Mutator = Callable[[Any, Any], Callable[[], Any] or None]
+Reader = Callable[[Any], Any]
+Column = List[Any] or array
+
+NAME_ALL_TYPES: Tuple[str, ...] = ('boolean', 'integer', 'float_num', 'complex_num', 'string', 'array', 'tuple_',
+                                   'dictionary', 'set_', 'frozenset_')
+NUMBER_TYPES: Tuple[type, ...] = (bool, int, float, complex)
+BUILT_IN_TYPES: Tuple[type, ...] = (bool, int, float, complex, str, list, tuple, dict, set, frozenset)
+BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv, '//': operator.floordiv,
+    '%': operator.mod, '**': operator.pow, '<<': operator.lshift, '>>': operator.rshift, '&': operator.and_,
+    '|': operator.or_, '^': operator.xor, 'divmod': divmod
+}
+INPLACE_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '-': operator.isub, '&': operator.iand, '|': operator.ior, '^': operator.ixor
+}
+COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '==': operator.eq, '!=': operator.ne, '<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge
+}
+# Names of the magic methods of the operators: '+' on the left is __add__, on the right __radd__, in place __iadd__.
+OPERATOR_NAMES: Dict[str, str] = {
+    '+': 'add', '-': 'sub', '*': 'mul', '/': 'truediv', '//': 'floordiv', '%': 'mod', 'divmod': 'divmod', '**': 'pow',
+    '<<': 'lshift', '>>': 'rshift', '&': 'and', '|': 'or', '^': 'xor', '==': 'eq', '!=': 'ne', '<': 'lt', '>': 'gt',
+    '<=': 'le', '>=': 'ge'
+}
+LAYOUT_PREFIXES: Dict[str, str] = {'left': '', 'right': 'r', 'equally': 'i', 'compare': ''}
+# Every write of a field takes the next stamp as the version of the instance, so a version is never repeated.
+WRITE_STAMPS: Iterator[int] = count()
+# Values that in-place operators mutate, so they are copied when they must not change (results of ResultCache, values
+# of LazyResult, copies of instances). DIRECT_ACCESS remembers which classes have a field read in 'direct' mode.
+MUTABLE_TYPES: FrozenSet[type] = frozenset((list, dict, set))
+DIRECT_ACCESS: Dict[Tuple[type, str], bool] = {}
+# Values that deepcopy gives back as they are, and the containers that is_flat looks into.
+ATOMIC_TYPES: FrozenSet[type] = frozenset((bool, int, float, complex, str, bytes, type(None)))
+IMMUTABLE_CONTAINERS: FrozenSet[type] = frozenset((tuple, frozenset))
+CONTAINER_TYPES: FrozenSet[type] = frozenset((list, tuple, set, frozenset))
+# Conversions of the fields to a container type, one for each type (see OperatorKernel.container_coercer).
+COERCERS: Dict[type, Callable[[Any], Any]] = {}
+# Results of '+' and '*' given as a SequenceView in the 'view' result mode.
+SEQUENCE_TYPES: FrozenSet[type] = frozenset((str, list, tuple))
+# Attributes kept by the instances for themselves: the version, the cached hash (see BaseAllTypes.__hash__) and the
+# names of the fields shared with copies (see OnlySelfType).
+INTERNAL_ATTRIBUTES: FrozenSet[str] = frozenset(('_version', '_hash', '_shared'))
+# Slots of the fields of CompactAllTypes, the other slots of its subclasses are not copied on write.
+FIELD_SLOTS: FrozenSet[str] = frozenset('_' + name for name in NAME_ALL_TYPES)
+
+
+class ListView(Sequence):
+    """Read-only view of a list, it does not copy the list and sees its later changes."""
+    __slots__ = ('_data',)
+
+    def __init__(self, data: list) -> None:
+        self._data: list = data
+
+    def __getitem__(self, item: Any) -> Any:
+        return self._data[item]
 
+    def __len__(self) -> int:
+        return len(self._data)
 
-class OnlySelfType:
-    """Descriptor for static variable type at class."""
-    def __init__(self, self_type: type) -> None:
-        self.__self_type: type = self_type
-
-    def __set_name__(self, owner, name: str) -> None:
-        self.__name = name
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
 
-    def __get__(self, instance, owner) -> Any:
-        return self.__self_type(instance.__dict__[self.__name])
+    def __contains__(self, item: Any) -> bool:
+        return item in self._data
 
-    def __set__(self, instance, value: Any) -> None:
-        instance.__dict__[self.__name] = self.__self_type(value)
+    def __eq__(self, other: Any) -> bool:
+        return self._data == (other._data if isinstance(other, ListView) else other)
 
-    def __delete__(self, instance) -> None:
-        del instance.__dict__[self.__name]
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._data!r})'
 
 
-class AllTypes(object):
+class FieldIterator:
     """
-    The AllTypes class, upon initialization, accepts all the built-in Python3.X data types of the CPython
-    implementation (bool, int, float, complex, str, list, tuple, dict, set, frozenset). The data must be specified
-    by name in this sequence, because a TypeError error may occur because the object cannot be converted to another
-    type. This class implements almost all magic methods and therefore you can interact with an instance using literals.
+    Iterator over the fields of an instance (iter(obj), reversed(obj)), every field is read when it is reached. Each
+    iteration has its own iterator, so the same instance can be iterated by nested loops and threads.
+    """
+    __slots__ = ('_instance', '_index', '_step')
 
-    Initialization:
-     There are two ways:
-      First option -> instance = AllTypes(boolean=False, integer=0, float_num=0.0, complex_num=0j, string='', array=[],
-                                          tuple_=(,), dictionary={}, set_=set(), frozenset_=frozenset())
-      Second option -> instance = AllTypes.define_max_instance(max_instance, [, *args[, **kwargs]])
+    def __init__(self, instance: Any, reverse: bool = False) -> None:
+        self._instance: Any = instance
+        self._index: int = len(NAME_ALL_TYPES) - 1 if reverse else 0
+        self._step: int = -1 if reverse else 1
 
-     Parameters of the first option:
-       boolean: any object convertible to boolean.
-       integer: any object convertible to integer.
-       float_num: any object convertible to float.
-       complex_num: any object convertible to complex.
-       string: any object convertible to string.
-       array: any object convertible to list.
-       tuple_: any object convertible to tuple.
-       dictionary: any object convertible to dictionary.
-       set_: any object convertible to set.
-       frozenset_: any object convertible to frozenset.
+    def __iter__(self) -> Iterator:
+        return self
 
-     Parameters of the second option:
-       max_instance: maximum number of class instances.
-       args: all parameters specified in the first embodiment.
-       kwargs: all named parameters specified in the first variant.
+    def __next__(self) -> Any:
+        index: int = self._index
+        if not 0 <= index < len(NAME_ALL_TYPES):
+            raise StopIteration
+        self._index = index + self._step
+        return getattr(self._instance, NAME_ALL_TYPES[index])
 
-     Class attributes:
-       all_types: return tuple all built-in types. (boolean, integer, float_num, complex_num, string, array, tuple_,
-                                                    dictionary, set_, frozenset_)
-     In the first version, the class with the specified parameters is simply initialized. The second option determines
-      how many instances of the class can be made. You can do this only once! By default, you can make as many instances
-      of the class as you like.
+    def __length_hint__(self) -> int:
+        return max(0, self._index + 1 if self._step < 0 else len(NAME_ALL_TYPES) - self._index)
 
-    Class parameter:
-      all_types - all built-in instance types of a class. (boolean, integer, float_num, complex_num, string, array,
-                                                                tuple_, dictionary, set_, frozenset_)
 
-    For examples, create an instance.
-    obj = AllTypes (False, 4, -2.5, (3-2j), 'sing', [1, 4], (6, 1), {5: '5'}, {1, 6}, frozenset([12, 5]))
+class SetView(AbstractSet):
+    """Read-only view of a set, it does not copy the set and sees its later changes."""
+    __slots__ = ('_data',)
 
-    Important! when using instance literals with a complex, the complex must be in brackets otherwise a TypeError error.
-        obj + (2-4j) <- Correct
-        obj + 2-4j <- Wrong
+    def __init__(self, data: set) -> None:
+        self._data: set = data
 
-    Comparisons:
-     obj (==, !=) other ->
-        is bool or str: each built-in types is converted to a bool or str value and compared with the
-          other object. Example - obj == True # (False, True, True, True, True, True, True, True, True, True)
-        is int or float: boolean, integer and float_num translate to int or float and compared with the other object.
-          Example - obj == 4 # (False, True, False)
-        is complex: boolean, integer, float_num and complex_num translate to complex and compare with the other object.
-          Example - obj == (4+0j) # (False, True, False, False)
-        is dict: compare dict with dictionary. Example - obj != {5: ''} # (True,)
-        is list or tuple or set or frozenset: each initialization parameter is converted to a list value
-          (25 -> [25], (1, 2, 3) -> {1, 2, 3}, 'str' -> ('s', 't', 'r')) and compared with the other object.
-          Example - obj != (1, 2) # (True, True, True, True, True, True, True, True, True, True)
-        is other type: tries to compare with all built-in types; if that fails, throws a TypeError.
+    def __contains__(self, item: Any) -> bool:
+        return item in self._data
 
-    obj (<, <=, >=, >) other ->
-      Everything is almost the same as when comparing with '==' and '! =', but with a few exceptions.
-      if other is list or tuple:
-        Trying to compare with all built-in types. If it fails, replaces the boolean value 'Does not compare!'.
-        is complex or dict: will return a tuple filled with the string 'Does not compare!'.
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
 
-    When comparing, a tuple is returned whose length depends on what is being compared.
+    def __len__(self) -> int:
+        return len(self._data)
 
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._data!r})'
 
-    Arithmetic operations:
-     Those types that are not specified in the enumeration of behavior of type other with an instance are not supported.
-     obj + other ->
-       is bool or str: each built-in types is converted to a bool or str value and add up with other. Examples -
-         obj + True # (1, 2, 2, 2, 2, 2, 2, 2, 2, 2)
-         obj + ' + str' # ('False + str', '4 + str', '-2.5 + str', '(3-2j) + str', 'sing + str', '[2, 4] + str',
-                           '(6, 1) + str', "{5: '5'} + str", "{'g', 'e'} + str", 'frozenset({6, 12}) + str')
-       is int or float or complex: boolean, integer, float_num and complex_num translate to int or float or complex type
-         and are added. Examples -
-           obj + 4 # (4, 8, 1.5, (7-2j))
-           obj + (2-3j) # ((2-3j), (6-3j), (-0.5-3j), (5-5j))
-       is list or tuple or set or frozenset: each built-in type is translated into list or tuple or set or frozenset
-         (6.2 -> [6.2], 'str' -> ('s', 't', 'r'), {1: 2, 3: 4} -> {1, 3}) and develops. Examples -
-         obj + [1, 2] # ([False, 1, 2], [4, 1, 2], [-2.5, 1, 2], [(3-2j), 1, 2], ['s' , 'i', 'n', 'g', 1, 2],
-                         [1, 4, 1, 2], [6, 1, 1, 2], [5, 1, 2], [1, 6 , 1, 2], [12, 5, 1, 2])
-     other + obj ->
-       is bool or str: other with each built-in type are converted to type bool or str and add up. Example -
-         '!' + obj # ('!False', '!4', '!-2.5', '!(3-2j)', '!sing', '![1, 4]', '!(6, 1)', "!{5: '5'}", '!{1, 6}',
-                      '!frozenset({12, 5})')
-       is int or float or complex: other stacks with boolean, integer, float_num and complex_num. Example -
-         3 + obj # (3, 7, 0.5, (6-2j))
-       is list or tuple or set or frozenset: other stacks with all the built-in types translated into list or tuple or
-         set or frozenset. Example - [1, 2] + obj # ([1, 2, False], [1, 2, 4], [1, 2, -2.5], [1, 2, (3-2j)],
-                                                     [1, 2, 's', 'i', 'n', 'g'], [1, 2, 1, 4], [1, 2, 6, 1], [1, 2, 5],
-                                                     [1, 2, 1, 6], [1, 2, 12, 5])
-     obj += other ->
-       is bool or int or float: boolean, integer, float_num, complex_num is equal to the result of addition with other.
-       is str or list or tuple or dict or set or frozenset: str, array, tuple_, dictionary, set_ and frozenset_ is equal
-         to the result of addition with other, converted to the type with which it is added.
 
-     obj - other ->
-       is bool or int or float or complex: from boolean, integer, float_num and complex_num is subtracted by other.
-         Example - obj - 1.4 # (-1.4, 2.6, -3.9, (1.6-2j))
-       is set or frozenset: each built-in types is converted to a set or frozenset value and add up with other.
-         ((3-2j) -> {(3-2j)}, 'st' -> {'s', 't'}, [1, 2] -> {1, 2}). Example -
-         obj - {1, 2} # ({False}, {4}, {-2.5}, {(3-2j)}, {'i', 'g', 's', 'n'}, {4}, {6}, {5}, {6}, {12, 5})
-     other - obj ->
-       is bool or int or float or complex: boolean, integer, float_num and complex_num are subtracted from other.
-         Example - 2 - obj # (2, -2, 4.5, (-1 + 2j))
-       is set or frozenset: subtracted from other all built-in types converted to set or frozenset. Example -
-         {4, 2.5} - obj # ({2.5, 4}, {2.5}, {2.5, 4}, {2.5, 4}, {2.5, 4}, {2.5}, {2.5, 4}, {2.5, 4}, {2.5, 4}, {2.5, 4})
-     obj -= other ->
-       is bool or int or float: boolean, integer, float_num, complex_num are equal to the result of subtracting other.
-       is set or frozenset: set and frozenset are equal to the result of subtracting other.
+class LazyResult(Sequence):
+    """
+    Tuple of the results of an operator, every item of which is computed on the first access and then memoized. The
+    field values are taken when the operator is called, so later changes of the instance do not change the result.
+    An exception of the item is raised when the item is accessed, with the type that the eager operator raises.
+    """
+    __slots__ = ('_element', '_values', '_other', '_modulo', '_results')
+    _missing: object = object()
+
+    def __init__(self, element: Element, values: Tuple[Any], other: Any, modulo: Numbers = None) -> None:
+        self._element: Element = element
+        self._values: Tuple[Any] = values
+        self._other: Any = other
+        self._modulo: Numbers = modulo
+        self._results: List[Any] = [self._missing] * len(values)
+
+    def _result(self, index: int) -> Any:
+        result: Any = self._results[index]
+        if result is self._missing:
+            result = self._results[index] = self._element(self._values[index], self._other, self._modulo)
+        return result
+
+    def __getitem__(self, item: int or slice) -> Any:
+        if isinstance(item, slice):
+            return tuple(map(self._result, range(len(self._results))[item]))
+        try:
+            item = operator.index(item)
+        except TypeError:
+            raise TypeError(f'tuple indices must be integers or slices, not {type(item).__name__}') from None
+        if item < 0:
+            item += len(self._results)
+        if not 0 <= item < len(self._results):
+            raise IndexError('tuple index out of range')
+        return self._result(item)
 
-     obj * other ->
-       is float or complex: multiply boolean, integer, float_num and complex_num by other. Example -
-         obj * 2.5 # (0.0, 10.0, -6.25, (7.5-5j))
-       is bool or int : boolean, integer, float_num, complex_num, string, array and tuple_ are multiplied on other.
-        Example - obj * 2 # (0, 8, -5.0, (6-4j), 'singsing', [1, 4, 1, 4], (6, 1, 6, 1))
-     other * obj ->
-       is bool or int or float or complex: other multiply on boolean, integer, float_num and complex_num. Example -
-         2 * obj # (0, 8, -5.0, (6-4j))
-       is str or list or tuple: other multiply on boolean and integer. Example - 'str' * obj # ('', 'strstrstrstr')
-     obj *= other ->
-       is bool or int: boolean, integer, float_num, complex_num, string, array and tuple_ equals the result of
-         multiplying by other.
-       is float: boolean, integer, float_num and complex equals the result of multiplying by other.
+    def __len__(self) -> int:
+        return len(self._results)
 
-     obj / other ->
-       is bool or int or float or complex: boolean, integer, float_num and complex_num is divided into other. Example -
-         obj / (1-0j) # (0j, (4+0j), (-2.5+0j), (3-2j))
-     other / obj ->
-       is bool or int or float or complex: other divided on boolean, integer, float_num and complex. Example -
-         Note: replaced boolean with True as ZeroDivisionError raises.
-         10 / obj # (10.0, 2.5, -4.0, (2.307692307692308+1.5384615384615383j))
-     obj /= other ->
-       is bool or int or float or complex: boolean, integer, float_num and complex_num is equal to the result of
-         division by other.
+    def __iter__(self) -> Iterator:
+        return map(self._result, range(len(self._results)))
 
-     obj (//, %) other ->
-       is bool or int or float: boolean, integer and float are divided integer or modulo by other. Example -
-         obj // 2 # (0, 2, -2.0)
-     other (//, %) obj ->
-       is bool or int or float: other divided integer or modulo by boolean, integer and float. Example -
-         Note: replaced boolean with True as ZeroDivisionError raises.
-         10 % obj # (0, 2, -0.0)
-     obj (//, %)= other ->
-       is bool or int or float: boolean, integer and float is equal to the result of an integer division operation or
-         modulo by other.
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (tuple, LazyResult)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
 
-     obj ** other ->
-       is bool or int or float or complex: boolean, integer, float_num, complex are raised to the power of other.
-        Example - obj ** True # (0, 4, -2.5, (3-2j))
-     other ** obj ->
-       is bool or int or float or complex: other is raised to the power of boolean, integer, float_num and complex_num.
-         Example - True ** obj # (1, 1, 1.0, (1+0j))
-     obj **= other ->
-       is bool or int or float or complex: boolean, integer, float_num, complex_num is equal to the result of raising to
-         the power of other.
+    def __hash__(self) -> int:
+        return hash(tuple(self))
 
-     pow(obj, other, modulo) ->
-       other is bool or int or float and modulo is None: boolean, integer, float_num, complex are raised to the power
-         of other. Example - pow(obj, 2) # (0, 16, 6.25, (5-12j))
-       other is bool or int or float and modulo is bool or int: boolean, integer and float are raised to the power of
-         other and are divided modulo. Example - pow(obj, 2, 3) # (0, 1, 1)
-     pow(other, obj) ->
-       is bool or int or float or complex: other is raised to the power of boolean, integer, float_num and complex_num.
-         Example - pow(2, obj) # (1, 16, 0.1767766952966369, (1.4676557979464138-7.86422192328995j))
+    def __repr__(self) -> str:
+        return repr(tuple(self))
 
-     divmod(obj, other) ->
-       is bool or int or float: boolean, integer and float_num divided integer and modulo. Example -
-        divmod(obj, -2) # ((0, 0), (-2, 0), (1.0, -0.5))
-     divmod(other, obj) ->
-       is bool or int or float: other is divided integer and modulo by boolean, integer and float_num. Example -
-        Note: replaced boolean with True as ZeroDivisionError raises.
-        divmod(-2, obj) # ((-2, 0), (-1, 2), (0.0, -2.0))
 
-     obj (<<, >>) other ->
-       is bool or int: boolean, integer and float binary shift left or right by other. Example - obj >> 5 # (0, 0, -1)
-     other (<<, >>) obj ->
-       is bool or int: other binary shifts left or right by boolean, integer and float_num. If some value is less than
-         zero, inserts 'value < 0'. Example - 3 >> obj # (3, 0, '-2.5 < 0')
-     obj (>>, <<)= other ->
-       is bool or int: boolean, integer, and float_num equals the result of a binary offset left or right by other.
+class SequenceView(Sequence):
+    """
+    String, list or tuple that is the concatenation of parts repeated times times, without building it: the result of
+    '+' and '*' in the 'view' result mode (see BaseAllTypes.set_result_mode). len, indexing and iteration read the
+    parts, a slice builds only its own items and materialize() builds the whole sequence. The parts are immutable or
+    copies, so the view never changes. Its memory does not depend on times.
+    """
+    __slots__ = ('_parts', '_times', '_kind', '_offsets', '_cycle')
+
+    def __init__(self, parts: Tuple[Sequence, ...], times: int = 1) -> None:
+        self._parts: Tuple[Sequence, ...] = parts
+        self._times: int = max(0, times)
+        self._kind: type = type(parts[0])
+        # Index of the first item of every part in one cycle of the parts.
+        offsets: List[int] = [0]
+        for part in parts:
+            offsets.append(offsets[-1] + len(part))
+        self._offsets: Tuple[int, ...] = tuple(offsets)
+        self._cycle: int = offsets[-1]
+
+    def _build(self, items: Iterable[Any]) -> Sequence:
+        return ''.join(items) if self._kind is str else self._kind(items)
+
+    def _item(self, index: int) -> Any:
+        index %= self._cycle
+        for part, offset, end in zip(self._parts, self._offsets, self._offsets[1:]):
+            if index < end:
+                return part[index - offset]
+
+    def _items_from(self, start: int) -> Iterator:
+        """Items from the index start to the end."""
+        cycle, index = divmod(start, self._cycle) if self._cycle else (0, 0)
+        for part, offset, end in zip(self._parts, self._offsets, self._offsets[1:]):
+            if index < end:
+                yield from islice(part, max(0, index - offset), None)
+        yield from chain.from_iterable(chain.from_iterable(repeat(self._parts, self._times - cycle - 1)))
+
+    def materialize(self) -> Sequence:
+        """The string, list or tuple that the view stands for."""
+        return self._build(chain.from_iterable(self._parts)) * self._times
 
-     obj (&, |, ^) other ->
-       is bool or int: boolean, integer and float_num are converted to int and perform the binary operation & or | or ^
-         with other. Example - obj ^ 2 # (-2, -2, -2)
-       is set or frozenset: each built-in type translated to set or frozenset (25 -> {25}, 'sst' -> {'s', 't'}) and
-        perform the operation & or | or ^ with other. Example -
-        obj ^ {1, 2} # ({False, 1, 2}, {1, 2, 4}, {1, 2, -2.5}, {1, 2, (3-2j)}, {1, 2, 'n', 's', 'g', 'i'}, {2, 4},
-                        {2, 6}, {1, 2, 5}, {2, 6}, {1, 2, 12, 5})
-     other (&, |, ^) ->
-       is bool or int: other with boolean, integer and float_num perform the binary operation & or | or ^.  Example -
-         2 ^ obj # (2, 6, -4)
-       is set or frozenset: other with each built-in type translated to set or frozenset perform the operation
-         & or | or ^. Example - {1, 2} & obj # (set(), set(), set(), set(), set(), {1}, {1}, set(), {1}, set())
-     obj (&, |, ^)= other ->
-       is bool or int: boolean, integer and float num are equal to the result of binary operations & or | or ^
-         with other.
-       is set or frozenset: set and frozenset are equal to the result of the operation & or | or ^ with other.
+    def __len__(self) -> int:
+        return self._cycle * self._times
+
+    def __getitem__(self, item: int or slice) -> Any:
+        length: int = len(self)
+        if isinstance(item, slice):
+            start, stop, step = item.indices(length)
+            if step == 1:
+                return self._build(islice(self._items_from(start), max(0, stop - start)))
+            return self._build([self._item(index) for index in range(start, stop, step)])
+        try:
+            item = operator.index(item)
+        except TypeError:
+            raise TypeError(f'{self._kind.__name__} indices must be integers or slices, not {type(item).__name__}') \
+                from None
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError(f'{self._kind.__name__} index out of range')
+        return self._item(item)
 
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(chain.from_iterable(repeat(self._parts, self._times)))
 
-    Unary operators and functions:
-      +obj -> +boolean, +integer, +float_num, +complex_num
-      -obj -> -boolean, -integer, -float_num, -complex_num
-      abs(obj) -> abs(integer), abs(float_num), abs(complex_num)
-      round(obj, 2) -> round(float_num, 2)
-      floor(obj) -> floor(float_num)
-      ceil(obj) -> ceil(float_num)
-      trunc(obj) -> trunc(float_num)
+    def __contains__(self, item: Any) -> bool:
+        if self._kind is str:
+            # A substring may span the parts.
+            return item in self.materialize()
+        return self._times > 0 and any(item in part for part in self._parts)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SequenceView):
+            other = other.materialize()
+        if type(other) is self._kind:
+            return len(self) == len(other) and self.materialize() == other
+        return NotImplemented
 
-    Transfer functions to another type:
-      int (), float (), complex () tried convert string to self type, if it turns out, returns the translated string.
-      int(obj) -> int(float_num)
-      float(obj) -> float(integer)
-      complex(obj) -> complex(integer, float_num)
-      bool(obj) -> if at least one element is True in all_types, returns True, if all elements converted to a boolean
-                   value are False, returns False
-      str(obj) -> '<class (class name) instance at (instance hex id)>'
-      repr(obj) -> str(obj)
-      list(obj) -> list(all_types)
-      hash(obj) -> returns a hash of a tuple in which all hashable types.
-      len(obj) -> len(all_types)
-      (1, 2, 3)[obj] -> (1, 2, 3)[integer]
-      '->{}<-'.format(obj) -> '->{}<-'.format(string)
-      obj[2] -> all_types[2]
-      iter(obj) -> iter(all_types)
-      reversed(obj) -> all_types[::-1]
-      2 in obj -> 2 in all_types
-      obj() -> If the user has added the called object(s), all called objects are called and all parameters that are
-               specified when the instance is called are passed. A dictionary is returned with the name of the called
-               object and the value that it returns.
+    def __hash__(self) -> int:
+        return hash(self.materialize())
 
-    Context manager: looks for an object that has the attribute "close", and returns a list of these objects.
+    def __repr__(self) -> str:
+        parts: str = ' + '.join(map(repr, self._parts))
+        if self._times != 1:
+            parts = f'({parts}) * {self._times}' if len(self._parts) > 1 else f'{parts} * {self._times}'
+        return f'{self.__class__.__name__}({parts})'
+
+
+class OnlySelfType:
     """
-    from math import floor, ceil, trunc
-    from copy import deepcopy
+    Descriptor for static variable type at class.
+
+    The value is validated and converted to the type on assignment. How it is given back on reading depends on the read
+    mode, which is set for the field (OnlySelfType(list, read_mode='direct')) or for the whole class (the _read_mode
+    class attribute, see AllTypes.set_read_mode). The mode of the field wins over the mode of the class.
+      'copy' - default, every reading returns a new converted object, so the instance never shares its containers.
+      'direct' - returns the stored object itself. Aliasing: mutating it mutates the field of the instance, bypassing
+                 the type check. The next assignment replaces the stored object and does not touch the one already
+                 returned; an in-place operator that changes a list or a set in place (obj += [1]) changes it too.
+                 A value of another type left by an in-place operator (obj -= frozenset() gives a frozenset for
+                 set_) is converted and stored by the reading.
+      'view' - returns a read-only view of the stored object (ListView, SetView or MappingProxyType, immutable values as
+               they are). The view sees mutations of the stored object until the field is assigned again.
+
+    Copies of an instance share its lists, dictionaries and sets (copy-on-write): the names of the shared fields are
+    kept in the _shared attribute of both instances. A shared container is copied by own() before it is changed in
+    place, by an in-place operator or through a 'direct' reading; an assignment just stops the sharing of the field.
+    A view taken before the container is copied keeps showing the shared one.
+    """
+    read_modes: Tuple[str, ...] = ('copy', 'direct', 'view')
+    views: Dict[type, Callable[[Any], Any]] = {list: ListView, set: SetView, dict: MappingProxyType}
 
-    _max_val_is_changed: bool = False
-    _max_quantity_instance: int = -1
-    _last_instance: ClassInstance = None
+    def __init__(self, self_type: type, read_mode: str = None) -> None:
+        if read_mode is not None and read_mode not in self.read_modes:
+            raise ValueError(f'read_mode must be one of {self.read_modes}, not {read_mode!r}')
+        self._self_type: type = self_type
+        self.read_mode: str = read_mode
 
-    @classmethod
-    def define_max_instance(cls, max_instance: int, *args: BuiltInTypes, **kwargs: BuiltInTypes) -> ClassInstance:
-        """Define max quantity instance from class."""
-        if cls._max_val_is_changed:
-            return 'The maximum number of class instances has already been changed.'
-        else:
-            cls._max_val_is_changed = True
-            cls._max_quantity_instance: int = int(max_instance)
-            return cls(*args, **kwargs)
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
 
-    def __new__(cls, *args: BuiltInTypes, **kwargs: BuiltInTypes) -> _last_instance:
-        if cls._max_quantity_instance != 0:
-            cls._max_quantity_instance -= 1
-            cls._last_instance = super().__new__(cls)
-        return cls._last_instance
+    def __get__(self, instance, owner) -> Any:
+        if instance is None:
+            return self
+        read_mode: str = self.read_mode or getattr(owner, '_read_mode', 'copy')
+        if read_mode == 'copy':
+            return self._self_type(instance.__dict__[self._name])
+        value: Any = self.own(instance) if read_mode == 'direct' else instance.__dict__[self._name]
+        if type(value) is not self._self_type:
+            value = self._self_type(value)
+            if read_mode == 'direct':
+                # An in-place operator left another type: the converted value is stored, so that it is the field.
+                self.replace(instance, value)
+        if read_mode == 'view' and self._self_type in self.views:
+            return self.views[self._self_type](value)
+        return value
 
-    # So that the user could not put another type in place of the desired one.
-    boolean: bool = OnlySelfType(bool)
-    integer: int = OnlySelfType(int)
-    float_num: float = OnlySelfType(float)
-    complex_num: complex = OnlySelfType(complex)
-    string: AnyStr = OnlySelfType(str)
-    array: List[Any] = OnlySelfType(list)
-    tuple_: Tuple[Any] = OnlySelfType(tuple)
-    dictionary: Dict[Any, Any] = OnlySelfType(dict)
-    set_: Set[Any] = OnlySelfType(set)
-    frozenset_: FrozenSet[Any] = OnlySelfType(frozenset)
+    def __set__(self, instance, value: Any) -> None:
+        storage: Dict[str, Any] = instance.__dict__
+        storage[self._name] = self._self_type(value)
+        storage['_version'] = next(WRITE_STAMPS)
+        if '_shared' in storage:
+            self._unshare(storage)
 
-    def __init__(self, boolean: bool = bool(), integer: int = int(), float_num: float = float(),
-                 complex_num: complex = complex(), string: AnyStr = str(), array: List[Any] = [],
-                 tuple_: Tuple[Any] = tuple(), dictionary: Dict[Any, Any] = dict(), set_: Set[Any] = set(),
-                 frozenset_: FrozenSet[Any] = frozenset()) -> None:
-        self.boolean = boolean
-        self.integer = integer
-        self.float_num = float_num
-        self.complex_num = complex_num
-        self.string = string
-        self.array = array
-        self.tuple_ = tuple_
-        self.dictionary = dictionary
-        self.set_ = set_
-        self.frozenset_ = frozenset_
+    def __delete__(self, instance) -> None:
+        storage: Dict[str, Any] = instance.__dict__
+        del storage[self._name]
+        storage['_version'] = next(WRITE_STAMPS)
+        if '_shared' in storage:
+            self._unshare(storage)
+
+    def _unshare(self, storage: Dict[str, Any]) -> None:
+        if self._name in storage['_shared']:
+            storage['_shared'] = storage['_shared'] - {self._name}
+
+    def stored(self, instance) -> Any:
+        """Return the stored value without copying it, it is converted only if an in-place operator changed its type."""
+        value: Any = instance.__dict__[self._name]
+        return value if type(value) is self._self_type else self._self_type(value)
+
+    def raw(self, instance) -> Any:
+        """Return the stored value as it is, in-place operators work with it."""
+        return instance.__dict__[self._name]
+
+    def replace(self, instance, value: Any) -> None:
+        """Store the value as it is, without conversion."""
+        storage: Dict[str, Any] = instance.__dict__
+        storage[self._name] = value
+        if '_shared' in storage:
+            self._unshare(storage)
+
+    def own(self, instance) -> Any:
+        """Return the raw stored value, copied and stored first if it is shared with a copy of the instance."""
+        storage: Dict[str, Any] = instance.__dict__
+        value: Any = storage[self._name]
+        if '_shared' in storage and self._name in storage['_shared']:
+            value = storage[self._name] = copy(value)
+            self._unshare(storage)
+        return value
 
-    # Two "all_types" are created so that if the user changes the public "all_types" there are no bugs.
-    @property
-    def all_types(self) -> Tuple[BuiltInTypes]:
-        return (self.boolean, self.integer, self.float_num, self.complex_num, self.string, self.array, self.tuple_,
-                self.dictionary, self.set_, self.frozenset_)
 
-    @property
-    def _all_types(self) -> Tuple[BuiltInTypes]:
-        return (self.boolean, self.integer, self.float_num, self.complex_num, self.string, self.array, self.tuple_,
-                self.dictionary, self.set_, self.frozenset_)
+class SlotSelfType(OnlySelfType):
+    """OnlySelfType for classes without __dict__, the value is kept in the slot named '_' + name of the field."""
 
-    def _comparison(self, other: Any, compare: Literal = '==') -> Tuple[bool]:
-        if compare != '==' and compare != '!=' and compare != '>' and compare != '<' and compare != '>=' and \
-                compare != '<=':
-            raise NameError("Сompare must be literal!")
-
-        result: List[bool] = []
-        numbers: Tuple[Numbers] = (self.boolean, self.integer, self.float_num, self.complex_num)
-        type_numbers: Tuple[Numbers] = tuple(map(type, numbers))
-        type_other: type = type(
-            other)  # It is done in order not to write a strange construct, for example: type(other)(val)
-        type_all_types: Tuple[BuiltInTypes] = tuple(map(type, self._all_types))
-        if isinstance(other, (bool, str)) or type_other not in type_all_types:
-            for val in self._all_types:
-                try:
-                    result.append(eval(f'type_other(val) {compare} other'))
-                except (TypeError, SyntaxError):
-                    raise TypeError(
-                        f"'{compare}' not supported between instances of '{type_other}' and '{type(val)}'")
-        elif type_other in type_numbers[1:3]:
-            for val in numbers[:3]:
-                result.append(eval(f'type_other(val) {compare} other'))
-        elif isinstance(other, complex) and compare in ('==', '!='):
-            for val in numbers[:4]:
-                result.append(eval(f'type_other(val) {compare} other'))
-        elif isinstance(other, dict) and compare in ('==', '!='):
-            result.append(eval(f'self.dictionary {compare} other'))
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+        self._slot = getattr(owner, '_' + name)
+        # Slot of the names of the shared fields, None if the class has no copy-on-write.
+        self._shared = getattr(owner, '_shared', None)
+
+    def __get__(self, instance, owner) -> Any:
+        if instance is None:
+            return self
+        read_mode: str = self.read_mode or getattr(owner, '_read_mode', 'copy')
+        if read_mode == 'copy':
+            return self._self_type(self._slot.__get__(instance, owner))
+        value: Any = self.own(instance) if read_mode == 'direct' else self._slot.__get__(instance, owner)
+        if type(value) is not self._self_type:
+            value = self._self_type(value)
+            if read_mode == 'direct':
+                self.replace(instance, value)
+        if read_mode == 'view' and self._self_type in self.views:
+            return self.views[self._self_type](value)
+        return value
+
+    def __set__(self, instance, value: Any) -> None:
+        self._slot.__set__(instance, self._self_type(value))
+        instance._version = next(WRITE_STAMPS)
+        self._unshare(instance)
+
+    def __delete__(self, instance) -> None:
+        self._slot.__delete__(instance)
+        instance._version = next(WRITE_STAMPS)
+        self._unshare(instance)
+
+    def _unshare(self, instance) -> bool:
+        """Stop the sharing of the field, True if it was shared."""
+        try:
+            shared: FrozenSet[str] = self._shared.__get__(instance, None)
+        except AttributeError:
+            return False
+        if self._name not in shared:
+            return False
+        self._shared.__set__(instance, shared - {self._name})
+        return True
+
+    def stored(self, instance) -> Any:
+        value: Any = self._slot.__get__(instance, None)
+        return value if type(value) is self._self_type else self._self_type(value)
+
+    def raw(self, instance) -> Any:
+        return self._slot.__get__(instance, None)
+
+    def replace(self, instance, value: Any) -> None:
+        self._slot.__set__(instance, value)
+        self._unshare(instance)
+
+    def own(self, instance) -> Any:
+        value: Any = self._slot.__get__(instance, None)
+        if self._unshare(instance):
+            value = copy(value)
+            self._slot.__set__(instance, value)
+        return value
+
+
+class OperatorKernel:
+    """
+    Specialized callable for one (symbol, layout_self, operand type) key of AllTypes._arithmetic, or for one
+    (compare, 'compare', operand type) key of AllTypes._comparison.
+
+    A kernel knows which fields the operator reads (fields, or modulo_fields when pow() gets a modulo) and the function
+    applied to every one of them (element(val, other, modulo)). When element is nothing but plain_operator(val, other),
+    or plain_operator(other, val) for the right layout, plain_operator is given too. Left and right kernels read the
+    stored values through OnlySelfType.stored, without a copy, and return a tuple.
+
+    The 'equally' kernel reads the raw stored values through OnlySelfType.raw and changes the instance all or nothing:
+    first the new value of every field is computed, and only if none of them raised, the values are written through
+    OnlySelfType.replace. A list or a set is changed in place when mutate(val, other) gives the change for it (a
+    function which can not fail, e.g. extending the list), so it is neither rebuilt nor converted again. Such a kernel
+    reads through OnlySelfType.own instead, so a container shared with a copy is copied before it is changed.
+
+    The '+' and '*' kernels whose results are strings, lists or tuples have sequence, an element giving a SequenceView
+    instead of the concatenation or the repetition, used by view().
+
+    Kernels that first convert every field to a list, tuple, set or frozenset have coerce, the conversion (one function
+    for each type, see container_coercer), and coerced, the element applied to the converted value:
+    element(val, other, modulo) is coerced(coerce(val), other, modulo). CoercionCache keeps the conversions.
+
+    dunder is the name of the magic method of the operator (__radd__, __le__, ...), branch names the way a comparison
+    kernel compares the fields, both are used by OperatorStats.
+    """
+    __slots__ = ('key', 'fields', 'modulo_fields', 'element', 'plain_operator', 'mutate', 'sequence', 'coerce',
+                 'coerced', 'inplace', 'dunder', 'branch', '_readers')
+
+    def __init__(self, key: KernelKey, fields: Tuple[str, ...], element: Element,
+                 modulo_fields: Tuple[str, ...] = None, plain_operator: Callable[[Any, Any], Any] = None,
+                 mutate: Mutator = None, sequence: Element = None, coerce: Callable[[Any], Any] = None,
+                 coerced: Element = None, branch: str = None) -> None:
+        self.key: KernelKey = key
+        self.dunder: str = f'__{LAYOUT_PREFIXES.get(key[1], "")}{OPERATOR_NAMES.get(key[0], key[0])}__'
+        self.branch: str = branch
+        self.fields: Tuple[str, ...] = fields
+        self.modulo_fields: Tuple[str, ...] = fields if modulo_fields is None else modulo_fields
+        self.element: Element = element
+        self.plain_operator: Callable[[Any, Any], Any] = plain_operator
+        self.mutate: Mutator = mutate
+        self.sequence: Element = sequence
+        self.coerce: Callable[[Any], Any] = coerce
+        self.coerced: Element = coerced
+        self.inplace: bool = key[1] == 'equally'
+        self._readers: Dict[type, Tuple[Tuple[Reader, ...], Tuple[Reader, ...]]] = {}
+
+    def _bind(self, owner: type) -> Tuple[Tuple[Reader, ...], Tuple[Reader, ...]]:
+        """
+        Find how the fields are read from instances of owner, without the copy that the descriptors make. An in-place
+        kernel gets the raw readers and the writers of its fields instead.
+        """
+        def method(name: str, method_name: str, default: Callable) -> Callable:
+            return getattr(getattr(owner, name, None), method_name, None) or default
+
+        def read_dict(name: str) -> Reader:
+            return lambda instance: instance.__dict__[name]
+
+        def write_dict(name: str) -> Callable[[Any, Any], None]:
+            def write(instance: Any, value: Any) -> None:
+                instance.__dict__[name] = value
+            return write
+
+        if self.inplace:
+            # Fields that may be changed in place are read through own, which ends their copy-on-write sharing.
+            readers = (tuple(method(name, 'raw' if self.mutate is None else 'own', read_dict(name))
+                             for name in self.fields),
+                       tuple(method(name, 'replace', write_dict(name)) for name in self.fields))
         else:
-            for val in self._all_types:
-                try:
-                    if hasattr(val, '__iter__'):
-                        result.append(eval(f'type_other(val) {compare} other'))
-                    else:
-                        result.append(eval(f'type_other([val]) {compare} other'))
-                except (TypeError, ValueError):
-                    result.append('Does not compare!')
+            readers = (tuple(method(name, 'stored', attrgetter(name)) for name in self.fields),
+                       tuple(method(name, 'stored', attrgetter(name)) for name in self.modulo_fields))
+        self._readers[owner] = readers
+        return readers
 
-        return tuple(result)
+    def __call__(self, instance: Any, other: Any, modulo: Numbers = None) -> Tuple[Any]:
+        element: Element = self.element
+        try:
+            readers, second = self._readers[type(instance)]
+        except KeyError:
+            readers, second = self._bind(type(instance))
+        if self.inplace:
+            self._update(instance, readers, second, other, modulo)
+            return ()
+        if modulo is not None:
+            readers = second
+        return tuple([element(read(instance), other, modulo) for read in readers])
+
+    def _update(self, instance: Any, readers: Tuple[Reader, ...], writers: Tuple[Callable[[Any, Any], None], ...],
+                other: Any, modulo: Numbers) -> None:
+        """Compute the new values of all fields, then write them. An exception leaves the instance unchanged."""
+        element: Element = self.element
+        mutate: Mutator = self.mutate
+        changes: List[Callable[[], Any]] = []
+        values: List[Tuple[Callable[[Any, Any], None], Any]] = []
+        for read, write in zip(readers, writers):
+            val: Any = read(instance)
+            change: Callable[[], Any] = mutate(val, other) if mutate is not None else None
+            if change is None:
+                values.append((write, element(val, other, modulo)))
+            else:
+                changes.append(change)
+        for change in changes:
+            change()
+        for write, value in values:
+            write(instance, value)
+
+    def values(self, instance: Any, modulo: Numbers = None) -> Tuple[Any]:
+        """Stored values of the fields that the kernel reads, the modulo_fields if modulo is given."""
+        try:
+            readers, modulo_readers = self._readers[type(instance)]
+        except KeyError:
+            readers, modulo_readers = self._bind(type(instance))
+        if modulo is not None:
+            readers = modulo_readers
+        return tuple([read(instance) for read in readers])
+
+    def lazy(self, instance: Any, other: Any, modulo: Numbers = None) -> LazyResult:
+        """Return the result as a LazyResult, only the field values are read now."""
+        # Lists and sets are copied, an in-place operator would change them under the result.
+        return LazyResult(self.element, tuple([copy(val) if type(val) in MUTABLE_TYPES else val
+                                               for val in self.values(instance, modulo)]), other, modulo)
+
+    @staticmethod
+    def container_coercer(type_other: type) -> Callable[[Any], Any]:
+        """The conversion of a field to the container type_other (25 -> [25], 'str' -> ('s', 't', 'r'))."""
+        try:
+            return COERCERS[type_other]
+        except KeyError:
+            def coerce(val: Any) -> Any:
+                return type_other(val) if hasattr(val, '__iter__') else type_other([val])
+            return COERCERS.setdefault(type_other, coerce)
+
+    def view(self, instance: Any, other: Any, modulo: Numbers = None) -> Tuple[Any]:
+        """Return the result with a SequenceView in place of every string, list or tuple built by '+' or '*'."""
+        if self.sequence is None:
+            return self(instance, other, modulo)
+        if type(other) is list:
+            # The views keep the operand, which the eager result would have copied: it is copied once for all of them.
+            other = list(other)
+        sequence: Element = self.sequence
+        return tuple([sequence(val, other, modulo) for val in self.values(instance, modulo)])
+
+    def select(self, instance: Any, other: Any, modulo: Numbers, names: Container[str]) -> Dict[str, Any]:
+        """
+        Apply the kernel to the fields in names only, the other fields are not read. Returns {field: result} in the
+        order of the kernel fields, an in-place kernel changes the selected fields all or nothing and returns {}.
+        """
+        try:
+            readers, second = self._readers[type(instance)]
+        except KeyError:
+            readers, second = self._bind(type(instance))
+        if self.inplace:
+            selected: List[int] = [index for index, name in enumerate(self.fields) if name in names]
+            self._update(instance, tuple([readers[index] for index in selected]),
+                         tuple([second[index] for index in selected]), other, modulo)
+            return {}
+        if modulo is not None:
+            return {name: self.element(read(instance), other, modulo)
+                    for name, read in zip(self.modulo_fields, second) if name in names}
+        return {name: self.element(read(instance), other, modulo)
+                for name, read in zip(self.fields, readers) if name in names}
 
-    def _arithmetic(self, other: Any, symbol: Literal = '+', layout_self: str = 'left', modulo: Numbers = None) -> Tuple[Any]:
-        name_all_types: Tuple[str] = ('boolean', 'integer', 'float_num', 'complex_num', 'string', 'array', 'tuple_',
-                                      'dictionary', 'set_', 'frozenset_')
-        numbers: Tuple[Numbers] = (self.boolean, self.integer, self.float_num, self.complex_num)
-        type_numbers: Tuple[Numbers] = tuple(map(type, numbers))
-        binary_operators: Tuple[Literal] = ('<<', '>>', '&', '|', '^')
-        result: List[Any] = []
-        templates: CodeTemplate = ('for val in self._all_types{segment}:{before_expression}result.append({expression})'
-                                   '{after_expression}', 'for name in name_all_types{segment}:{before_expression}'
-                                                         'self.__dict__[name]{expression}{after_expression}')
-
-        def define_layout(code_left_layout: CodeTemplate = '', code_right_layout: CodeTemplate = '',
-                          code_equally: CodeTemplate = ''):
-            allowed_vars: Dict[str, Any] = {'layout_self': layout_self, 'modulo': modulo, 'other': other, 'self': self,
-                                            '__builtins__': {'pow': pow, 'hasattr': hasattr, 'print': print, 'str': str,
-                                                             'divmod': divmod, 'complex': complex, 'int': int,
-                                                             'ValueError': ValueError, 'float': float, 'dict': dict,
-                                                             'isinstance': isinstance, 'type': type, 'bool': bool,
-                                                             'set': set, 'frozenset': frozenset}, 'self': self,
-                                            'result': result, 'hasattr': hasattr, 'code_left_layout': code_left_layout,
-                                            'name_all_types': name_all_types, 'code_equally': code_equally,
-                                            'code_right_layout': code_right_layout,  'type_numbers': type_numbers}
-            if layout_self == 'left':
-                exec(code_left_layout, allowed_vars)
-            elif layout_self == 'right':
-                exec(code_right_layout, allowed_vars)
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.key[0]!r} {self.key[1]} {self.key[2].__name__}: {self.fields}>'
+
+    @classmethod
+    def build(cls, symbol: str, layout_self: str, type_other: type) -> 'OperatorKernel':
+        """Build the kernel for the operator symbol, the instance layout and the type of the other operand."""
+        if symbol not in BINARY_OPERATORS:
+            raise ValueError(f"Unknown operator {symbol!r}, the operators are {', '.join(BINARY_OPERATORS)}")
+        key: KernelKey = (symbol, layout_self, type_other)
+        left, right = layout_self == 'left', layout_self == 'right'
+        op: Callable[[Any, Any], Any] = BINARY_OPERATORS.get(symbol)
+        element: Element
+
+        if is_ndarray_type(type_other):
+            return BroadcastKernel(key)
+        if symbol in ('-', '&', '|', '^') and issubclass(type_other, (set, frozenset)):
+            coerce: Callable[[Any], Any] = cls.container_coercer(type_other)
+            if left:
+                def coerced(form, other, modulo):
+                    return op(form, other)
+            elif right:
+                def coerced(form, other, modulo):
+                    return op(other, form)
             else:
-                exec(code_equally, allowed_vars)
-
-        if symbol in ('-', '&', '|', '^') and isinstance(other, (set, frozenset)):
-            repeating_code: CodeTemplate = ('\n\tif hasattr(val, \'__iter__\'): result.append(', ')\n\telse:')
-            same_parameters: Dict[str, CodeTemplate] = dict(segment='', after_expression='')
-            define_layout(templates[0].format(before_expression=repeating_code[0] + f'type(other)(val) {symbol} other'
-                                                                + repeating_code[1], **same_parameters,
-                                              expression=f'type(other)([val]) {symbol} other'),
-                          templates[0].format(before_expression=repeating_code[0] + f'other {symbol} type(other)(val)'
-                                                                + repeating_code[1], **same_parameters,
-                                              expression=f'other {symbol} type(other)([val])'),
-                          templates[1].format(segment='[8:]', before_expression='', after_expression='',
-                                              expression=f' = type(other)(self.__dict__[name]) {symbol} other'))
-        elif symbol in binary_operators:
-            same_parameters: Dict[str, CodeTemplate] = dict(segment='[:3]', before_expression='\n\t',
-                                                            after_expression='')
-            define_layout(templates[0].format(expression=f'int(val) {symbol} other', **same_parameters),
-                          templates[0].format(segment='[:3]', before_expression='\n\ttry: ',
-                                              expression=f'other {symbol} int(val)',
-                                              after_expression='\n\texcept ValueError: result.append(f"{val} < 0")'),
-                          templates[1].format(expression=f'=int(self.__dict__[name]){symbol}other', **same_parameters))
+                def element(val, other, modulo):
+                    return op(type_other(val), other)
+
+                def mutate(val, other):
+                    if type(val) is set and type_other is set:
+                        return lambda: inplace_op(val, other)
+                inplace_op: Callable[[Any, Any], Any] = INPLACE_OPERATORS[symbol]
+                return cls(key, NAME_ALL_TYPES[8:], element, mutate=mutate)
+
+            def element(val, other, modulo):
+                return coerced(coerce(val), other, modulo)
+            # Subclasses of the operand may define their own operators, which could keep or change the conversion.
+            if type_other not in CONTAINER_TYPES:
+                return cls(key, NAME_ALL_TYPES, element)
+            return cls(key, NAME_ALL_TYPES, element, coerce=coerce, coerced=coerced)
+        elif symbol in ('<<', '>>', '&', '|', '^'):
+            if right:
+                def element(val, other, modulo):
+                    try:
+                        return op(other, int(val))
+                    except ValueError:
+                        return f'{val} < 0'
+            else:
+                def element(val, other, modulo):
+                    return op(int(val), other)
+            return cls(key, NAME_ALL_TYPES[:3], element)
         elif symbol == '**':
-            define_layout(templates[0].format(segment='[:4]', before_expression='\n\tif modulo is not None:\n\t\t'
-                                                                                'if type(val) is not complex: ',
-                                              expression='pow(int(val), other, modulo)',
-                                              after_expression='\n\telse: result.append(pow(val, other, modulo))'),
-                          templates[0].format(segment='[:4]', expression='pow(other, int(val), modulo)',
-                                              after_expression='\n\telse: result.append(pow(other, val, modulo))',
-                                              before_expression='\n\tif modulo is not None:\n\t\tif type(val) is not '
-                                                                'complex: '),
-                          templates[1].format(segment='[:4]', before_expression='\n\t', expression=f'{symbol}= other',
-                                              after_expression=''))
-        elif symbol in ('//', '%'):
-            same_parameters: Dict[str, CodeTemplate] = dict(segment='[:3]', before_expression='\n\t',
-                                                            after_expression='')
-            define_layout(templates[0].format(expression=f'val {symbol} other', **same_parameters),
-                          templates[0].format(expression=f'other {symbol} val', **same_parameters),
-                          templates[1].format(expression=f' {symbol}= other', **same_parameters))
-        elif symbol == 'divmod':
-            same_parameters: Dict[str, CodeTemplate] = dict(before_expression='\n\t', after_expression='',
-                                                            segment='[:3]')
-            define_layout(templates[0].format(expression='divmod(val, other)', **same_parameters),
-                          templates[0].format(expression='divmod(other, val)', **same_parameters))
-        elif symbol in ('/', '-'):
-            same_parameters: Dict[str, CodeTemplate] = dict(segment='[:4]', before_expression='\n\t',
-                                                            after_expression='')
-            define_layout(templates[0].format(expression=f'val {symbol} other', **same_parameters),
-                          templates[0].format(expression=f'other {symbol} val', **same_parameters),
-                          templates[1].format(expression=f' {symbol}= other', **same_parameters))
-        elif symbol == '*':
-            same_parameters: Dict[str, CodeTemplate] = dict(before_expression='\n\t', after_expression='')
-            define_layout(templates[0].format(segment='[:4]' if isinstance(other, (complex, float)) else '[:7]',
-                                              expression=f'val {symbol} other', **same_parameters),
-                          templates[0].format(segment='[:4]' if type(other) in type_numbers else '[:2]',
-                                              expression=f'other {symbol} val', **same_parameters),
-                          templates[1].format(segment='[:4]' if isinstance(other, (complex, float)) else '[:7]',
-                                              expression=f' = self.__dict__[name] {symbol} other', **same_parameters))
+            if left:
+                def element(val, other, modulo):
+                    return pow(val, other) if modulo is None else pow(int(val), other, modulo)
+            elif right:
+                def element(val, other, modulo):
+                    return pow(other, val) if modulo is None else pow(other, int(val), modulo)
+            else:
+                # pow() with modulo has no in-place form, the modulo is ignored.
+                def element(val, other, modulo):
+                    return val ** other
+                return cls(key, NAME_ALL_TYPES[:4], element)
+            # A complex number can not be raised to a power by modulo, so it is skipped.
+            return cls(key, NAME_ALL_TYPES[:4], element, NAME_ALL_TYPES[:3])
+        elif symbol in ('//', '%', 'divmod', '/', '-', '*'):
+            if symbol == 'divmod' and not left and not right:
+                return cls(key, (), None)
+            if right:
+                def element(val, other, modulo):
+                    return op(other, val)
+            else:
+                def element(val, other, modulo):
+                    return op(val, other)
+            if symbol in ('/', '-'):
+                return cls(key, NAME_ALL_TYPES[:4], element, plain_operator=op)
+            elif symbol == '*':
+                if not left and not right:
+                    def mutate(val, other):
+                        if type(val) is list and (type(other) is int or type(other) is bool):
+                            return lambda: val.__imul__(other)
+                    return cls(key, NAME_ALL_TYPES[:4] if issubclass(type_other, (complex, float)) else
+                               NAME_ALL_TYPES[:7], element, plain_operator=op, mutate=mutate)
+                if right:
+                    # A string, list or tuple repeated by boolean and integer.
+                    sequence: Element = (lambda val, other, modulo: SequenceView((other,), val)) \
+                        if type_other in SEQUENCE_TYPES else None
+                    return cls(key, NAME_ALL_TYPES[:4] if type_other in NUMBER_TYPES else NAME_ALL_TYPES[:2], element,
+                               plain_operator=op, sequence=sequence)
+                if type_other is int or type_other is bool:
+                    # string, array and tuple_ repeated, the list is copied once instead of other times.
+                    def sequence(val, other, modulo):
+                        if type(val) in SEQUENCE_TYPES:
+                            return SequenceView((list(val) if type(val) is list else val,), other)
+                        return val * other
+                else:
+                    sequence = None
+                return cls(key, NAME_ALL_TYPES[:4] if issubclass(type_other, (complex, float)) else NAME_ALL_TYPES[:7],
+                           element, plain_operator=op, sequence=sequence)
+            return cls(key, NAME_ALL_TYPES[:3], element, plain_operator=op)
         elif symbol == '+':
-            segment_ = '' if isinstance(other, (bool, str)) or hasattr(other, '__iter__') else '[:4]'
-            repeating_code: CodeTemplate = '\n\tif isinstance(other, (bool, str)):result.append({expression_1})\n\t' \
-                                           'elif isinstance(other, type_numbers):result.append({expression_2})\n\t' \
-                                           'elif hasattr(val, "__iter__"):'
-            define_layout(templates[0].format(segment=segment_, expression='type(other)(val) + other',
-                                              before_expression=repeating_code.format(expression_1='type(other)(val)'
-                                                                                                   '+ other',
-                                                                                      expression_2='val + other'),
-                                              after_expression='\n\telse:result.append(type(other)([val]) + other)'),
-                          templates[0].format(segment=segment_, expression='other + type(other)(val)',
-                                              before_expression=repeating_code.format(expression_1='other'
-                                                                                                   '+ type(other)(val)',
-                                                                                      expression_2='other + val'),
-                                              after_expression='\n\telse:result.append(other + type(other)([val]))'),
-                          templates[1].format(before_expression='\n\tif isinstance(other, type_numbers):'
-                                                                'self.__dict__[name] = self.__dict__[name] + other\n\t'
-                                                                'else:\n\t\tif name == "dictionary": continue\n\t\telif'
-                                                                ' isinstance(self.__dict__[name], (set, frozenset)):'
-                                                                '\n\t\t\tself.__dict__[name] = self.__dict__[name]'
-                                                                ' | type(self.__dict__[name])(other)\n\t\t\t',
-                                              expression='=self.__dict__[name] | type(self.__dict__[name])(other)'
-                                                         '\n\t\t\t',
-                                              after_expression='continue\n\t\tself.__dict__[name] = self.__dict__[name]'
-                                                               ' + type(self.__dict__[name])(other)',
-                                              segment='[:4]' if isinstance(other, type_numbers) else '[4:]'))
+            fields: Tuple[str, ...] = NAME_ALL_TYPES if issubclass(type_other, (bool, str)) or \
+                hasattr(type_other, '__iter__') else NAME_ALL_TYPES[:4]
+            if not left and not right:
+                if issubclass(type_other, NUMBER_TYPES):
+                    return cls(key, NAME_ALL_TYPES[:4], lambda val, other, modulo: val + other)
+
+                def element(val, other, modulo):
+                    if isinstance(val, (set, frozenset)):
+                        return val | type(val)(other)
+                    return val + type(val)(other)
+
+                def mutate(val, other):
+                    if type(val) is list:
+                        # A list or a tuple can be iterated again, other iterables are read once, before any change.
+                        items: Iterable = other if type(other) is list or type(other) is tuple else list(other)
+                        return lambda: val.extend(items)
+                    elif type(val) is set:
+                        items = set(other)
+                        return lambda: val.update(items)
+                # The dictionary can not be added to, so it stays as it is.
+                return cls(key, tuple(name for name in NAME_ALL_TYPES[4:] if name != 'dictionary'), element,
+                           mutate=mutate)
+            elif issubclass(type_other, (bool, str)):
+                def coerce(val):
+                    return type_other(val)
+            elif issubclass(type_other, NUMBER_TYPES):
+                if left:
+                    return cls(key, fields, lambda val, other, modulo: val + other, plain_operator=op)
+                return cls(key, fields, lambda val, other, modulo: other + val, plain_operator=op)
+            else:
+                coerce = cls.container_coercer(type_other)
+            if left:
+                def coerced(form, other, modulo):
+                    return form + other
 
-        return tuple(result)
+                def sequence(val, other, modulo):
+                    return SequenceView((coerce(val), other))
+            else:
+                def coerced(form, other, modulo):
+                    return other + form
+
+                def sequence(val, other, modulo):
+                    return SequenceView((other, coerce(val)))
+
+            def element(val, other, modulo):
+                return coerced(coerce(val), other, modulo)
+            # coerce gives a new list or an immutable value, which the views can keep. Subclasses of the operand may
+            # define their own addition, so they get neither a view nor the cached conversions.
+            if type_other not in CONTAINER_TYPES:
+                return cls(key, fields, element, sequence=sequence if type_other in SEQUENCE_TYPES else None)
+            return cls(key, fields, element, sequence=sequence if type_other in SEQUENCE_TYPES else None,
+                       coerce=coerce, coerced=coerced)
+        return cls(key, (), None)
+
+    @classmethod
+    def build_comparison(cls, compare: str, type_other: type) -> 'OperatorKernel':
+        """Build the kernel comparing the fields of an instance with an operand of the type type_other."""
+        key: KernelKey = (compare, 'compare', type_other)
+        op: Callable[[Any, Any], bool] = COMPARISON_OPERATORS[compare]
+        element: Element
+
+        if is_ndarray_type(type_other):
+            return BroadcastKernel(key)
+        if issubclass(type_other, (bool, str)) or type_other not in BUILT_IN_TYPES:
+            def element(val, other, modulo):
+                try:
+                    return op(type_other(val), other)
+                except TypeError:
+                    raise TypeError(f"'{compare}' not supported between instances of '{type_other}' and '{type(val)}'")
+            return cls(key, NAME_ALL_TYPES, element, branch='converted')
+        elif type_other is int or type_other is float:
+            return cls(key, NAME_ALL_TYPES[:3], lambda val, other, modulo: op(type_other(val), other), branch='number')
+        elif type_other is complex and compare in ('==', '!='):
+            return cls(key, NAME_ALL_TYPES[:4], lambda val, other, modulo: op(type_other(val), other), branch='complex')
+        elif type_other is dict and compare in ('==', '!='):
+            return cls(key, ('dictionary',), lambda val, other, modulo: op(val, other), branch='dictionary')
+
+        coerce: Callable[[Any], Any] = cls.container_coercer(type_other)
+
+        def coerced(form, other, modulo):
+            try:
+                return op(form, other)
+            except (TypeError, ValueError):
+                return 'Does not compare!'
+
+        def element(val, other, modulo):
+            try:
+                form: Any = coerce(val)
+            except (TypeError, ValueError):
+                return 'Does not compare!'
+            return coerced(form, other, modulo)
+        if type_other not in CONTAINER_TYPES:
+            return cls(key, NAME_ALL_TYPES, element, branch='container')
+        return cls(key, NAME_ALL_TYPES, element, coerce=coerce, coerced=coerced, branch='container')
+
+
+class BroadcastKernel(OperatorKernel):
+    """Kernel for a NumPy array operand: the operator is broadcast over the array by BaseAllTypes.broadcast."""
+    __slots__ = ()
+
+    def __init__(self, key: KernelKey) -> None:
+        super().__init__(key, (), None, branch='broadcast' if key[1] == 'compare' else None)
+
+    def __call__(self, instance: Any, other: Any, modulo: Numbers = None) -> Tuple[Any]:
+        if self.inplace:
+            raise TypeError('In-place operators can not be broadcast over an array')
+        return instance.broadcast(self.key[0], other, self.key[1], modulo)
+
+    lazy = __call__
+
+
+def is_flat(value: Any) -> bool:
+    """
+    True if the value holds no mutable object, so that deepcopy would make nothing that the value does not already
+    have: a number, string, bytes or None, or a container of them (tuples and frozensets of them may be nested).
+    """
+    type_value: type = type(value)
+    if type_value in ATOMIC_TYPES:
+        return True
+    if type_value is dict:
+        parts: Tuple[Iterable[Any], ...] = (value, value.values())
+    elif type_value in CONTAINER_TYPES:
+        parts = (value,)
+    else:
+        return False
+    for items in parts:
+        # The types are checked at C speed first, the nested tuples and frozensets one by one only if there are some.
+        if not ATOMIC_TYPES.issuperset(map(type, items)) and \
+                not all(type(item) in ATOMIC_TYPES or (type(item) in IMMUTABLE_CONTAINERS and is_flat(item))
+                        for item in items):
+            return False
+    return True
+
+
+def is_ndarray_type(type_other: type) -> bool:
+    """Checks if the type is numpy.ndarray or its subclass, without importing NumPy."""
+    return any(cls.__name__ == 'ndarray' and cls.__module__ == 'numpy' for cls in type_other.__mro__)
+
+
+def check_field_names(names: Iterable[str]) -> Tuple[str, ...]:
+    """Return the names as a tuple, raise ValueError if one of them is not a field name."""
+    names = tuple(names)
+    unknown: List[str] = [name for name in names if name not in NAME_ALL_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(map(repr, unknown))}, the fields are {', '.join(NAME_ALL_TYPES)}")
+    return names
+
+
+class LRUCache:
+    """
+    Bounded mapping that forgets the least recently used entries, with the counters of the caches built on it: hits,
+    misses, evictions and bypasses, the calls that do not use the cache.
+    """
+    __slots__ = ('maxsize', 'hits', 'misses', 'evictions', 'bypasses', '_entries')
+    _missing: object = object()
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be positive, not {maxsize}')
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.bypasses: int = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def _lookup(self, key: Any) -> Any:
+        """The entry of the key, counted as a hit, or LRUCache._missing."""
+        try:
+            entry: Any = self._entries[key]
+        except KeyError:
+            return self._missing
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Any, entry: Any) -> Any:
+        """Remember the entry of the key, counted as a miss. Beyond maxsize the least recently used one is forgotten."""
+        self.misses += 1
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def info(self) -> Dict[str, int]:
+        """Counters of the cache: hits, misses, evictions, bypasses, size and maxsize."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'bypasses': self.bypasses,
+                'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self) -> None:
+        """Forget all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.bypasses = 0
+
+
+class ResultCache(LRUCache):
+    """
+    Bounded LRU cache of operator results, keyed on (version of the instance, kernel, operand, modulo). The version
+    changes on every write of a field and after every in-place operator, so a cached result is never stale. Only
+    operands that are hashable built-in values (numbers, strings, bytes, None, tuples and frozensets of them) are
+    cached, the other ones bypass the cache. Mutable items of a result are copied when it is returned. Instances whose
+    fields are read in the 'direct' mode bypass the cache too: their containers can be mutated without a write. So do
+    the results computed from a field holding mutable items (a list in a list, see is_flat), which the shallow copy
+    of a reading lets change without a write.
+    """
+    __slots__ = ()
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        super().__init__(maxsize)
+
+    @classmethod
+    def operand_key(cls, operand: Any) -> Any:
+        """
+        Key telling apart operands that are equal but give different results (1, 1.0 and True; 0.0 and -0.0), None if
+        the operand can not be cached.
+        """
+        type_operand: type = type(operand)
+        if type_operand is float:
+            return float, operand, copysign(1.0, operand)
+        elif type_operand is complex:
+            return complex, operand, copysign(1.0, operand.real), copysign(1.0, operand.imag)
+        elif type_operand in (bool, int, str, bytes, type(None)):
+            return type_operand, operand
+        elif type_operand is tuple or type_operand is frozenset:
+            keys: List[Any] = [cls.operand_key(item) for item in operand]
+            if None in keys:
+                return None
+            return type_operand, type_operand(keys)
+        return None
+
+    @staticmethod
+    def direct_access(owner: type) -> bool:
+        """True if a field of the owner class is read in the 'direct' mode."""
+        class_mode: str = getattr(owner, '_read_mode', 'copy')
+        key: Tuple[type, str] = (owner, class_mode)
+        if key not in DIRECT_ACCESS:
+            DIRECT_ACCESS[key] = any((getattr(getattr(owner, name, None), 'read_mode', None) or class_mode) == 'direct'
+                                     for name in NAME_ALL_TYPES)
+        return DIRECT_ACCESS[key]
+
+    @staticmethod
+    def _fresh(result: Tuple[Any]) -> Tuple[Any]:
+        """Result with copies of its mutable items, so that the caller can not change the cached one."""
+        if MUTABLE_TYPES.isdisjoint(map(type, result)):
+            return result
+        return tuple([copy(item) if type(item) in MUTABLE_TYPES else item for item in result])
+
+    def call(self, kernel: OperatorKernel, instance: Any, other: Any, modulo: Numbers = None,
+             compute: Callable[[Any, Any, Numbers], Tuple[Any]] = None) -> Tuple[Any]:
+        """
+        Return the cached result of the kernel, compute and remember it if there is none. compute(instance, other,
+        modulo) computes the result instead of the kernel, e.g. through the CoercionCache.
+        """
+        compute = compute or kernel
+        version: int = getattr(instance, '_version', None)
+        other_key: Any = self.operand_key(other)
+        modulo_key: Any = self.operand_key(modulo)
+        if version is None or other_key is None or modulo_key is None or self.direct_access(type(instance)):
+            self.bypasses += 1
+            return compute(instance, other, modulo)
+        key: Tuple[Any, ...] = (version, kernel, other_key, modulo_key)
+        result: Tuple[Any] = self._lookup(key)
+        if result is self._missing:
+            result = compute(instance, other, modulo)
+            # Checked only on a miss: a flat field stays flat until it is written, which changes the version.
+            if not all(map(is_flat, kernel.values(instance, modulo))):
+                self.bypasses += 1
+                return result
+            self._store(key, result)
+        return self._fresh(result)
+
+
+class CoercionCache(LRUCache):
+    """
+    Bounded LRU cache of the fields of instances converted to a container type (set(val), tuple(val), [val], ...),
+    keyed on (version of the instance, conversion, fields). The set algebra (obj - {1}, {2} & obj), the additions of
+    lists and tuples and the container comparisons (obj == (1, 2)) convert every field to the type of the operand
+    first: with the cache an unchanged instance pays the conversion once for each type, whatever the operand and the
+    operator. Every write of a field changes the version, so the stale conversions are never used again and go out of
+    the cache with the least recently used ones. Instances whose fields are read in the 'direct' mode bypass the cache,
+    as in ResultCache. A field that can not be converted is converted again on every call, which raises as without
+    the cache.
+    """
+    __slots__ = ()
+    _failed: object = object()
+
+    def __init__(self, maxsize: int = 256) -> None:
+        super().__init__(maxsize)
+
+    def _convert(self, coerce: Callable[[Any], Any], values: Tuple[Any]) -> Iterator[Any]:
+        for val in values:
+            try:
+                yield coerce(val)
+            except Exception:
+                yield self._failed
+
+    def call(self, kernel: OperatorKernel, instance: Any, other: Any, modulo: Numbers = None) -> Tuple[Any]:
+        """Apply the kernel, which must have coerce, to the cached conversions of the fields of the instance."""
+        version: int = getattr(instance, '_version', None)
+        if version is None or ResultCache.direct_access(type(instance)):
+            self.bypasses += 1
+            return kernel(instance, other, modulo)
+        key: Tuple[Any, ...] = (version, kernel.coerce, kernel.fields)
+        forms: Tuple[Any] = self._lookup(key)
+        if forms is self._missing:
+            forms = self._store(key, tuple(self._convert(kernel.coerce, kernel.values(instance))))
+        coerced: Element = kernel.coerced
+        if self._failed not in forms:
+            return tuple([coerced(form, other, modulo) for form in forms])
+        values: Tuple[Any] = kernel.values(instance)
+        return tuple([kernel.element(val, other, modulo) if form is self._failed else coerced(form, other, modulo)
+                      for val, form in zip(values, forms)])
+
+
+class OperatorRecord:
+    """Measurements of one magic method with one operand type, the latencies in nanoseconds."""
+    __slots__ = ('calls', 'errors', 'total_ns', 'max_ns', 'samples', 'histogram')
+
+    def __init__(self, samples: int) -> None:
+        self.calls: int = 0
+        self.errors: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        # The latest latencies, for the percentiles.
+        self.samples: deque = deque(maxlen=samples)
+        # Number of calls by the bit length of the latency: the key n counts latencies below 2 ** n nanoseconds.
+        self.histogram: Dict[int, int] = {}
+
+    def add(self, elapsed_ns: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.samples.append(elapsed_ns)
+        bucket: int = elapsed_ns.bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def percentile(self, percent: float) -> float:
+        """Latency in microseconds below which percent of the sampled calls are."""
+        if not self.samples:
+            return 0.0
+        ordered: List[int] = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))] / 1000
+
+    def export(self) -> Dict[str, Any]:
+        return {'calls': self.calls, 'errors': self.errors, 'total_us': self.total_ns / 1000,
+                'mean_us': self.total_ns / self.calls / 1000 if self.calls else 0.0,
+                'p50_us': self.percentile(50), 'p90_us': self.percentile(90), 'p99_us': self.percentile(99),
+                'max_us': self.max_ns / 1000,
+                'histogram_us': {f'<{2 ** bucket / 1000:g}': count for bucket, count in sorted(self.histogram.items())}}
+
+
+class OperatorStats:
+    """
+    Measurements of the operators of a class (see BaseAllTypes.enable_stats): for every magic method (of the operator
+    that was run, so obj += {1} counts as __ior__) and operand type
+    the number of calls and of exceptions, the cumulative latency, its percentiles over the latest samples calls and a
+    histogram with power of two buckets; for every comparison the number of times each branch of the comparison kernel
+    was taken ('number', 'complex', 'dictionary', 'converted', 'container' or 'broadcast').
+    """
+    __slots__ = ('samples', '_records', '_branches')
+
+    def __init__(self, samples: int = 10000) -> None:
+        if samples < 1:
+            raise ValueError(f'samples must be positive, not {samples}')
+        self.samples: int = samples
+        self._records: Dict[Tuple[str, type], OperatorRecord] = {}
+        self._branches: Dict[Tuple[str, str], int] = {}
+
+    def measure(self, kernel: OperatorKernel, call: Callable[..., Any], *args: Any) -> Any:
+        """Return call(*args), measured as a call of the magic method of the kernel."""
+        key: Tuple[str, type] = (kernel.dunder, kernel.key[2])
+        record: OperatorRecord = self._records.get(key)
+        if record is None:
+            record = self._records[key] = OperatorRecord(self.samples)
+        if kernel.branch is not None:
+            branch: Tuple[str, str] = (kernel.dunder, kernel.branch)
+            self._branches[branch] = self._branches.get(branch, 0) + 1
+        start: int = perf_counter_ns()
+        try:
+            return call(*args)
+        except Exception:
+            record.errors += 1
+            raise
+        finally:
+            record.add(perf_counter_ns() - start)
+
+    def export(self) -> Dict[str, Any]:
+        """
+        {'operators': {magic method: {operand type name: measurements}}, 'comparison_branches': {magic method:
+        {branch: calls}}}, the latencies in microseconds.
+        """
+        operators: Dict[str, Dict[str, Any]] = {}
+        for (dunder, type_other), record in self._records.items():
+            operators.setdefault(dunder, {})[type_other.__qualname__] = record.export()
+        branches: Dict[str, Dict[str, int]] = {}
+        for (dunder, branch), calls in self._branches.items():
+            branches.setdefault(dunder, {})[branch] = calls
+        return {'operators': operators, 'comparison_branches': branches}
+
+    def reset(self) -> None:
+        self._records.clear()
+        self._branches.clear()
+
+
+class InstancePool:
+    """
+    At most limit instances of a class alive at the same time (see BaseAllTypes.define_max_instance), safe for threads.
+
+    An instance takes a slot when it is created and gives it back when it is released (BaseAllTypes.release) or garbage
+    collected. A released instance is kept and initialized again for the next one, instead of allocating a new object.
+    When all slots are taken, the constructor returns the last created instance, as it always did, while
+    BaseAllTypes.acquire waits for a free slot. CompactAllTypes instances have no weak references, so their slots come
+    back only by release, and the pool holds the last one until it is released.
+    """
+    __slots__ = ('limit', 'allocations', 'reuses', 'shared', 'waits', 'releases', 'reclaims', '_condition', '_live',
+                 '_free', '_dead', '_last')
+
+    def __init__(self, limit: int) -> None:
+        self.limit: int = limit
+        self.allocations: int = 0
+        self.reuses: int = 0
+        self.shared: int = 0
+        self.waits: int = 0
+        self.releases: int = 0
+        self.reclaims: int = 0
+        # Not reentrant: a collection in the middle of a call must not change the pool under it.
+        self._condition: Condition = Condition(Lock())
+        # id of every instance holding a slot: its weak reference, None if it can not have one.
+        self._live: Dict[int, weakref.ref or None] = {}
+        self._free: List[Any] = []
+        # (id, weak reference) of collected instances, the slots are given back under the lock by the next call.
+        self._dead: deque = deque()
+        self._last: weakref.ref or None = None
+
+    def _collected(self, key: int, reference: weakref.ref) -> None:
+        # Called by the garbage collector, maybe in the middle of a call holding the lock, so it does not wait for it.
+        self._dead.append((key, reference))
+        if self._condition.acquire(blocking=False):
+            try:
+                self._reclaim()
+            finally:
+                self._condition.release()
+
+    def _reclaim(self) -> None:
+        while self._dead:
+            key, reference = self._dead.popleft()
+            # The id may already belong to a new instance.
+            if self._live.get(key, False) is reference:
+                del self._live[key]
+                self.reclaims += 1
+                self._condition.notify()
+
+    def _track(self, instance: Any) -> Any:
+        key: int = id(instance)
+        try:
+            reference: weakref.ref or None = weakref.ref(instance, lambda reference: self._collected(key, reference))
+        except TypeError:
+            reference = None
+        self._live[key] = reference
+        self._last = reference if reference is not None else lambda: instance
+        return instance
+
+    def _take(self, cls: type) -> Any:
+        """An instance of cls taking a free slot, None if there is no free slot. Call it holding the lock."""
+        self._reclaim()
+        for index in range(len(self._free) - 1, -1, -1):
+            if type(self._free[index]) is cls:
+                self.reuses += 1
+                return self._track(self._free.pop(index))
+        if len(self._live) + len(self._free) < self.limit:
+            self.allocations += 1
+            return self._track(object.__new__(cls))
+        if self._free:
+            # The free instances are of another class: one of them gives its slot.
+            self._free.pop(0)
+            self.allocations += 1
+            return self._track(object.__new__(cls))
+        return None
+
+    def new(self, cls: type) -> Any:
+        """Instance for cls.__new__: a free slot is taken if there is one, otherwise the last instance is shared."""
+        with self._condition:
+            instance: Any = self._take(cls)
+            if instance is None:
+                instance = self._last() if self._last is not None else None
+                if instance is not None:
+                    self.shared += 1
+            return instance
+
+    def acquire(self, cls: type, timeout: float = None) -> Any:
+        """Instance taking a slot, waiting at most timeout seconds (None - without limit) for a slot to be free."""
+        deadline: float = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            instance: Any = self._take(cls)
+            if instance is None:
+                self.waits += 1
+            while instance is None:
+                remaining: float = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f'No free instance of {cls.__name__} in {timeout} seconds')
+                # Woken by release; slots of collected instances are looked for again every 0.1 second.
+                self._condition.wait(0.1 if remaining is None else min(remaining, 0.1))
+                instance = self._take(cls)
+            return instance
+
+    def release(self, instance: Any) -> None:
+        """
+        Give back the slot of the instance, which must not be used afterwards: it is emptied and kept for reuse, so the
+        next instance starts without the attributes of this one.
+        """
+        with self._condition:
+            if self._live.pop(id(instance), False) is False:
+                raise ValueError(f'{instance!r} does not hold a slot of the pool')
+            self.releases += 1
+            self._clear(instance)
+            if self._last is not None and self._last() is instance:
+                self._last = None
+            self._free.append(instance)
+            self._condition.notify()
+
+    @staticmethod
+    def _clear(instance: Any) -> None:
+        """Delete all attributes of the instance: its __dict__ and every slot of its class and of the bases."""
+        storage: Dict[str, Any] = getattr(instance, '__dict__', None)
+        if storage is not None:
+            storage.clear()
+        for cls in type(instance).__mro__:
+            slots: Any = cls.__dict__.get('__slots__', ())
+            for slot in (slots,) if type(slots) is str else slots:
+                member: Any = cls.__dict__.get(slot)
+                if slot != '__dict__' and slot != '__weakref__' and member is not None:
+                    try:
+                        member.__delete__(instance)
+                    except AttributeError:
+                        pass
+
+    def info(self) -> Dict[str, int]:
+        """Counters of the pool, and the numbers of the instances in use and of the free ones kept for reuse."""
+        with self._condition:
+            self._reclaim()
+            return {'limit': self.limit, 'in_use': len(self._live), 'free': len(self._free),
+                    'allocations': self.allocations, 'reuses': self.reuses, 'shared': self.shared, 'waits': self.waits,
+                    'releases': self.releases, 'reclaims': self.reclaims}
+
+
+class InternReference(weakref.ref):
+    """Weak reference to an interned instance, with what the InternTable keeps for it."""
+    __slots__ = ('key', 'content', 'version', 'entries')
+
+
+class InternTable:
+    """
+    Shared flyweights of AllTypes instances, safe for threads (see BaseAllTypes.intern).
+
+    Instances of the same class with the same content (the values of the fields and their types) are replaced by one
+    canonical instance. The strings, and the tuples and frozensets of hashable built-in values, of the canonical
+    instances are shared too, so instances that differ in one field still share the other ones. Numbers are not shared:
+    an entry of the table is bigger than a number. The table keeps only weak references: when the last canonical
+    instance holding a value is collected, the value is dropped. A canonical instance that is changed (a write of a
+    field or an in-place operator) stops being canonical. CompactAllTypes instances have no weak references and can not
+    be interned.
+    """
+    __slots__ = ('hits', 'misses', 'shared', '_lock', '_instances', '_values', '_holders', '_dead')
+    SHARED_TYPES: FrozenSet[type] = frozenset((str, tuple, frozenset))
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.shared: int = 0
+        self._lock: Lock = Lock()
+        # Hash of the content: the canonical instance. Of two contents with the same hash the last one is kept.
+        self._instances: Dict[int, InternReference] = {}
+        # Key of a value (ResultCache.operand_key): [the shared value, number of instances holding it, the key].
+        self._values: Dict[Any, List[Any]] = {}
+        # id of every interned instance: its weak reference.
+        self._holders: Dict[int, InternReference] = {}
+        # Weak references of collected instances, dropped under the lock by the next call (as in InstancePool).
+        self._dead: deque = deque()
+
+    @classmethod
+    def content_key(cls, value: Any) -> Any:
+        """Key of a value of a field, the containers included (see ResultCache.operand_key), None if there is none."""
+        type_value: type = type(value)
+        if type_value is list or type_value is tuple:
+            keys: List[Any] = [cls.content_key(item) for item in value]
+            return None if None in keys else (type_value, tuple(keys))
+        elif type_value is set or type_value is frozenset:
+            keys = [cls.content_key(item) for item in value]
+            return None if None in keys else (type_value, frozenset(keys))
+        elif type_value is dict:
+            # The order of the items is kept: it is seen by the iteration.
+            keys = [(cls.content_key(key), cls.content_key(item)) for key, item in value.items()]
+            return None if any(None in pair for pair in keys) else (dict, tuple(keys))
+        return ResultCache.operand_key(value)
+
+    @classmethod
+    def _content(cls, instance: Any, fields: List[OnlySelfType]) -> Tuple[Any, ...] or None:
+        keys: List[Any] = [cls.content_key(field.raw(instance)) for field in fields]
+        return None if None in keys else (type(instance), tuple(keys))
+
+    def _collected(self, reference: InternReference) -> None:
+        self._dead.append(reference)
+        if self._lock.acquire(blocking=False):
+            try:
+                self._reclaim()
+            finally:
+                self._lock.release()
+
+    def _reclaim(self) -> None:
+        while self._dead:
+            reference: InternReference = self._dead.popleft()
+            # The id may already belong to a new instance.
+            if self._holders.get(reference.key) is reference:
+                self._drop(reference)
+
+    def _drop(self, reference: InternReference) -> None:
+        """Forget the interned instance and give back its values. Call it holding the lock."""
+        del self._holders[reference.key]
+        if self._instances.get(reference.content) is reference:
+            del self._instances[reference.content]
+        for entry in reference.entries:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._values[entry[2]]
+
+    def intern(self, instance: Any) -> Any:
+        """
+        Return the canonical instance with the content of the instance. If there is none, the values of the instance
+        are replaced by the shared equal ones and the instance becomes canonical.
+        """
+        owner: type = type(instance)
+        try:
+            reference: InternReference = InternReference(instance, self._collected)
+        except TypeError:
+            raise TypeError(f'{owner.__name__} instances have no weak references and can not be interned') from None
+        fields: List[OnlySelfType] = [getattr(owner, name) for name in NAME_ALL_TYPES]
+        content: Tuple[Any, ...] or None = self._content(instance, fields)
+        reference.key = id(instance)
+        reference.content = None if content is None else hash(content)
+        reference.version = getattr(instance, '_version', None)
+        with self._lock:
+            self._reclaim()
+            if content is not None:
+                previous: InternReference = self._instances.get(reference.content)
+                canonical: Any = previous() if previous is not None else None
+                if canonical is not None and getattr(canonical, '_version', None) == previous.version and \
+                        self._content(canonical, fields) == content:
+                    self.hits += 1
+                    return canonical
+            self.misses += 1
+            if reference.key in self._holders:
+                # Interned before and changed since.
+                self._drop(self._holders[reference.key])
+            entries: List[List[Any]] = []
+            for field in fields:
+                value: Any = field.raw(instance)
+                # Only hashable values are shared: a tuple may hold a list.
+                value_key: Any = ResultCache.operand_key(value) if type(value) in self.SHARED_TYPES else None
+                if value_key is None:
+                    continue
+                entry: List[Any] = self._values.get(value_key)
+                if entry is None:
+                    entry = self._values[value_key] = [value, 0, value_key]
+                elif entry[0] is not value:
+                    field.replace(instance, entry[0])
+                    self.shared += 1
+                entry[1] += 1
+                entries.append(entry)
+            reference.entries = tuple(entries)
+            self._holders[reference.key] = reference
+            if content is not None:
+                self._instances[reference.content] = reference
+            return instance
+
+    def info(self) -> Dict[str, int]:
+        """Counters of the table: hits, misses, values shared and the numbers of canonical instances and of values."""
+        with self._lock:
+            self._reclaim()
+            return {'instances': len(self._instances), 'values': len(self._values), 'hits': self.hits,
+                    'misses': self.misses, 'shared': self.shared}
+
+
+def apply_kernel(key: KernelKey, operand: Any, modulo: Numbers, rows: List[Tuple[Any]]) -> List[Tuple[Any]]:
+    """Results of the kernel of key for rows of field values (see BaseAllTypes.parallel_map), run by the workers."""
+    element: Element = AllTypesOperators._operator_kernel(*key).element
+    return [tuple([element(val, operand, modulo) for val in row]) for row in rows]
+
+
+class RecordCodec:
+    """
+    Compact binary encoding of the ten field values of a record (see BaseAllTypes.to_bytes), little-endian:
+      header - flags (unsigned char: the format version in the high four bits, BIG_INTEGER if integer does not fit
+               in 8 bytes), boolean (1 byte), integer (signed 8 bytes, 0 if it does not fit), float_num (double),
+               complex_num (two doubles);
+      string - length in bytes (unsigned 4 bytes) and UTF-8;
+      array, tuple_, set_, frozenset_ - number of items (unsigned 4 bytes) and the items; when all items are ints of 8
+               bytes, the PACKED bit of the number is set and the items follow as an array of signed 8 bytes;
+      dictionary - number of items and the key and the value of every item;
+      and the integer, if it did not fit, as its length and signed bytes.
+    An item is a tag byte followed by its value, in the same way: b'N' None, b'T' True, b'F' False, b'i' an int of 8
+    bytes, b'I' a bigger int, b'f' float, b'c' complex, b's' str, b'b' bytes, b'l' list, b't' tuple, b'd' dict, b'e'
+    set and b'z' frozenset. Decoding reads a memoryview, the numbers are unpacked and strings decoded in place.
+    """
+    VERSION: int = 1
+    BIG_INTEGER: int = 1
+    PACKED: int = 1 << 31
+    HEAD: struct.Struct = struct.Struct('<B?qddd')
+    SIZE: struct.Struct = struct.Struct('<I')
+    INT: struct.Struct = struct.Struct('<q')
+    FLOAT: struct.Struct = struct.Struct('<d')
+    COMPLEX: struct.Struct = struct.Struct('<dd')
+    CONTAINERS: Dict[type, bytes] = {list: b'l', tuple: b't', set: b'e', frozenset: b'z'}
+    TAG_TYPES: Dict[int, type] = {ord(tag): type_ for type_, tag in CONTAINERS.items()}
+
+    @classmethod
+    def _encode_int(cls, out: bytearray, value: int) -> None:
+        data: bytes = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+        out += cls.SIZE.pack(len(data))
+        out += data
+
+    @classmethod
+    def _encode_str(cls, out: bytearray, value: str) -> None:
+        data: bytes = value.encode('utf-8', 'surrogatepass')
+        out += cls.SIZE.pack(len(data))
+        out += data
+
+    @classmethod
+    def _encode_items(cls, out: bytearray, items: Iterable[Any], size: int) -> None:
+        if size > 1 and all([type(item) is int for item in items]):
+            try:
+                packed: bytes = struct.pack(f'<{size}q', *items)
+            except struct.error:
+                pass
+            else:
+                out += cls.SIZE.pack(size | cls.PACKED)
+                out += packed
+                return
+        out += cls.SIZE.pack(size)
+        for item in items:
+            cls.encode_value(out, item)
+
+    @classmethod
+    def encode_value(cls, out: bytearray, value: Any) -> None:
+        """Append the tagged value to out, TypeError for a value that is not of a built-in type."""
+        type_value: type = type(value)
+        if type_value is bool:
+            out += b'T' if value else b'F'
+        elif type_value is int:
+            if -2 ** 63 <= value < 2 ** 63:
+                out += b'i'
+                out += cls.INT.pack(value)
+            else:
+                out += b'I'
+                cls._encode_int(out, value)
+        elif type_value is float:
+            out += b'f'
+            out += cls.FLOAT.pack(value)
+        elif type_value is str:
+            out += b's'
+            cls._encode_str(out, value)
+        elif type_value in cls.CONTAINERS:
+            out += cls.CONTAINERS[type_value]
+            cls._encode_items(out, value, len(value))
+        elif type_value is dict:
+            out += b'd'
+            out += cls.SIZE.pack(len(value))
+            for key, item in value.items():
+                cls.encode_value(out, key)
+                cls.encode_value(out, item)
+        elif value is None:
+            out += b'N'
+        elif type_value is complex:
+            out += b'c'
+            out += cls.COMPLEX.pack(value.real, value.imag)
+        elif type_value is bytes:
+            out += b'b'
+            out += cls.SIZE.pack(len(value))
+            out += value
+        else:
+            # Subclasses of the built-in types are encoded as their base type.
+            for base in (bool, int, float, complex, str, bytes, list, tuple, dict, set, frozenset):
+                if isinstance(value, base):
+                    return cls.encode_value(out, base(value))
+            raise TypeError(f"'{type_value.__name__}' object can not be encoded")
+
+    @classmethod
+    def decode_value(cls, view: memoryview, offset: int) -> Tuple[Any, int]:
+        """Decode the tagged value at offset, return it and the offset after it."""
+        return cls.decode_body(view[offset], view, offset + 1)
+
+    @classmethod
+    def decode_body(cls, tag: int, view: memoryview, offset: int) -> Tuple[Any, int]:
+        """Decode the value of the tag that starts at offset, return it and the offset after it."""
+        if tag == 105:  # b'i'
+            return cls.INT.unpack_from(view, offset)[0], offset + 8
+        elif tag == 115:  # b's'
+            size: int = cls.SIZE.unpack_from(view, offset)[0]
+            offset += 4
+            return str(view[offset:offset + size], 'utf-8', 'surrogatepass'), offset + size
+        elif tag == 102:  # b'f'
+            return cls.FLOAT.unpack_from(view, offset)[0], offset + 8
+        elif tag in cls.TAG_TYPES:
+            size = cls.SIZE.unpack_from(view, offset)[0]
+            offset += 4
+            if size & cls.PACKED:
+                size &= ~cls.PACKED
+                packed: Tuple[int] = struct.unpack_from(f'<{size}q', view, offset)
+                return (packed if tag == 116 else cls.TAG_TYPES[tag](packed)), offset + 8 * size
+            items: List[Any] = []
+            for _ in range(size):
+                item, offset = cls.decode_value(view, offset)
+                items.append(item)
+            return (items if tag == 108 else cls.TAG_TYPES[tag](items)), offset
+        elif tag == 100:  # b'd'
+            size = cls.SIZE.unpack_from(view, offset)[0]
+            offset += 4
+            dictionary: Dict[Any, Any] = {}
+            for _ in range(size):
+                key, offset = cls.decode_value(view, offset)
+                dictionary[key], offset = cls.decode_value(view, offset)
+            return dictionary, offset
+        elif tag == 84 or tag == 70:  # b'T', b'F'
+            return tag == 84, offset
+        elif tag == 78:  # b'N'
+            return None, offset
+        elif tag == 99:  # b'c'
+            real, imag = cls.COMPLEX.unpack_from(view, offset)
+            return complex(real, imag), offset + 16
+        elif tag == 73:  # b'I'
+            size = cls.SIZE.unpack_from(view, offset)[0]
+            offset += 4
+            return int.from_bytes(view[offset:offset + size], 'little', signed=True), offset + size
+        elif tag == 98:  # b'b'
+            size = cls.SIZE.unpack_from(view, offset)[0]
+            offset += 4
+            return view[offset:offset + size].tobytes(), offset + size
+        raise ValueError(f'Unknown tag {tag!r} at offset {offset - 1}')
+
+    @classmethod
+    def encode_record(cls, values: Sequence) -> bytearray:
+        """Encoding of the ten field values, in the order of NAME_ALL_TYPES."""
+        boolean, integer, float_num, complex_num, string, array_, tuple_, dictionary, set_, frozenset_ = values
+        big: bool = not -2 ** 63 <= integer < 2 ** 63
+        out: bytearray = bytearray(cls.HEAD.pack(cls.VERSION << 4 | (cls.BIG_INTEGER if big else 0), boolean,
+                                                 0 if big else integer, float_num, complex_num.real, complex_num.imag))
+        cls._encode_str(out, string)
+        cls._encode_items(out, array_, len(array_))
+        cls._encode_items(out, tuple_, len(tuple_))
+        out += cls.SIZE.pack(len(dictionary))
+        for key, item in dictionary.items():
+            cls.encode_value(out, key)
+            cls.encode_value(out, item)
+        cls._encode_items(out, set_, len(set_))
+        cls._encode_items(out, frozenset_, len(frozenset_))
+        if big:
+            cls._encode_int(out, integer)
+        return out
+
+    @classmethod
+    def decode_record(cls, view: memoryview, offset: int = 0) -> Tuple[List[Any], int]:
+        """
+        Decode the record at offset, return the ten field values and the offset after the record. ValueError if the
+        record is truncated or malformed.
+        """
+        try:
+            values, end = cls._decode_record(view, offset)
+        except (struct.error, IndexError, TypeError, OverflowError, UnicodeDecodeError, RecursionError) as error:
+            raise ValueError(f'Truncated or malformed record at offset {offset}: {error}') from error
+        if end > len(view):
+            # The slices of strings, bytes and big integers do not check the end of the data.
+            raise ValueError(f'Truncated record at offset {offset}: it needs {end - offset} bytes, '
+                             f'{len(view) - offset} are left')
+        return values, end
+
+    @classmethod
+    def _decode_record(cls, view: memoryview, offset: int) -> Tuple[List[Any], int]:
+        flags, boolean, integer, float_num, real, imag = cls.HEAD.unpack_from(view, offset)
+        if flags >> 4 != cls.VERSION:
+            raise ValueError(f'Unsupported format version {flags >> 4}')
+        offset += cls.HEAD.size
+        values: List[Any] = [boolean, integer, float_num, complex(real, imag)]
+        size: int = cls.SIZE.unpack_from(view, offset)[0]
+        offset += 4
+        values.append(str(view[offset:offset + size], 'utf-8', 'surrogatepass'))
+        offset += size
+        # array, tuple_, dictionary, set_ and frozenset_ are not tagged, their types are known.
+        for tag in b'ltdez':
+            value, offset = cls.decode_body(tag, view, offset)
+            values.append(value)
+        if flags & cls.BIG_INTEGER:
+            size = cls.SIZE.unpack_from(view, offset)[0]
+            offset += 4
+            values[1] = int.from_bytes(view[offset:offset + size], 'little', signed=True)
+            offset += size
+        return values, offset
+
+
+class AllTypesOperators(object):
+    """
+    Operator methods of AllTypes. They only delegate to _comparison and _arithmetic, which the subclasses
+    implement, so that other containers can share exactly the same operator surface.
+    """
+    __slots__ = ()
+
+    # NumPy gives the operators with an array to the reflected methods of the instance instead of looping over it.
+    __array_ufunc__ = None
+    _kernels: Dict[KernelKey, OperatorKernel] = {}
+
+    @classmethod
+    def kernel_cache(cls) -> Dict[KernelKey, OperatorKernel]:
+        """Return a copy of the cache of operator kernels built so far."""
+        return dict(cls._kernels)
+
+    @classmethod
+    def clear_kernel_cache(cls) -> None:
+        """Drop all built operator kernels, they will be built again on the next operator call."""
+        cls._kernels.clear()
+
+    @classmethod
+    def _comparison_kernel(cls, compare: Literal, type_other: type) -> OperatorKernel:
+        """Return the cached kernel of the comparison, build it on the first call."""
+        key: KernelKey = (compare, 'compare', type_other)
+        try:
+            return cls._kernels[key]
+        except KeyError:
+            if compare not in COMPARISON_OPERATORS:
+                raise NameError("Сompare must be literal!")
+            kernel: OperatorKernel = OperatorKernel.build_comparison(compare, type_other)
+            cls._kernels[key] = kernel
+            return kernel
+
+    @classmethod
+    def _arithmetic_kernel(cls, symbol: Literal, layout_self: str, type_other: type) -> OperatorKernel:
+        """Return the cached kernel of the arithmetic operator, build it on the first call."""
+        if layout_self != 'left' and layout_self != 'right':
+            layout_self = 'equally'
+        key: KernelKey = (symbol, layout_self, type_other)
+        try:
+            return cls._kernels[key]
+        except KeyError:
+            kernel: OperatorKernel = OperatorKernel.build(*key)
+            cls._kernels[key] = kernel
+            return kernel
+
+    @classmethod
+    def _operator_kernel(cls, symbol: Literal, layout_self: str, type_other: type) -> OperatorKernel:
+        """Kernel of a comparison or of an arithmetic operator, by its symbol."""
+        if symbol in COMPARISON_OPERATORS:
+            return cls._comparison_kernel(symbol, type_other)
+        return cls._arithmetic_kernel(symbol, layout_self, type_other)
 
     def __eq__(self, other: Any) -> Tuple[bool]:
         return self._comparison(other)
@@ -511,29 +1700,6 @@ class AllTypes(object):
 
     # =====================================================================
 
-    def __pos__(self) -> Tuple[Numbers]:
-        return +self.boolean, +self.integer, +self.float_num, +self.complex_num
-
-    def __neg__(self) -> Tuple[Numbers]:
-        return -self.boolean, -self.integer, -self.float_num, -self.complex_num
-
-    def __abs__(self) -> Tuple[int, float, complex]:
-        return abs(self.integer), abs(self.float_num), abs(self.complex_num)
-
-    def __round__(self, n: int = None) -> float:
-        return round(self.float_num, n)
-
-    def __floor__(self) -> float:
-        return self.floor(self.float_num)
-
-    def __ceil__(self) -> float:
-        return self.ceil(self.float_num)
-
-    def __trunc__(self) -> float:
-        return self.trunc(self.float_num)
-
-    # =====================================================================
-
     def __add__(self, other: BuiltInTypes) -> Tuple[BuiltInTypes]:
         if type(other) is set or type(other) is frozenset:
             return self._arithmetic(other, '|')
@@ -603,210 +1769,1701 @@ class AllTypes(object):
     def __rpow__(self, power: Numbers, modulo: Numbers = None) -> Tuple[Numbers]:
         return self._arithmetic(power, '**', 'right', modulo)
 
-    def __rlshift__(self, other: int) -> Tuple[int]:
-        return self._arithmetic(other, '<<', 'right')
+    def __rlshift__(self, other: int) -> Tuple[int]:
+        return self._arithmetic(other, '<<', 'right')
+
+    def __rrshift__(self, other: int) -> Tuple[int]:
+        return self._arithmetic(other, '>>', 'right')
+
+    def __rand__(self, other: NumWithoutComplexOrSet) -> Tuple[int] or Tuple[set or frozenset]:
+        return self._arithmetic(other, '&', 'right')
+
+    def __ror__(self, other: NumWithoutComplexOrSet) -> Tuple[int] or Tuple[set or frozenset]:
+        return self._arithmetic(other, '|', 'right')
+
+    def __rxor__(self, other: NumWithoutComplexOrSet) -> Tuple[int] or Tuple[set or frozenset]:
+        return self._arithmetic(other, '^', 'right')
+
+    # ---------------------------------------------------------------------
+
+    def __iadd__(self, other: NumOrSet) -> ClassInstance:
+        if type(other) is set or type(other) is frozenset:
+            self._arithmetic(other, '|', 'equally')
+            return self
+        self._arithmetic(other, '+', 'equally')
+        return self
+
+    def __isub__(self, other: NumOrSet) -> ClassInstance:
+        self._arithmetic(other, '-', 'equally')
+        return self
+
+    def __imul__(self, other: Numbers) -> ClassInstance:
+        self._arithmetic(other, '*', 'equally')
+        return self
+
+    def __itruediv__(self, other: Numbers) -> ClassInstance:
+        self._arithmetic(other, '/', 'equally')
+        return self
+
+    def __ifloordiv__(self, other: bool or int or float) -> ClassInstance:
+        self._arithmetic(other, '//', 'equally')
+        return self
+
+    def __imod__(self, other: bool or int or float) -> ClassInstance:
+        self._arithmetic(other, '%', 'equally')
+        return self
+
+    def __ipow__(self, power: Numbers, modulo: Numbers = None) -> ClassInstance:
+        self._arithmetic(power, '**', 'equally', modulo)
+        return self
+
+    def __ilshift__(self, other: int) -> ClassInstance:
+        self._arithmetic(other, '<<', 'equally')
+        return self
+
+    def __irshift__(self, other: int) -> ClassInstance:
+        self._arithmetic(other, '>>', 'equally')
+        return self
+
+    def __iand__(self, other: int or set or frozenset) -> ClassInstance:
+        self._arithmetic(other, '&', 'equally')
+        return self
+
+    def __ior__(self, other: int or set or frozenset) -> ClassInstance:
+        self._arithmetic(other, '|', 'equally')
+        return self
+
+    def __ixor__(self, other: int or set or frozenset) -> ClassInstance:
+        self._arithmetic(other, '^', 'equally')
+        return self
+
+
+class BaseAllTypes(AllTypesOperators):
+    """Operators and protocols of AllTypes. The subclasses declare the ten fields and how they are stored."""
+    __slots__ = ()
+
+    from math import floor, ceil, trunc
+    from copy import deepcopy
+
+    _max_val_is_changed: bool = False
+    _max_quantity_instance: int = -1
+    _pool: InstancePool = None
+    _read_mode: str = 'copy'
+    _result_mode: str = 'eager'
+    _result_cache: ResultCache = None
+    _coercion_cache: CoercionCache = None
+    _stats: OperatorStats = None
+    # One table for all the classes, the content key of an instance holds its class.
+    _intern_table: InternTable = InternTable()
+    result_modes: Tuple[str, ...] = ('eager', 'lazy', 'view')
+
+    @classmethod
+    def set_read_mode(cls, read_mode: str) -> None:
+        """Set how the fields of the class instances are read: 'copy', 'direct' or 'view' (see OnlySelfType)."""
+        if read_mode not in OnlySelfType.read_modes:
+            raise ValueError(f'read_mode must be one of {OnlySelfType.read_modes}, not {read_mode!r}')
+        cls._read_mode = read_mode
+
+    @classmethod
+    def enable_result_cache(cls, maxsize: int = 1024) -> None:
+        """Cache the results of the operators of the class instances, at most maxsize results (see ResultCache)."""
+        cls._result_cache = ResultCache(maxsize)
+
+    @classmethod
+    def disable_result_cache(cls) -> None:
+        """Stop caching the results of the operators of the class instances."""
+        cls._result_cache = None
+
+    @classmethod
+    def result_cache_info(cls) -> Dict[str, int]:
+        """Counters of the result cache of the class, an empty dictionary if the cache is disabled."""
+        return {} if cls._result_cache is None else cls._result_cache.info()
+
+    @classmethod
+    def enable_coercion_cache(cls, maxsize: int = 256) -> None:
+        """
+        Keep the fields of the class instances converted to lists, tuples, sets and frozensets for the next operators,
+        at most maxsize conversions of ten fields (see CoercionCache).
+        """
+        cls._coercion_cache = CoercionCache(maxsize)
+
+    @classmethod
+    def disable_coercion_cache(cls) -> None:
+        """Stop keeping the conversions of the fields, the kept ones are dropped."""
+        cls._coercion_cache = None
+
+    @classmethod
+    def coercion_cache_info(cls) -> Dict[str, int]:
+        """Counters of the coercion cache of the class, an empty dictionary if the cache is disabled."""
+        return {} if cls._coercion_cache is None else cls._coercion_cache.info()
+
+    @classmethod
+    def enable_stats(cls, samples: int = 10000) -> None:
+        """Measure the operators of the class instances, the percentiles use the latest samples calls."""
+        cls._stats = OperatorStats(samples)
+
+    @classmethod
+    def disable_stats(cls) -> None:
+        """Stop measuring the operators, the measurements are dropped."""
+        cls._stats = None
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Measurements of the operators of the class (see OperatorStats.export), empty if they are not enabled."""
+        return {} if cls._stats is None else cls._stats.export()
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Drop the measurements made so far, the measuring goes on."""
+        if cls._stats is not None:
+            cls._stats.reset()
+
+    @classmethod
+    def set_result_mode(cls, result_mode: str) -> None:
+        """
+        Set what the operators of the class instances return: 'eager' - a tuple, computed at once, 'lazy' - a
+        LazyResult, whose items are computed on the first access, or 'view' - a tuple in which the strings, lists and
+        tuples made by '+' and '*' are SequenceView, not built.
+        """
+        if result_mode not in cls.result_modes:
+            raise ValueError(f'result_mode must be one of {cls.result_modes}, not {result_mode!r}')
+        cls._result_mode = result_mode
+
+    @classmethod
+    def define_max_instance(cls, max_instance: int, *args: BuiltInTypes, **kwargs: BuiltInTypes) -> ClassInstance:
+        """Define max quantity instance from class."""
+        if cls._max_val_is_changed:
+            return 'The maximum number of class instances has already been changed.'
+        else:
+            cls._max_val_is_changed = True
+            cls._max_quantity_instance: int = int(max_instance)
+            # A negative maximum does not limit anything.
+            if cls._max_quantity_instance >= 0:
+                cls._pool = InstancePool(cls._max_quantity_instance)
+            return cls(*args, **kwargs)
+
+    def __new__(cls, *args: BuiltInTypes, **kwargs: BuiltInTypes) -> ClassInstance:
+        if cls._pool is None:
+            return super().__new__(cls)
+        return cls._pool.new(cls)
+
+    @classmethod
+    def acquire(cls, *args: BuiltInTypes, timeout: float = None, **kwargs: BuiltInTypes) -> ClassInstance:
+        """
+        Create an instance like the constructor, but when the maximum number of instances is reached, wait for one
+        to be released or collected instead of returning the last instance (TimeoutError after timeout seconds).
+        """
+        if cls._pool is None:
+            return cls(*args, **kwargs)
+        instance: ClassInstance = cls._pool.acquire(cls, timeout)
+        instance.__init__(*args, **kwargs)
+        return instance
+
+    @classmethod
+    def release(cls, instance: ClassInstance) -> None:
+        """Give the slot of the instance back to the pool, the instance must not be used afterwards."""
+        if cls._pool is None:
+            raise ValueError(f'{cls.__name__} has no maximum number of instances')
+        cls._pool.release(instance)
+
+    @classmethod
+    def pool_info(cls) -> Dict[str, int]:
+        """Counters of the instance pool (see InstancePool.info), empty if the number of instances is not limited."""
+        return {} if cls._pool is None else cls._pool.info()
+
+    @classmethod
+    def intern(cls, instance: ClassInstance) -> ClassInstance:
+        """
+        Return the shared instance with the same content as the instance, which is returned itself if there is none
+        (see InternTable). The shared instance must not be changed: make a copy to change it.
+        """
+        return cls._intern_table.intern(instance)
+
+    @classmethod
+    def interned(cls, *args: BuiltInTypes, **kwargs: BuiltInTypes) -> ClassInstance:
+        """Create an instance like the constructor and return it interned (see BaseAllTypes.intern)."""
+        return cls._intern_table.intern(cls(*args, **kwargs))
+
+    @classmethod
+    def intern_info(cls) -> Dict[str, int]:
+        """Counters of the intern table (see InternTable.info), shared by all the classes."""
+        return cls._intern_table.info()
+
+    def __init__(self, boolean: bool = bool(), integer: int = int(), float_num: float = float(),
+                 complex_num: complex = complex(), string: AnyStr = str(), array: List[Any] = [],
+                 tuple_: Tuple[Any] = tuple(), dictionary: Dict[Any, Any] = dict(), set_: Set[Any] = set(),
+                 frozenset_: FrozenSet[Any] = frozenset()) -> None:
+        self.boolean = boolean
+        self.integer = integer
+        self.float_num = float_num
+        self.complex_num = complex_num
+        self.string = string
+        self.array = array
+        self.tuple_ = tuple_
+        self.dictionary = dictionary
+        self.set_ = set_
+        self.frozenset_ = frozenset_
+
+    # Two "all_types" are created so that if the user changes the public "all_types" there are no bugs.
+    @property
+    def all_types(self) -> Tuple[BuiltInTypes]:
+        return (self.boolean, self.integer, self.float_num, self.complex_num, self.string, self.array, self.tuple_,
+                self.dictionary, self.set_, self.frozenset_)
+
+    @property
+    def _all_types(self) -> Tuple[BuiltInTypes]:
+        return (self.boolean, self.integer, self.float_num, self.complex_num, self.string, self.array, self.tuple_,
+                self.dictionary, self.set_, self.frozenset_)
+
+    def _comparison(self, other: Any, compare: Literal = '==') -> Tuple[bool]:
+        kernel: OperatorKernel = self._comparison_kernel(compare, type(other))
+        if self._stats is not None:
+            return self._stats.measure(kernel, self._run_kernel, kernel, other, None)
+        return self._run_kernel(kernel, other, None)
+
+    def _arithmetic(self, other: Any, symbol: Literal = '+', layout_self: str = 'left',
+                    modulo: Numbers = None) -> Tuple[Any]:
+        kernel: OperatorKernel = self._arithmetic_kernel(symbol, layout_self, type(other))
+        if self._stats is not None:
+            return self._stats.measure(kernel, self._run_kernel, kernel, other, modulo)
+        return self._run_kernel(kernel, other, modulo)
+
+    def _run_kernel(self, kernel: OperatorKernel, other: Any, modulo: Numbers) -> Tuple[Any]:
+        """
+        Apply the kernel to the instance in the result mode of the class, through the result cache and the coercion
+        cache if they are on.
+        """
+        if kernel.inplace:
+            try:
+                return kernel(self, other, modulo)
+            finally:
+                self._version = next(WRITE_STAMPS)
+        elif self._result_mode == 'lazy':
+            return kernel.lazy(self, other, modulo)
+        elif self._result_mode == 'view':
+            return kernel.view(self, other, modulo)
+        elif self._coercion_cache is not None and kernel.coerce is not None:
+            if self._result_cache is not None:
+                return self._result_cache.call(kernel, self, other, modulo, partial(self._coercion_cache.call, kernel))
+            return self._coercion_cache.call(kernel, self, other, modulo)
+        elif self._result_cache is not None:
+            return self._result_cache.call(kernel, self, other, modulo)
+        return kernel(self, other, modulo)
+
+    def broadcast(self, symbol: Literal, operands: Any, layout_self: str = 'left',
+                  modulo: Numbers = None) -> Tuple[Any]:
+        """
+        Apply the operator symbol ('+', '*', 'divmod', '**', '>=', ...) to the instance and every number of the NumPy
+        array operands at once, the instance is on the layout_self side of the operator. Returns one array per field
+        that the operator computes, its item i is the result for operands[i]; divmod gives a pair of arrays per field.
+        obj + array, array * obj, obj >= array and so on call this method.
+
+        The numbers fields are computed by NumPy ufuncs with the rules of the scalar operators: bool operands are added
+        as int, division by zero and negative shift counts raise as in Python. Integer lanes are computed in the
+        integer type of the array, so they overflow as NumPy does. '**', '<<' and the fields that are not numbers are
+        computed exactly, by the scalar kernel for every item, into arrays of objects.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('AllTypes.broadcast needs NumPy, install it with "pip install numpy"') from None
+
+        operands = numpy.asarray(operands)
+        type_other: type = {'b': bool, 'i': int, 'u': int, 'f': float, 'c': complex}.get(operands.dtype.kind)
+        if type_other is None:
+            raise TypeError(f'Only arrays of numbers can be broadcast, not of {operands.dtype}')
+        # Python numbers do not fit narrower NumPy types, and uint64 does not fit int64: its items go one by one.
+        operands = operands.astype({'b': bool, 'i': numpy.int64, 'f': numpy.float64, 'c': numpy.complex128,
+                                    'u': numpy.int64 if operands.dtype.itemsize < 8 else object}[operands.dtype.kind])
+        kernel: OperatorKernel = self._operator_kernel(symbol, layout_self, type_other)
+        if kernel.inplace:
+            raise TypeError('In-place operators can not be broadcast over an array')
+        return tuple(self._broadcast_field(numpy, kernel, getattr(self, name), operands, modulo)
+                     for name in (kernel.fields if modulo is None else kernel.modulo_fields))
+
+    @staticmethod
+    def _broadcast_field(numpy: Any, kernel: OperatorKernel, val: Any, operands: Any, modulo: Numbers) -> Any:
+        """Result of the kernel for one field value and all operands."""
+        symbol, layout_self = kernel.key[0], kernel.key[1]
+        element: Element = kernel.element
+        complex_lane: bool = isinstance(val, complex) or operands.dtype.kind == 'c'
+        if layout_self == 'compare':
+            # Complex numbers are not ordered, the scalar kernel answers 'Does not compare!' for them.
+            exact: bool = complex_lane and symbol not in ('==', '!=')
+        else:
+            exact = symbol in ('**', '<<') or symbol == '/' and complex_lane or not isinstance(val, NUMBER_TYPES)
+        if exact or operands.dtype == object or isinstance(val, int) and not -2 ** 63 <= val < 2 ** 63:
+            # frompyfunc gives every operand as a Python number to the scalar element.
+            return numpy.frompyfunc(lambda other: element(val, other, modulo), 1, 1)(operands)
+        if layout_self != 'compare':
+            if operands.dtype.kind == 'b' and symbol not in ('&', '|', '^'):
+                operands = operands.astype(numpy.int64)
+            if symbol in ('/', '//', '%', 'divmod') and (val == 0 if layout_self == 'right' else (operands == 0).any()):
+                raise ZeroDivisionError(f'{symbol} by zero')
+            if symbol == '>>':
+                if layout_self == 'left' and (operands < 0).any():
+                    raise ValueError('negative shift count')
+                elif layout_self == 'right' and int(val) < 0:
+                    return numpy.full(operands.shape, f'{val} < 0', dtype=object)
+        result: Any = element(val, operands, modulo)
+        if isinstance(result, (numpy.ndarray, tuple)):
+            return result
+        # The same value for all operands, 'Does not compare!' for example.
+        return numpy.full(operands.shape, result, dtype=object)
+
+    def expr(self) -> 'AllTypesExpression':
+        """Deferred expression on the instance: (obj.expr() + 3) * 2 - 1, computed by evaluate() in one pass."""
+        return AllTypesExpression(self)
+
+    def only(self, *names: str) -> 'FieldSelection':
+        """The fields names of the instance: obj.only('integer', 'float_num') + 5 computes these two fields only."""
+        return FieldSelection(self, names)
+
+    def apply(self, symbol: Literal, other: Any, layout_self: str = 'left', modulo: Numbers = None,
+              fields: Iterable[str] = None) -> Dict[str, Any]:
+        """
+        Apply the operator symbol ('+', 'divmod', '**', '>=', ...) to the fields of the instance in fields, all fields
+        if it is None, with the same results as the operator: obj.apply('+', 5, fields=('integer',)) is
+        {'integer': (obj + 5)[1]}. The fields that the operator does not compute are left out, the other fields are not
+        read. layout_self='equally' changes the selected fields in place, all or nothing, and returns {}.
+        """
+        names: FrozenSet[str] = frozenset(NAME_ALL_TYPES if fields is None else check_field_names(fields))
+        kernel: OperatorKernel = self._operator_kernel(symbol, layout_self, type(other))
+        if isinstance(kernel, BroadcastKernel):
+            raise TypeError('A selection of fields can not be broadcast over an array')
+        if kernel.inplace:
+            try:
+                return kernel.select(self, other, modulo, names)
+            finally:
+                self._version = next(WRITE_STAMPS)
+        return kernel.select(self, other, modulo, names)
+
+    def apply_many(self, ops: Iterable[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Apply many operators to the instance, ops are (symbol, other) or (symbol, other, layout_self, modulo) as the
+        arguments of apply: obj.apply_many([('==', 4), ('<', 2.5), ('+', 'x'), ('&', {1, 2})]). Returns the results in
+        the order of ops, each one the tuple of the operator; an operator that raises gets its exception in place of the
+        result instead of stopping the others. The fields are read once for all operators, the operators with the same
+        kernel are computed together and convert a field to a container once for all of them. The results are tuples
+        in every result mode, the result cache and the statistics are not used. In-place operators are refused.
+        """
+        owner: type = type(self)
+        values: Dict[str, Any] = {name: (getattr(getattr(owner, name, None), 'stored', None) or attrgetter(name))(self)
+                                  for name in NAME_ALL_TYPES}
+
+        def entry(symbol: Literal, other: Any, layout_self: str = 'left',
+                  modulo: Numbers = None) -> Tuple[OperatorKernel, Any, Numbers]:
+            kernel: OperatorKernel = self._operator_kernel(symbol, layout_self, type(other))
+            if kernel.inplace:
+                raise ValueError(f'apply_many does not apply in-place operators, not {layout_self!r}')
+            return kernel, other, modulo
+
+        results: List[Any] = []
+        groups: Dict[OperatorKernel, List[Tuple[int, Any, Numbers]]] = {}
+        for index, op in enumerate(ops):
+            try:
+                kernel, other, modulo = entry(*op)
+            except Exception as error:
+                results.append(error)
+                continue
+            results.append(None)
+            groups.setdefault(kernel, []).append((index, other, modulo))
+
+        for kernel, entries in groups.items():
+            if isinstance(kernel, BroadcastKernel):
+                for index, other, modulo in entries:
+                    try:
+                        results[index] = kernel(self, other, modulo)
+                    except Exception as error:
+                        results[index] = error
+                continue
+            element: Element = kernel.element
+            lanes: List[Any] = [values[name] for name in kernel.fields]
+            if kernel.coerce is not None and len(entries) > 1:
+                try:
+                    lanes = list(map(kernel.coerce, lanes))
+                    element = kernel.coerced
+                except Exception:
+                    # The entries raise the error of the conversion one by one, through the element.
+                    pass
+            for index, other, modulo in entries:
+                try:
+                    if modulo is None:
+                        results[index] = tuple([element(val, other, None) for val in lanes])
+                    else:
+                        results[index] = tuple([kernel.element(values[name], other, modulo)
+                                                for name in kernel.modulo_fields])
+                except Exception as error:
+                    results[index] = error
+        return results
+
+    @classmethod
+    def stream(cls, instances: Iterable[ClassInstance]) -> 'AllTypesStream':
+        """Lazy pipeline of operators over the instances, e.g. AllTypes.stream(objs).add(3).where('integer', '>', 5)."""
+        return AllTypesStream(instances, cls)
+
+    @classmethod
+    def parallel_map(cls, instances: Iterable[ClassInstance], symbol: Literal, operand: Any,
+                     layout_self: str = 'left', modulo: Numbers = None, workers: int = None, chunksize: int = 1024,
+                     stream: bool = False) -> List[Tuple[Any]] or Iterator[Tuple[Any]]:
+        """
+        Apply the operator symbol ('**', '>=', 'divmod', ...) with the operand to every instance in worker processes,
+        the instance is on the layout_self side of the operator. The results come in the order of the instances: a list
+        of the result tuples, or with stream=True an iterator giving them as soon as their chunk is done, while at most
+        two chunks per worker are waiting.
+
+        The instances are cut into chunks of chunksize, and only the values of the fields that the operator reads are
+        sent to the workers, as tuples of built-in values: neither the instances nor their __dict__ are pickled. The
+        first exception of an item is raised in the order of the instances. workers=1 computes everything in this
+        process. In-place operators and NumPy array operands are not supported.
+        """
+        kernel: OperatorKernel = cls._operator_kernel(symbol, layout_self, type(operand))
+        if kernel.inplace or isinstance(kernel, BroadcastKernel):
+            raise TypeError('parallel_map supports neither in-place operators nor NumPy array operands')
+        if chunksize < 1:
+            raise ValueError(f'chunksize must be positive, not {chunksize}')
+        iterator: Iterator[ClassInstance] = iter(instances)
+        chunks: Iterator[List[Tuple[Any]]] = iter(
+            lambda: [kernel.values(instance, modulo) for instance in islice(iterator, chunksize)], [])
+        results: Iterator[Tuple[Any]] = cls._parallel_results(kernel.key, operand, modulo, chunks,
+                                                              workers or os.cpu_count() or 1)
+        return results if stream else list(results)
+
+    @staticmethod
+    def _parallel_results(key: KernelKey, operand: Any, modulo: Numbers, chunks: Iterator[List[Tuple[Any]]],
+                          workers: int) -> Iterator[Tuple[Any]]:
+        if workers == 1:
+            for rows in chunks:
+                yield from apply_kernel(key, operand, modulo, rows)
+            return
+        executor: ProcessPoolExecutor = ProcessPoolExecutor(workers)
+        pending: deque = deque()
+        try:
+            for rows in chunks:
+                pending.append(executor.submit(apply_kernel, key, operand, modulo, rows))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # An iterator closed early drops the chunks that were not started.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # Binary encoding
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding of the ten fields (see RecordCodec), read back by from_bytes."""
+        owner: type = type(self)
+        return bytes(RecordCodec.encode_record([getattr(owner, name).stored(self) for name in NAME_ALL_TYPES]))
+
+    @classmethod
+    def from_bytes(cls, data: bytes or memoryview) -> ClassInstance:
+        """Instance from the encoding made by to_bytes, the decoded values are stored without conversion."""
+        view: memoryview = memoryview(data).cast('B')
+        values, end = RecordCodec.decode_record(view)
+        if end != len(view):
+            raise ValueError(f'{len(view) - end} bytes after the record')
+        return cls._from_values(values, cls._field_writers())
+
+    @classmethod
+    def _field_writers(cls) -> List[Callable[[Any, Any], None]]:
+        return [getattr(cls, name).replace for name in NAME_ALL_TYPES]
+
+    @classmethod
+    def _from_values(cls, values: List[Any], writers: List[Callable[[Any, Any], None]]) -> ClassInstance:
+        instance: ClassInstance = cls.__new__(cls)
+        for write, value in zip(writers, values):
+            write(instance, value)
+        instance._version = next(WRITE_STAMPS)
+        return instance
+
+    @classmethod
+    def dump_many(cls, instances: Iterable[ClassInstance], file: IO, buffer_size: int = 1 << 20) -> int:
+        """
+        Write the instances to the binary file object, every record is its length (unsigned 4 bytes) and to_bytes.
+        Returns the number of records written.
+        """
+        out: bytearray = bytearray()
+        written: int = 0
+        readers: Dict[type, List[Reader]] = {}
+        for instance in instances:
+            owner: type = type(instance)
+            if owner not in readers:
+                readers[owner] = [getattr(owner, name).stored for name in NAME_ALL_TYPES]
+            record: bytearray = RecordCodec.encode_record([read(instance) for read in readers[owner]])
+            out += RecordCodec.SIZE.pack(len(record))
+            out += record
+            written += 1
+            if len(out) >= buffer_size:
+                file.write(out)
+                out = bytearray()
+        file.write(out)
+        return written
+
+    @classmethod
+    def load_many(cls, file: IO, buffer_size: int = 1 << 20) -> Iterator[ClassInstance]:
+        """Read the instances written by dump_many from the binary file object, one by one."""
+        writers: List[Callable[[Any, Any], None]] = cls._field_writers()
+        pending: bytes = b''
+        while True:
+            block: bytes = file.read(buffer_size)
+            data: bytes = pending + block if pending else block
+            view: memoryview = memoryview(data)
+            offset: int = 0
+            while offset + 4 <= len(data):
+                end: int = offset + 4 + RecordCodec.SIZE.unpack_from(data, offset)[0]
+                if end > len(data):
+                    break
+                values, record_end = RecordCodec.decode_record(view, offset + 4)
+                if record_end != end:
+                    raise ValueError(f'Corrupt record at offset {offset}')
+                yield cls._from_values(values, writers)
+                offset = end
+            pending = data[offset:]
+            if not block:
+                break
+        if pending:
+            raise ValueError(f'The file ends in the middle of a record, {len(pending)} bytes are left')
+
+    # =====================================================================
+
+    def __pos__(self) -> Tuple[Numbers]:
+        return +self.boolean, +self.integer, +self.float_num, +self.complex_num
+
+    def __neg__(self) -> Tuple[Numbers]:
+        return -self.boolean, -self.integer, -self.float_num, -self.complex_num
+
+    def __abs__(self) -> Tuple[int, float, complex]:
+        return abs(self.integer), abs(self.float_num), abs(self.complex_num)
+
+    def __round__(self, n: int = None) -> float:
+        return round(self.float_num, n)
+
+    def __floor__(self) -> float:
+        return self.floor(self.float_num)
+
+    def __ceil__(self) -> float:
+        return self.ceil(self.float_num)
+
+    def __trunc__(self) -> float:
+        return self.trunc(self.float_num)
+
+    # =====================================================================
+
+    def _translate_in_type(self, type_conversion: type, *args) -> Any:
+        """Trying to translate a string to the specified type. If it fails, translates what is specified in args."""
+        try:
+            return type_conversion(self.string)
+        except (ValueError, TypeError):
+            return type_conversion(*args)
+
+    def __int__(self) -> int:
+        """Translate float number in integer. if it can translate the string to integer then it will return it."""
+        return self._translate_in_type(int, self.float_num)
+
+    def __float__(self) -> float:
+        """Translate integer number in float. if it can translate the string to float then it will return it."""
+        return self._translate_in_type(float, self.integer)
+
+    def __complex__(self) -> complex:
+        """
+        Translate integer and float number in complex. if it can translate the string to complex then it will return it.
+
+        Real number will be integer, imaginary will be float.
+        """
+        return self._translate_in_type(complex, self.integer, self.float_num)
+
+    # __oct__ and __hex__ do not working when define argument self(created object user) in
+    # built-in function oct() and hex()
+    def __oct__(self) -> IntString:
+        return self._translate_in_type(oct, self.integer)
+
+    def __hex__(self) -> IntString:
+        return self._translate_in_type(hex, self.integer)
+
+    def __index__(self) -> int:
+        return self.integer
+
+    def __str__(self) -> str:
+        return f'<class {self.__class__.__name__} instance at {hex(id(self))}>'
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __format__(self, format_spec: AnyStr) -> AnyStr:
+        return self.string
+
+    def __hash__(self) -> int:
+        """Returns a hash of a tuple in which all hashable types, kept until the next write of a field."""
+        version: int = getattr(self, '_version', None)
+        cached: Tuple[int, int] = getattr(self, '_hash', None)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        owner: type = type(self)
+        result = []
+        for name in NAME_ALL_TYPES:
+            value: Any = getattr(owner, name).stored(self)
+            try:
+                hash(value)
+                result.append(value)
+            except TypeError:
+                pass
+        self._hash = (version, hash(tuple(result)))
+        return self._hash[1]
+
+    def __bool__(self):
+        return any(map(bool, self))
+
+    def __dir__(self) -> Dict[str, Any]:
+        return super().__dir__()
+
+    def __sizeof__(self) -> int:
+        return super().__sizeof__()
+
+    def __getattr__(self, item: str) -> None:
+        raise AttributeError(f'{str(self)} has not attribute {item}')
+
+    # The sequence protocol reads only the field it needs, as the field reading of the class gives it.
+    def __len__(self) -> int:
+        return len(NAME_ALL_TYPES)
+
+    def __getitem__(self, item: int or slice) -> Any:
+        if isinstance(item, slice):
+            return tuple([getattr(self, name) for name in NAME_ALL_TYPES[item]])
+        return getattr(self, NAME_ALL_TYPES[item])
+
+    def __iter__(self) -> Iterator:
+        return FieldIterator(self)
+
+    def __reversed__(self) -> Iterator:
+        return FieldIterator(self, reverse=True)
+
+    def __contains__(self, item: Any) -> bool:
+        # The stored values are compared, not copies of them: equal to the read ones.
+        owner: type = type(self)
+        for name in NAME_ALL_TYPES:
+            value: Any = getattr(owner, name).stored(self)
+            if value is item or value == item:
+                return True
+        return False
+
+    def __instancecheck__(self, instance: object) -> bool:
+        return type(instance) is type(self)
+
+    def __subclasscheck__(self, subclass: object) -> bool:
+        return issubclass(subclass, self.__class__)
+
+    def _share(self, other: ClassInstance, names: List[str]) -> None:
+        """Mark the fields names as shared by the instance and its copy other (copy-on-write, see OnlySelfType)."""
+        if not names:
+            return
+        try:
+            shared: FrozenSet[str] = object.__getattribute__(self, '_shared')
+        except AttributeError:
+            shared = frozenset()
+        other._shared = frozenset(names)
+        self._shared = shared | other._shared
+
+    def _attribute_values(self) -> List[Any]:
+        """Values of all attributes of the instance, taken from its __dict__ or, if it has no __dict__, its slots."""
+        storage: Dict[str, Any] = getattr(self, '__dict__', None)
+        if storage is not None:
+            return [value for name, value in storage.items() if name not in INTERNAL_ATTRIBUTES]
+        return [getattr(self, slot) for cls in type(self).__mro__ for slot in getattr(cls, '__slots__', ())
+                if slot not in INTERNAL_ATTRIBUTES and hasattr(self, slot)]
+
+    def __call__(self, *args, **kwargs) -> Dict[str, Any]:
+        """
+        If the user has added the called object(s), all called objects are called and all parameters that are
+        specified when the instance is called are passed. A dictionary is returned with the name of the called object
+        and the value that it returns.
+        """
+        callable_obj: List[Callable[[Any], Any]] = []
+        result_funcs: Dict[str, Any] = {}
+
+        for obj in self._attribute_values():
+            if callable(obj):
+                callable_obj.append(obj)
+        if callable_obj:
+            for call_obj in callable_obj:
+                result_funcs[call_obj.__name__] = call_obj(*args, **kwargs)
+        return result_funcs
+
+    async def acall(self, *args, timeout: float = None, max_workers: int = None, **kwargs) -> Dict[str, Any]:
+        """
+        Asynchronous obj(*args, **kwargs): the called objects run concurrently, coroutine functions are awaited together
+        and the other ones run on a thread pool of at most max_workers threads. Every call may last at most timeout
+        seconds. The dictionary has the same shape as the one of obj(), but an exception of a call (TimeoutError
+        included) becomes its value instead of stopping the others. A thread that timed out runs to its end in the
+        background, its result is dropped.
+        """
+        callable_obj: List[Callable[[Any], Any]] = [obj for obj in self._attribute_values() if callable(obj)]
+        if not callable_obj:
+            return {}
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers or min(32, len(callable_obj)))
+
+        async def run(call_obj: Callable[[Any], Any]) -> Any:
+            if iscoroutinefunction(call_obj):
+                call: Any = call_obj(*args, **kwargs)
+            else:
+                call = loop.run_in_executor(executor, partial(call_obj, *args, **kwargs))
+            return await asyncio.wait_for(call, timeout)
+
+        try:
+            results: List[Any] = await asyncio.gather(*map(run, callable_obj), return_exceptions=True)
+        finally:
+            executor.shutdown(wait=False)
+        return {call_obj.__name__: result for call_obj, result in zip(callable_obj, results)}
+
+    # Context manager
+    def __enter__(self) -> Tuple[FileObj]:
+        """Looks for an object that has the attribute "close", and returns a list of these objects."""
+        file_obj: FileObj = []
+        for obj in self._attribute_values():
+            if hasattr(obj, 'close'):
+                file_obj.append(obj)
+        return tuple(file_obj)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Looks for an object that has the attribute "close", and call method "close"."""
+        for obj in self._attribute_values():
+            if hasattr(obj, 'close'):
+                obj.close()
+    # End context manager
+
+
+class AllTypes(BaseAllTypes):
+    """
+    The AllTypes class, upon initialization, accepts all the built-in Python3.X data types of the CPython
+    implementation (bool, int, float, complex, str, list, tuple, dict, set, frozenset). The data must be specified
+    by name in this sequence, because a TypeError error may occur because the object cannot be converted to another
+    type. This class implements almost all magic methods and therefore you can interact with an instance using literals.
+
+    Initialization:
+     There are two ways:
+      First option -> instance = AllTypes(boolean=False, integer=0, float_num=0.0, complex_num=0j, string='', array=[],
+                                          tuple_=(,), dictionary={}, set_=set(), frozenset_=frozenset())
+      Second option -> instance = AllTypes.define_max_instance(max_instance, [, *args[, **kwargs]])
+
+     Parameters of the first option:
+       boolean: any object convertible to boolean.
+       integer: any object convertible to integer.
+       float_num: any object convertible to float.
+       complex_num: any object convertible to complex.
+       string: any object convertible to string.
+       array: any object convertible to list.
+       tuple_: any object convertible to tuple.
+       dictionary: any object convertible to dictionary.
+       set_: any object convertible to set.
+       frozenset_: any object convertible to frozenset.
+
+     Parameters of the second option:
+       max_instance: maximum number of class instances.
+       args: all parameters specified in the first embodiment.
+       kwargs: all named parameters specified in the first variant.
+
+     Class attributes:
+       all_types: return tuple all built-in types. (boolean, integer, float_num, complex_num, string, array, tuple_,
+                                                    dictionary, set_, frozenset_)
+     In the first version, the class with the specified parameters is simply initialized. The second option determines
+      how many instances of the class can be made. You can do this only once! By default, you can make as many instances
+      of the class as you like.
+
+    Class parameter:
+      all_types - all built-in instance types of a class. (boolean, integer, float_num, complex_num, string, array,
+                                                                tuple_, dictionary, set_, frozenset_)
+
+    For examples, create an instance.
+    obj = AllTypes (False, 4, -2.5, (3-2j), 'sing', [1, 4], (6, 1), {5: '5'}, {1, 6}, frozenset([12, 5]))
+
+    Important! when using instance literals with a complex, the complex must be in brackets otherwise a TypeError error.
+        obj + (2-4j) <- Correct
+        obj + 2-4j <- Wrong
+
+    Comparisons:
+     obj (==, !=) other ->
+        is bool or str: each built-in types is converted to a bool or str value and compared with the
+          other object. Example - obj == True # (False, True, True, True, True, True, True, True, True, True)
+        is int or float: boolean, integer and float_num translate to int or float and compared with the other object.
+          Example - obj == 4 # (False, True, False)
+        is complex: boolean, integer, float_num and complex_num translate to complex and compare with the other object.
+          Example - obj == (4+0j) # (False, True, False, False)
+        is dict: compare dict with dictionary. Example - obj != {5: ''} # (True,)
+        is list or tuple or set or frozenset: each initialization parameter is converted to a list value
+          (25 -> [25], (1, 2, 3) -> {1, 2, 3}, 'str' -> ('s', 't', 'r')) and compared with the other object.
+          Example - obj != (1, 2) # (True, True, True, True, True, True, True, True, True, True)
+        is other type: tries to compare with all built-in types; if that fails, throws a TypeError.
+
+    obj (<, <=, >=, >) other ->
+      Everything is almost the same as when comparing with '==' and '! =', but with a few exceptions.
+      if other is list or tuple:
+        Trying to compare with all built-in types. If it fails, replaces the boolean value 'Does not compare!'.
+        is complex or dict: will return a tuple filled with the string 'Does not compare!'.
+
+    When comparing, a tuple is returned whose length depends on what is being compared.
+
+
+    Arithmetic operations:
+     Those types that are not specified in the enumeration of behavior of type other with an instance are not supported.
+     obj + other ->
+       is bool or str: each built-in types is converted to a bool or str value and add up with other. Examples -
+         obj + True # (1, 2, 2, 2, 2, 2, 2, 2, 2, 2)
+         obj + ' + str' # ('False + str', '4 + str', '-2.5 + str', '(3-2j) + str', 'sing + str', '[2, 4] + str',
+                           '(6, 1) + str', "{5: '5'} + str", "{'g', 'e'} + str", 'frozenset({6, 12}) + str')
+       is int or float or complex: boolean, integer, float_num and complex_num translate to int or float or complex type
+         and are added. Examples -
+           obj + 4 # (4, 8, 1.5, (7-2j))
+           obj + (2-3j) # ((2-3j), (6-3j), (-0.5-3j), (5-5j))
+       is list or tuple or set or frozenset: each built-in type is translated into list or tuple or set or frozenset
+         (6.2 -> [6.2], 'str' -> ('s', 't', 'r'), {1: 2, 3: 4} -> {1, 3}) and develops. Examples -
+         obj + [1, 2] # ([False, 1, 2], [4, 1, 2], [-2.5, 1, 2], [(3-2j), 1, 2], ['s' , 'i', 'n', 'g', 1, 2],
+                         [1, 4, 1, 2], [6, 1, 1, 2], [5, 1, 2], [1, 6 , 1, 2], [12, 5, 1, 2])
+     other + obj ->
+       is bool or str: other with each built-in type are converted to type bool or str and add up. Example -
+         '!' + obj # ('!False', '!4', '!-2.5', '!(3-2j)', '!sing', '![1, 4]', '!(6, 1)', "!{5: '5'}", '!{1, 6}',
+                      '!frozenset({12, 5})')
+       is int or float or complex: other stacks with boolean, integer, float_num and complex_num. Example -
+         3 + obj # (3, 7, 0.5, (6-2j))
+       is list or tuple or set or frozenset: other stacks with all the built-in types translated into list or tuple or
+         set or frozenset. Example - [1, 2] + obj # ([1, 2, False], [1, 2, 4], [1, 2, -2.5], [1, 2, (3-2j)],
+                                                     [1, 2, 's', 'i', 'n', 'g'], [1, 2, 1, 4], [1, 2, 6, 1], [1, 2, 5],
+                                                     [1, 2, 1, 6], [1, 2, 12, 5])
+     obj += other ->
+       is bool or int or float: boolean, integer, float_num, complex_num is equal to the result of addition with other.
+       is str or list or tuple or dict or set or frozenset: str, array, tuple_, dictionary, set_ and frozenset_ is equal
+         to the result of addition with other, converted to the type with which it is added.
+
+     obj - other ->
+       is bool or int or float or complex: from boolean, integer, float_num and complex_num is subtracted by other.
+         Example - obj - 1.4 # (-1.4, 2.6, -3.9, (1.6-2j))
+       is set or frozenset: each built-in types is converted to a set or frozenset value and add up with other.
+         ((3-2j) -> {(3-2j)}, 'st' -> {'s', 't'}, [1, 2] -> {1, 2}). Example -
+         obj - {1, 2} # ({False}, {4}, {-2.5}, {(3-2j)}, {'i', 'g', 's', 'n'}, {4}, {6}, {5}, {6}, {12, 5})
+     other - obj ->
+       is bool or int or float or complex: boolean, integer, float_num and complex_num are subtracted from other.
+         Example - 2 - obj # (2, -2, 4.5, (-1 + 2j))
+       is set or frozenset: subtracted from other all built-in types converted to set or frozenset. Example -
+         {4, 2.5} - obj # ({2.5, 4}, {2.5}, {2.5, 4}, {2.5, 4}, {2.5, 4}, {2.5}, {2.5, 4}, {2.5, 4}, {2.5, 4}, {2.5, 4})
+     obj -= other ->
+       is bool or int or float: boolean, integer, float_num, complex_num are equal to the result of subtracting other.
+       is set or frozenset: set and frozenset are equal to the result of subtracting other.
+
+     obj * other ->
+       is float or complex: multiply boolean, integer, float_num and complex_num by other. Example -
+         obj * 2.5 # (0.0, 10.0, -6.25, (7.5-5j))
+       is bool or int : boolean, integer, float_num, complex_num, string, array and tuple_ are multiplied on other.
+        Example - obj * 2 # (0, 8, -5.0, (6-4j), 'singsing', [1, 4, 1, 4], (6, 1, 6, 1))
+     other * obj ->
+       is bool or int or float or complex: other multiply on boolean, integer, float_num and complex_num. Example -
+         2 * obj # (0, 8, -5.0, (6-4j))
+       is str or list or tuple: other multiply on boolean and integer. Example - 'str' * obj # ('', 'strstrstrstr')
+     obj *= other ->
+       is bool or int: boolean, integer, float_num, complex_num, string, array and tuple_ equals the result of
+         multiplying by other.
+       is float: boolean, integer, float_num and complex equals the result of multiplying by other.
+
+     obj / other ->
+       is bool or int or float or complex: boolean, integer, float_num and complex_num is divided into other. Example -
+         obj / (1-0j) # (0j, (4+0j), (-2.5+0j), (3-2j))
+     other / obj ->
+       is bool or int or float or complex: other divided on boolean, integer, float_num and complex. Example -
+         Note: replaced boolean with True as ZeroDivisionError raises.
+         10 / obj # (10.0, 2.5, -4.0, (2.307692307692308+1.5384615384615383j))
+     obj /= other ->
+       is bool or int or float or complex: boolean, integer, float_num and complex_num is equal to the result of
+         division by other.
+
+     obj (//, %) other ->
+       is bool or int or float: boolean, integer and float are divided integer or modulo by other. Example -
+         obj // 2 # (0, 2, -2.0)
+     other (//, %) obj ->
+       is bool or int or float: other divided integer or modulo by boolean, integer and float. Example -
+         Note: replaced boolean with True as ZeroDivisionError raises.
+         10 % obj # (0, 2, -0.0)
+     obj (//, %)= other ->
+       is bool or int or float: boolean, integer and float is equal to the result of an integer division operation or
+         modulo by other.
+
+     obj ** other ->
+       is bool or int or float or complex: boolean, integer, float_num, complex are raised to the power of other.
+        Example - obj ** True # (0, 4, -2.5, (3-2j))
+     other ** obj ->
+       is bool or int or float or complex: other is raised to the power of boolean, integer, float_num and complex_num.
+         Example - True ** obj # (1, 1, 1.0, (1+0j))
+     obj **= other ->
+       is bool or int or float or complex: boolean, integer, float_num, complex_num is equal to the result of raising to
+         the power of other.
+
+     pow(obj, other, modulo) ->
+       other is bool or int or float and modulo is None: boolean, integer, float_num, complex are raised to the power
+         of other. Example - pow(obj, 2) # (0, 16, 6.25, (5-12j))
+       other is bool or int or float and modulo is bool or int: boolean, integer and float are raised to the power of
+         other and are divided modulo. Example - pow(obj, 2, 3) # (0, 1, 1)
+     pow(other, obj) ->
+       is bool or int or float or complex: other is raised to the power of boolean, integer, float_num and complex_num.
+         Example - pow(2, obj) # (1, 16, 0.1767766952966369, (1.4676557979464138-7.86422192328995j))
 
-    def __rrshift__(self, other: int) -> Tuple[int]:
-        return self._arithmetic(other, '>>', 'right')
+     divmod(obj, other) ->
+       is bool or int or float: boolean, integer and float_num divided integer and modulo. Example -
+        divmod(obj, -2) # ((0, 0), (-2, 0), (1.0, -0.5))
+     divmod(other, obj) ->
+       is bool or int or float: other is divided integer and modulo by boolean, integer and float_num. Example -
+        Note: replaced boolean with True as ZeroDivisionError raises.
+        divmod(-2, obj) # ((-2, 0), (-1, 2), (0.0, -2.0))
 
-    def __rand__(self, other: NumWithoutComplexOrSet) -> Tuple[int] or Tuple[set or frozenset]:
-        return self._arithmetic(other, '&', 'right')
+     obj (<<, >>) other ->
+       is bool or int: boolean, integer and float binary shift left or right by other. Example - obj >> 5 # (0, 0, -1)
+     other (<<, >>) obj ->
+       is bool or int: other binary shifts left or right by boolean, integer and float_num. If some value is less than
+         zero, inserts 'value < 0'. Example - 3 >> obj # (3, 0, '-2.5 < 0')
+     obj (>>, <<)= other ->
+       is bool or int: boolean, integer, and float_num equals the result of a binary offset left or right by other.
 
-    def __ror__(self, other: NumWithoutComplexOrSet) -> Tuple[int] or Tuple[set or frozenset]:
-        return self._arithmetic(other, '|', 'right')
+     obj (&, |, ^) other ->
+       is bool or int: boolean, integer and float_num are converted to int and perform the binary operation & or | or ^
+         with other. Example - obj ^ 2 # (-2, -2, -2)
+       is set or frozenset: each built-in type translated to set or frozenset (25 -> {25}, 'sst' -> {'s', 't'}) and
+        perform the operation & or | or ^ with other. Example -
+        obj ^ {1, 2} # ({False, 1, 2}, {1, 2, 4}, {1, 2, -2.5}, {1, 2, (3-2j)}, {1, 2, 'n', 's', 'g', 'i'}, {2, 4},
+                        {2, 6}, {1, 2, 5}, {2, 6}, {1, 2, 12, 5})
+     other (&, |, ^) ->
+       is bool or int: other with boolean, integer and float_num perform the binary operation & or | or ^.  Example -
+         2 ^ obj # (2, 6, -4)
+       is set or frozenset: other with each built-in type translated to set or frozenset perform the operation
+         & or | or ^. Example - {1, 2} & obj # (set(), set(), set(), set(), set(), {1}, {1}, set(), {1}, set())
+     obj (&, |, ^)= other ->
+       is bool or int: boolean, integer and float num are equal to the result of binary operations & or | or ^
+         with other.
+       is set or frozenset: set and frozenset are equal to the result of the operation & or | or ^ with other.
 
-    def __rxor__(self, other: NumWithoutComplexOrSet) -> Tuple[int] or Tuple[set or frozenset]:
-        return self._arithmetic(other, '^', 'right')
 
-    # ---------------------------------------------------------------------
+    Unary operators and functions:
+      +obj -> +boolean, +integer, +float_num, +complex_num
+      -obj -> -boolean, -integer, -float_num, -complex_num
+      abs(obj) -> abs(integer), abs(float_num), abs(complex_num)
+      round(obj, 2) -> round(float_num, 2)
+      floor(obj) -> floor(float_num)
+      ceil(obj) -> ceil(float_num)
+      trunc(obj) -> trunc(float_num)
 
-    def __iadd__(self, other: NumOrSet) -> ClassInstance:
-        if type(other) is set or type(other) is frozenset:
-            self._arithmetic(other, '|', 'equally')
-            return self
-        self._arithmetic(other, '+', 'equally')
-        return self
+    Transfer functions to another type:
+      int (), float (), complex () tried convert string to self type, if it turns out, returns the translated string.
+      int(obj) -> int(float_num)
+      float(obj) -> float(integer)
+      complex(obj) -> complex(integer, float_num)
+      bool(obj) -> if at least one element is True in all_types, returns True, if all elements converted to a boolean
+                   value are False, returns False
+      str(obj) -> '<class (class name) instance at (instance hex id)>'
+      repr(obj) -> str(obj)
+      list(obj) -> list(all_types)
+      hash(obj) -> returns a hash of a tuple in which all hashable types, computed again only after a write.
+      len(obj) -> len(all_types)
+      (1, 2, 3)[obj] -> (1, 2, 3)[integer]
+      '->{}<-'.format(obj) -> '->{}<-'.format(string)
+      obj[2] -> all_types[2]
+      iter(obj) -> iterator over all_types, reading every field when it is reached (see FieldIterator)
+      reversed(obj) -> the same iterator from the last field
+      2 in obj -> 2 in all_types
+      obj() -> If the user has added the called object(s), all called objects are called and all parameters that are
+               specified when the instance is called are passed. A dictionary is returned with the name of the called
+               object and the value that it returns.
 
-    def __isub__(self, other: NumOrSet) -> ClassInstance:
-        self._arithmetic(other, '-', 'equally')
-        return self
+    Context manager: looks for an object that has the attribute "close", and returns a list of these objects.
 
-    def __imul__(self, other: Numbers) -> ClassInstance:
-        self._arithmetic(other, '*', 'equally')
-        return self
+    Operator kernels:
+      Every arithmetic operator is served by an OperatorKernel, built once for each (symbol, layout_self, type of other)
+      and kept in the class cache. Comparisons are served the same way, keyed on (compare, 'compare', type of other).
+      AllTypes.kernel_cache() returns a copy of the cache, AllTypes.clear_kernel_cache() empties it.
+
+    Lazy results:
+      After AllTypes.set_result_mode('lazy') the operators return a LazyResult instead of a tuple. It behaves like the
+      tuple, but every item is computed on its first access, so (obj + [1, 2])[1] computes only the integer.
+
+    Sequence views:
+      After AllTypes.set_result_mode('view') the strings, lists and tuples made by '+' and '*' (obj + ' str',
+      [0] + obj, obj * 1000, 'ab' * obj) are SequenceView: the parts are kept and the sequence is not built, so
+      (obj * 1000)[5] takes no more memory than obj * 1. A view supports len, indexing, slicing, iteration and ==,
+      view.materialize() builds the string, list or tuple. The other operators return tuples as in the 'eager' mode.
+
+    Result cache:
+      AllTypes.enable_result_cache(maxsize) remembers the results of the operators of the class instances, for
+      repeated expressions like obj == True on an unchanged instance. AllTypes.result_cache_info() returns the hits,
+      misses and evictions counters, AllTypes.disable_result_cache() turns it off.
+
+    Coercion cache:
+      AllTypes.enable_coercion_cache(maxsize) keeps the fields of the class instances converted to the container type
+      of the operand, so obj - s1, obj & s2, obj == (1, 2) and obj + [3] on an unchanged instance convert the fields
+      only once for each type. AllTypes.coercion_cache_info() returns the counters, AllTypes.disable_coercion_cache()
+      turns it off.
+
+    Instance pool:
+      After AllTypes.define_max_instance(n) at most n instances are alive at once, also with many threads. Released
+      (AllTypes.release(obj)) and garbage collected instances give their slot back, released ones are reused by the
+      next construction. AllTypes.acquire(...) waits for a free slot instead of returning the last instance,
+      AllTypes.pool_info() returns the counters of allocations, reuses and waits.
+
+    Interning:
+      AllTypes.intern(obj) returns the instance already interned with the same content, or obj itself, whose strings,
+      tuples and frozensets are replaced by the ones shared with other interned instances (see InternTable).
+      AllTypes.interned(...) creates an instance and interns it, AllTypes.intern_info() returns the counters. Interned
+      instances are shared and must not be changed; they are dropped from the table when they are collected.
+
+    Expressions:
+      ((obj.expr() + 3) * 2 - 1).evaluate() computes the chain of operators field by field in one pass, only for the
+      fields that the first operator computes, with the results of the chain by hand (see AllTypesExpression).
+
+    Field selection:
+      obj.only('integer', 'float_num') + 5 and obj.apply('+', 5, fields=('integer', 'float_num')) compute only these
+      fields, as obj + 5 does, and return {field: result}; the other fields are not read (see FieldSelection).
+
+    Batches of operators:
+      obj.apply_many([('==', 4), ('<', 2.5), ('+', 'x'), ('&', {1, 2})]) reads the fields once and returns the results
+      of the operators in their order, with the exception of an operator that raised in its place.
+
+    Streams:
+      AllTypes.stream(objs).add(3).mul(2).where('integer', '>=', 10) is a lazy pipeline: the records go through the
+      operators one at a time when it is iterated (see AllTypesStream).
+
+    Parallel map:
+      AllTypes.parallel_map(instances, '**', 2, workers=4) applies the operator to every instance in worker processes
+      and returns the results in order, stream=True gives them one by one (see BaseAllTypes.parallel_map).
+
+    Asynchronous call:
+      await obj.acall(*args, timeout=..., **kwargs) is obj(*args, **kwargs) with the called objects running at the same
+      time: coroutine functions are awaited together, the other ones run on a thread pool. The exceptions are returned
+      in the dictionary instead of being raised.
+
+    Binary encoding:
+      obj.to_bytes() and AllTypes.from_bytes(data) encode the fields compactly, without the class and the __dict__ of
+      pickle (see RecordCodec). AllTypes.dump_many(instances, file) and AllTypes.load_many(file) do it for many records.
+      AllTypesStore.open(path) reads such records at random through mmap, store[i] decodes only the record i.
+
+    Statistics:
+      AllTypes.enable_stats() measures every operator of the class instances: calls, exceptions and latencies for each
+      magic method and operand type, and the branches taken by the comparisons. AllTypes.stats() returns them as a
+      dictionary, AllTypes.reset_stats() drops them and AllTypes.disable_stats() stops measuring.
+
+    NumPy arrays:
+      obj.broadcast(symbol, array) applies the operator to every number of the array at once and returns one array per
+      field, the operators with a NumPy array operand (obj * array, array <= obj) do the same. NumPy is optional.
+
+    Copies:
+      copy(obj) and deepcopy(obj) share the lists, dictionaries and sets of obj until one of the two instances changes
+      them, only the changed field is then copied (copy-on-write, see OnlySelfType), so a copy takes constant time.
+      deepcopy shares only the containers that hold no mutable object and copies the other ones at once. Copies are
+      not counted by define_max_instance.
+
+    Read modes:
+      By default every reading of a field returns a copy. AllTypes.set_read_mode('direct') or ('view') makes the
+      readings of a class zero-copy, OnlySelfType(type, read_mode=...) does it for one field (see OnlySelfType).
+    """
+    # So that the user could not put another type in place of the desired one.
+    boolean: bool = OnlySelfType(bool)
+    integer: int = OnlySelfType(int)
+    float_num: float = OnlySelfType(float)
+    complex_num: complex = OnlySelfType(complex)
+    string: AnyStr = OnlySelfType(str)
+    array: List[Any] = OnlySelfType(list)
+    tuple_: Tuple[Any] = OnlySelfType(tuple)
+    dictionary: Dict[Any, Any] = OnlySelfType(dict)
+    set_: Set[Any] = OnlySelfType(set)
+    frozenset_: FrozenSet[Any] = OnlySelfType(frozenset)
 
-    def __itruediv__(self, other: Numbers) -> ClassInstance:
-        self._arithmetic(other, '/', 'equally')
-        return self
+    def __copy__(self) -> ClassInstance:
+        # Not AllTypes(): a copy takes no slot of define_max_instance.
+        copy_obj = object.__new__(type(self))
+        copy_obj.__dict__.update(self.__dict__)
+        # Lists, dictionaries and sets are shared until one of the instances changes them (see OnlySelfType).
+        self._share(copy_obj, [name for name in NAME_ALL_TYPES if type(self.__dict__.get(name)) in MUTABLE_TYPES])
+        return copy_obj
 
-    def __ifloordiv__(self, other: bool or int or float) -> ClassInstance:
-        self._arithmetic(other, '//', 'equally')
-        return self
+    def __deepcopy__(self, memodict: Dict[int, Any] = None) -> ClassInstance:
+        memodict = {} if memodict is None else memodict
+        deepcopy_obj = object.__new__(type(self))
+        memodict[id(self)] = deepcopy_obj
+        shared: List[str] = []
+        for name, value in self.__dict__.items():
+            if name in NAME_ALL_TYPES and is_flat(value):
+                deepcopy_obj.__dict__[name] = value
+                if type(value) in MUTABLE_TYPES:
+                    shared.append(name)
+            elif name != '_shared':
+                # Taken from the class: from the instance deepcopy would be bound to it.
+                deepcopy_obj.__dict__[name] = AllTypes.deepcopy(value, memodict)
+        self._share(deepcopy_obj, shared)
+        return deepcopy_obj
 
-    def __imod__(self, other: bool or int or float) -> ClassInstance:
-        self._arithmetic(other, '%', 'equally')
-        return self
 
-    def __ipow__(self, power: Numbers, modulo: Numbers = None) -> ClassInstance:
-        self._arithmetic(power, '**', 'equally', modulo)
-        return self
+class CompactAllTypes(BaseAllTypes):
+    """
+    AllTypes without the instance __dict__: the ten fields are kept in __slots__, which saves memory when many
+    instances are alive at the same time (see benchmark.compare_memory). All operators work as in AllTypes, but
+    attributes other than the ten fields can not be added, so obj() returns an empty dictionary and the context manager
+    finds nothing to close.
+    """
+    __slots__ = tuple('_' + name for name in NAME_ALL_TYPES) + ('_version', '_hash', '_shared')
+
+    boolean: bool = SlotSelfType(bool)
+    integer: int = SlotSelfType(int)
+    float_num: float = SlotSelfType(float)
+    complex_num: complex = SlotSelfType(complex)
+    string: AnyStr = SlotSelfType(str)
+    array: List[Any] = SlotSelfType(list)
+    tuple_: Tuple[Any] = SlotSelfType(tuple)
+    dictionary: Dict[Any, Any] = SlotSelfType(dict)
+    set_: Set[Any] = SlotSelfType(set)
+    frozenset_: FrozenSet[Any] = SlotSelfType(frozenset)
+
+    def _slot_values(self) -> Iterator[Tuple[str, Any]]:
+        """
+        (slot, value) of every slot that is set, of the class and of its bases, but _shared, then the (name, value) of
+        the __dict__ that a subclass without __slots__ gives.
+        """
+        for cls in type(self).__mro__:
+            slots: Any = cls.__dict__.get('__slots__', ())
+            for slot in (slots,) if type(slots) is str else slots:
+                if slot == '_shared' or slot == '__dict__' or slot == '__weakref__':
+                    continue
+                try:
+                    # Not getattr: an unset slot must not go to __getattr__.
+                    yield slot, object.__getattribute__(self, slot)
+                except AttributeError:
+                    pass
+        try:
+            storage: Dict[str, Any] = object.__getattribute__(self, '__dict__')
+        except AttributeError:
+            return
+        yield from list(storage.items())
 
-    def __ilshift__(self, other: int) -> ClassInstance:
-        self._arithmetic(other, '<<', 'equally')
-        return self
+    def __copy__(self) -> ClassInstance:
+        # Not CompactAllTypes(): a copy takes no slot of define_max_instance.
+        copy_obj = object.__new__(type(self))
+        shared: List[str] = []
+        for slot, value in self._slot_values():
+            setattr(copy_obj, slot, value)
+            if type(value) in MUTABLE_TYPES and slot in FIELD_SLOTS:
+                shared.append(slot[1:])
+        # Lists, dictionaries and sets are shared until one of the instances changes them (see OnlySelfType).
+        self._share(copy_obj, shared)
+        return copy_obj
 
-    def __irshift__(self, other: int) -> ClassInstance:
-        self._arithmetic(other, '>>', 'equally')
-        return self
+    def __deepcopy__(self, memodict: Dict[int, Any] = None) -> ClassInstance:
+        memodict = {} if memodict is None else memodict
+        deepcopy_obj = object.__new__(type(self))
+        memodict[id(self)] = deepcopy_obj
+        shared: List[str] = []
+        for slot, value in self._slot_values():
+            if slot in FIELD_SLOTS and is_flat(value):
+                setattr(deepcopy_obj, slot, value)
+                if type(value) in MUTABLE_TYPES:
+                    shared.append(slot[1:])
+            else:
+                # Taken from the class: from the instance deepcopy would be bound to it.
+                setattr(deepcopy_obj, slot, CompactAllTypes.deepcopy(value, memodict))
+        self._share(deepcopy_obj, shared)
+        return deepcopy_obj
 
-    def __iand__(self, other: int or set or frozenset) -> ClassInstance:
-        self._arithmetic(other, '&', 'equally')
-        return self
 
-    def __ior__(self, other: int or set or frozenset) -> ClassInstance:
-        self._arithmetic(other, '|', 'equally')
-        return self
+class AllTypesBatch(AllTypesOperators):
+    """
+    Column-wise container of many AllTypes records. boolean, integer, float_num and complex_num are kept in contiguous
+    typed arrays of the array module (complex_num as two arrays, of the real and of the imaginary parts; integer turns
+    into a list when a value does not fit into 64 bits), the other fields in one list per field.
 
-    def __ixor__(self, other: int or set or frozenset) -> ClassInstance:
-        self._arithmetic(other, '^', 'equally')
-        return self
+    Initialization: batch = AllTypesBatch(records), records is an iterable of AllTypes or CompactAllTypes instances.
 
-    # =====================================================================
+    The operators have the semantics of the AllTypes operators applied to every record, a whole column at a time, and
+    return columns: batch + 3 is a tuple of four lists, the results for boolean, integer, float_num and complex_num,
+    so (batch + 3)[i][j] == (records[j] + 3)[i]. In-place operators raise TypeError, a batch is only read by operators.
 
-    def _translate_in_type(self, type_conversion: type, *args) -> Any:
-        """Trying to translate a string to the specified type. If it fails, translates what is specified in args."""
-        try:
-            return type_conversion(self.string)
-        except (ValueError, TypeError):
-            return type_conversion(*args)
+    batch.column(name) -> list of the values of the field in all records.
+    batch[j] -> AllTypes instance of the record j.
+    batch.to_instances(cls) -> list of instances of cls (AllTypes by default), one per record.
+    """
+    __slots__ = ('_columns', '_length')
+
+    typecodes: Dict[str, str] = {'boolean': 'b', 'integer': 'q', 'float_num': 'd'}
+
+    def __init__(self, records: Iterable[BaseAllTypes] = ()) -> None:
+        self._columns: Dict[str, Column] = {name: array(self.typecodes[name]) if name in self.typecodes else []
+                                            for name in NAME_ALL_TYPES if name != 'complex_num'}
+        self._columns['complex_num'] = (array('d'), array('d'))
+        self._length: int = 0
+        self.extend(records)
+
+    def append(self, record: BaseAllTypes) -> None:
+        """Add the record at the end of the batch."""
+        columns: Dict[str, Column] = self._columns
+        for name, value in zip(NAME_ALL_TYPES, record._all_types):
+            if name == 'complex_num':
+                columns[name][0].append(value.real)
+                columns[name][1].append(value.imag)
+            elif name == 'integer':
+                try:
+                    columns[name].append(value)
+                except OverflowError:
+                    columns[name] = list(columns[name])
+                    columns[name].append(value)
+            else:
+                columns[name].append(value)
+        self._length += 1
+
+    def extend(self, records: Iterable[BaseAllTypes]) -> None:
+        """Add the records at the end of the batch."""
+        for record in records:
+            self.append(record)
+
+    def _values(self, name: str) -> Iterable[Any]:
+        """Values of the field in all records, of the type of the field."""
+        column: Column = self._columns[name]
+        if name == 'boolean':
+            return map(bool, column)
+        elif name == 'complex_num':
+            return map(complex, *column)
+        return column
+
+    def column(self, name: str) -> List[Any]:
+        """Return the list of the values of the field name in all records."""
+        if name not in self._columns:
+            raise KeyError(f'{self.__class__.__name__} has not field {name}')
+        return list(self._values(name))
+
+    def to_instances(self, cls: type = None) -> List[BaseAllTypes]:
+        """Return the records as a list of instances of cls, AllTypes by default."""
+        cls = AllTypes if cls is None else cls
+        return [cls(*values) for values in zip(*map(self._values, NAME_ALL_TYPES))]
 
-    def __int__(self) -> int:
-        """Translate float number in integer. if it can translate the string to integer then it will return it."""
-        return self._translate_in_type(int, self.float_num)
+    def __len__(self) -> int:
+        return self._length
 
-    def __float__(self) -> float:
-        """Translate integer number in float. if it can translate the string to float then it will return it."""
-        return self._translate_in_type(float, self.integer)
+    def __getitem__(self, item: int) -> BaseAllTypes:
+        if item < 0:
+            item += self._length
+        if not 0 <= item < self._length:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        values: List[Any] = [self._columns[name][item] for name in NAME_ALL_TYPES if name != 'complex_num']
+        values.insert(3, complex(self._columns['complex_num'][0][item], self._columns['complex_num'][1][item]))
+        return AllTypes(*values)
 
-    def __complex__(self) -> complex:
-        """
-        Translate integer and float number in complex. if it can translate the string to complex then it will return it.
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} of {self._length} records at {hex(id(self))}>'
+
+    def _apply(self, kernel: OperatorKernel, other: Any, modulo: Numbers = None) -> Tuple[List[Any]]:
+        """Apply the kernel to the columns of its fields, the result is a tuple of columns."""
+        if isinstance(kernel, BroadcastKernel):
+            raise TypeError(f'{self.__class__.__name__} can not be broadcast over an array')
+        result: List[List[Any]] = []
+        for name in kernel.fields if modulo is None else kernel.modulo_fields:
+            values: Iterable[Any] = self._values(name)
+            if kernel.plain_operator is None:
+                element: Element = kernel.element
+                result.append([element(val, other, modulo) for val in values])
+            elif kernel.key[1] == 'right':
+                result.append(list(map(kernel.plain_operator, repeat(other), values)))
+            else:
+                result.append(list(map(kernel.plain_operator, values, repeat(other))))
+        return tuple(result)
 
-        Real number will be integer, imaginary will be float.
-        """
-        return self._translate_in_type(complex, self.integer, self.float_num)
+    def _comparison(self, other: Any, compare: Literal = '==') -> Tuple[List[bool]]:
+        return self._apply(self._comparison_kernel(compare, type(other)), other)
 
-    # __oct__ and __hex__ do not working when define argument self(created object user) in
-    # built-in function oct() and hex()
-    def __oct__(self) -> IntString:
-        return self._translate_in_type(oct, self.integer)
+    def _arithmetic(self, other: Any, symbol: Literal = '+', layout_self: str = 'left',
+                    modulo: Numbers = None) -> Tuple[List[Any]]:
+        kernel: OperatorKernel = self._arithmetic_kernel(symbol, layout_self, type(other))
+        if kernel.inplace:
+            raise TypeError(f'{self.__class__.__name__} does not support in-place operators')
+        return self._apply(kernel, other, modulo)
 
-    def __hex__(self) -> IntString:
-        return self._translate_in_type(hex, self.integer)
 
-    def __index__(self) -> int:
-        return self.integer
+class AllTypesExpression(AllTypesOperators):
+    """
+    Deferred operators on an instance, made by obj.expr(): (obj.expr() + 3) * 2 - 1 builds the chain of the three
+    operators and evaluate() computes it. Only the fields that the first operator computes are evaluated (obj + 3
+    computes the numbers, so the strings and containers are skipped at once), each one in a single pass through all
+    operators, without intermediate tuples. Item i of the result is what chaining the operators by hand gives for it,
+    ((obj + 3)[i] * 2) - 1: the first operator is the operator of the instance, the next ones are the plain Python
+    operators applied to the value, so they raise where the chain by hand raises ((obj - 0.5)[1] << 1 is a TypeError).
+    The operands are constants, the fields are read when evaluate is called. An expression never changes: e += 1 binds
+    e to the new expression e + 1.
+    """
+    __slots__ = ('_instance', '_steps')
+
+    def __init__(self, instance: ClassInstance, steps: Tuple[Tuple[OperatorKernel, Any, Numbers], ...] = ()) -> None:
+        self._instance: ClassInstance = instance
+        self._steps: Tuple[Tuple[OperatorKernel, Any, Numbers], ...] = steps
+
+    def _then(self, kernel: OperatorKernel, other: Any, modulo: Numbers = None) -> 'AllTypesExpression':
+        if isinstance(kernel, BroadcastKernel):
+            raise TypeError('An expression can not be broadcast over an array')
+        return self.__class__(self._instance, self._steps + ((kernel, other, modulo),))
+
+    def _comparison(self, other: Any, compare: Literal = '==') -> 'AllTypesExpression':
+        return self._then(self._comparison_kernel(compare, type(other)), other)
+
+    def _arithmetic(self, other: Any, symbol: Literal = '+', layout_self: str = 'left',
+                    modulo: Numbers = None) -> 'AllTypesExpression':
+        # In place: e += 1 is e = e + 1, a new expression, so that the expressions never change.
+        if layout_self != 'right':
+            layout_self = 'left'
+        return self._then(self._arithmetic_kernel(symbol, layout_self, type(other)), other, modulo)
+
+    __iadd__ = AllTypesOperators.__add__
+    __isub__ = AllTypesOperators.__sub__
+    __imul__ = AllTypesOperators.__mul__
+    __itruediv__ = AllTypesOperators.__truediv__
+    __ifloordiv__ = AllTypesOperators.__floordiv__
+    __imod__ = AllTypesOperators.__mod__
+    __ipow__ = AllTypesOperators.__pow__
+    __ilshift__ = AllTypesOperators.__lshift__
+    __irshift__ = AllTypesOperators.__rshift__
+    __iand__ = AllTypesOperators.__and__
+    __ior__ = AllTypesOperators.__or__
+    __ixor__ = AllTypesOperators.__xor__
 
-    def __str__(self) -> str:
-        return f'<class {self.__class__.__name__} instance at {hex(id(self))}>'
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Names of the fields that the expression computes, the ones of its first operator."""
+        if not self._steps:
+            return NAME_ALL_TYPES
+        kernel, other, modulo = self._steps[0]
+        return kernel.fields if modulo is None else kernel.modulo_fields
+
+    @staticmethod
+    def _plain(kernel: OperatorKernel, other: Any, modulo: Numbers) -> Element:
+        """The Python operator of the kernel applied to a value, as in (obj + 3)[i] * 2, with the same arguments."""
+        symbol, layout_self = kernel.key[0], kernel.key[1]
+        if layout_self == 'compare':
+            compare: Callable[[Any, Any], bool] = COMPARISON_OPERATORS[symbol]
+            return lambda val, other, modulo: compare(val, other)
+        if modulo is not None:
+            if layout_self == 'right':
+                return lambda val, other, modulo: pow(other, val, modulo)
+            return pow
+        op: Callable[[Any, Any], Any] = BINARY_OPERATORS[symbol]
+        if layout_self == 'right':
+            return lambda val, other, modulo: op(other, val)
+        return lambda val, other, modulo: op(val, other)
+
+    def evaluate(self) -> Tuple[Any]:
+        """Compute the expression, one item for every name in fields."""
+        steps: List[Tuple[Element, Any, Numbers]] = [
+            (kernel.element if index == 0 else self._plain(kernel, other, modulo), other, modulo)
+            for index, (kernel, other, modulo) in enumerate(self._steps)]
+        owner: type = type(self._instance)
+        result: List[Any] = []
+        for name in self.fields:
+            val: Any = getattr(owner, name).stored(self._instance)
+            for element, other, modulo in steps:
+                val = element(val, other, modulo)
+            result.append(val)
+        return tuple(result)
 
     def __repr__(self) -> str:
-        return str(self)
+        text: str = 'obj'
+        for kernel, other, modulo in self._steps:
+            symbol, layout_self = kernel.key[0], kernel.key[1]
+            if modulo is not None:
+                text = f'pow({text}, {other!r}, {modulo!r})'
+            elif symbol == 'divmod':
+                text = f'divmod({other!r}, {text})' if layout_self == 'right' else f'divmod({text}, {other!r})'
+            else:
+                text = f'({other!r} {symbol} {text})' if layout_self == 'right' else f'({text} {symbol} {other!r})'
+        return f'<{self.__class__.__name__} {text}>'
 
-    def __format__(self, format_spec: AnyStr) -> AnyStr:
-        return self.string
 
-    def __hash__(self) -> int:
-        """Returns a hash of a tuple in which all hashable types."""
-        result = []
-        for i in self._all_types:
-            try:
-                hash(i)
-                result.append(i)
-            except TypeError:
-                pass
-        return hash(tuple(result))
+class FieldSelection(AllTypesOperators):
+    """
+    Some fields of an instance, made by obj.only('integer', 'float_num'). Its operators compute only these fields, with
+    the results of the operators of the instance, and return {field: result}: obj.only('integer', 'string') + 5 is
+    {'integer': (obj + 5)[1]}, the string is left out as obj + 5 does not compute it. The other fields are not read.
+    sel += 5 changes the selected fields of the instance, all or nothing (see BaseAllTypes.apply).
+    """
+    __slots__ = ('_instance', '_names')
 
-    def __bool__(self):
-        return any(map(bool, self._all_types))
+    def __init__(self, instance: ClassInstance, names: Iterable[str]) -> None:
+        self._instance: ClassInstance = instance
+        self._names: Tuple[str, ...] = check_field_names(names)
 
-    def __dir__(self) -> Dict[str, Any]:
-        return super().__dir__()
+    def _comparison(self, other: Any, compare: Literal = '==') -> Dict[str, bool]:
+        return self._instance.apply(compare, other, fields=self._names)
 
-    def __sizeof__(self) -> int:
-        return super().__sizeof__()
+    def _arithmetic(self, other: Any, symbol: Literal = '+', layout_self: str = 'left',
+                    modulo: Numbers = None) -> Dict[str, Any]:
+        return self._instance.apply(symbol, other, layout_self, modulo, self._names)
 
-    def __getattr__(self, item: str) -> None:
-        raise AttributeError(f'{str(self)} has not attribute {item}')
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Names of the selected fields."""
+        return self._names
 
-    def __len__(self) -> int:
-        return len(self._all_types)
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {', '.join(self._names)} of {self._instance!r}>"
 
-    def __getitem__(self, item: int) -> Any:
-        return self._all_types[item]
 
-    def __iter__(self) -> Iterator:
-        self._index_value = 0
-        return self
+class AllTypesStream:
+    """
+    Lazy pipeline of operators over an iterable of instances, made by AllTypes.stream(iterable):
+        AllTypes.stream(records).add(3).mul(2).where('integer', '>=', 10)
+    Every step is the operator of the instance: add(3) computes the fields that obj + 3 computes, with the same
+    kernel, and puts the results in place of these fields, the other fields stay as they are. Before a step the values
+    are converted to the types of their fields, as in a record, so a step whose results do not fit the fields (obj - {1}
+    gives sets for the numbers) raises TypeError. where keeps the records whose field compares True, as in obj >= 10.
+
+    Nothing is done until the stream is iterated, then the records go through all steps one at a time and come out as
+    new instances of the class of the stream, so the memory does not depend on the length of the iterable. Stopping
+    the iteration (limit, break, a closed generator) stops reading the iterable. The steps return new streams, a stream
+    can be iterated again if its iterable can.
+    """
+    __slots__ = ('_source', '_record_class', '_steps')
 
-    def __next__(self):
-        if self._index_value >= len(self._all_types):
-            raise StopIteration
-        value = self._all_types[self._index_value]
-        self._index_value += 1
-        return value
+    def __init__(self, source: Iterable[ClassInstance], record_class: type,
+                 steps: Tuple[Callable[[List[Any]], bool], ...] = ()) -> None:
+        self._source: Iterable[ClassInstance] = source
+        self._record_class: type = record_class
+        self._steps: Tuple[Callable[[List[Any]], bool], ...] = steps
 
-    def __reversed__(self) -> Tuple[Any]:
-        return self._all_types[::-1]
+    def _then(self, step: Callable[[List[Any]], bool]) -> 'AllTypesStream':
+        return self.__class__(self._source, self._record_class, self._steps + (step,))
 
-    def __contains__(self, item: Any) -> bool:
-        return item in self._all_types
+    @staticmethod
+    def _fit(val: Any, type_field: type) -> Any:
+        """The value converted to the type of its field, TypeError if it does not fit."""
+        try:
+            return type_field(val)
+        except (TypeError, ValueError) as error:
+            raise TypeError(f'{val!r} does not fit a field of type {type_field.__name__}') from error
+
+    def apply(self, symbol: Literal, other: Any, layout_self: str = 'left', modulo: Numbers = None) -> 'AllTypesStream':
+        """Step of the arithmetic operator symbol with the other operand, the record is on the layout_self side."""
+        if layout_self != 'left' and layout_self != 'right':
+            raise ValueError(f"layout_self must be 'left' or 'right', not {layout_self!r}")
+        kernel: OperatorKernel = AllTypesOperators._arithmetic_kernel(symbol, layout_self, type(other))
+        if isinstance(kernel, BroadcastKernel):
+            raise TypeError('A stream can not broadcast over an array')
+        element: Element = kernel.element
+        indexes: List[int] = [NAME_ALL_TYPES.index(name)
+                              for name in (kernel.fields if modulo is None else kernel.modulo_fields)]
+        # BUILT_IN_TYPES are the types of the fields, in the same order.
+        lanes: Tuple[Tuple[int, type], ...] = tuple((index, BUILT_IN_TYPES[index]) for index in indexes)
+        fit: Callable[[Any, type], Any] = self._fit
+
+        def step(values: List[Any]) -> bool:
+            for index, type_field in lanes:
+                val: Any = values[index]
+                values[index] = element(val if type(val) is type_field else fit(val, type_field), other, modulo)
+            return True
+        return self._then(step)
+
+    def add(self, other: Any) -> 'AllTypesStream':
+        return self.apply('+', other)
+
+    def sub(self, other: Any) -> 'AllTypesStream':
+        return self.apply('-', other)
+
+    def mul(self, other: Any) -> 'AllTypesStream':
+        return self.apply('*', other)
+
+    def truediv(self, other: Any) -> 'AllTypesStream':
+        return self.apply('/', other)
+
+    def floordiv(self, other: Any) -> 'AllTypesStream':
+        return self.apply('//', other)
+
+    def mod(self, other: Any) -> 'AllTypesStream':
+        return self.apply('%', other)
+
+    def pow(self, other: Any, modulo: Numbers = None) -> 'AllTypesStream':
+        return self.apply('**', other, modulo=modulo)
+
+    def where(self, name: str, compare: Literal, other: Any) -> 'AllTypesStream':
+        """Keep the records whose field name compares True with other, e.g. where('integer', '>=', 10)."""
+        kernel: OperatorKernel = AllTypesOperators._comparison_kernel(compare, type(other))
+        if name not in kernel.fields:
+            raise ValueError(f"'{compare}' with {type(other).__name__} does not compare the field {name!r}, "
+                             f"only {', '.join(kernel.fields) or 'none'}")
+        element: Element = kernel.element
+        index: int = NAME_ALL_TYPES.index(name)
+        type_field: type = BUILT_IN_TYPES[index]
+        fit: Callable[[Any, type], Any] = self._fit
+
+        def step(values: List[Any]) -> bool:
+            val: Any = values[index]
+            return element(val if type(val) is type_field else fit(val, type_field), other, None) is True
+        return self._then(step)
+
+    def limit(self, count: int) -> Iterator[ClassInstance]:
+        """At most the first count records, the iterable is not read further."""
+        return islice(self, count)
+
+    def batches(self, size: int) -> Iterator[List[ClassInstance]]:
+        """The records in lists of size records, the last one may be shorter."""
+        if size < 1:
+            raise ValueError(f'size must be positive, not {size}')
+        iterator: Iterator[ClassInstance] = iter(self)
+        return iter(lambda: list(islice(iterator, size)), [])
+
+    def __iter__(self) -> Iterator[ClassInstance]:
+        record_class: type = self._record_class
+        steps: Tuple[Callable[[List[Any]], bool], ...] = self._steps
+        fit: Callable[[Any, type], Any] = self._fit
+        readers: Dict[type, List[Reader]] = {}
+        for instance in self._source:
+            owner: type = type(instance)
+            if owner not in readers:
+                readers[owner] = [getattr(owner, name).stored for name in NAME_ALL_TYPES]
+            values: List[Any] = [read(instance) for read in readers[owner]]
+            for step in steps:
+                if not step(values):
+                    break
+            else:
+                yield record_class(*[val if type(val) is type_field else fit(val, type_field)
+                                     for val, type_field in zip(values, BUILT_IN_TYPES)])
 
-    def __instancecheck__(self, instance: object) -> bool:
-        return type(instance) is type(self)
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} of {len(self._steps)} steps over {self._source!r}>'
 
-    def __subclasscheck__(self, subclass: object) -> bool:
-        return issubclass(subclass, self.__class__)
 
-    def __call__(self, *args, **kwargs) -> Dict[str, Any]:
-        """
-        If the user has added the called object(s), all called objects are called and all parameters that are
-        specified when the instance is called are passed. A dictionary is returned with the name of the called object
-        and the value that it returns.
-        """
-        callable_obj: List[Callable[[Any], Any]] = []
-        result_funcs: Dict[str, Any] = {}
+class AllTypesStore:
+    """
+    Append-only file of AllTypes records, read through mmap. The data file starts with MAGIC and holds the records
+    encoded by RecordCodec one after another; the index file (path + '.index') holds the offset of every record as
+    unsigned 8 bytes. Opening maps both files and reads nothing else, so it takes the same time for any size, and only
+    the pages of the records read are loaded. A record is written before its offset, so a record cut by a crash is
+    not in the index and is overwritten by the next append.
+
+    store[i] decodes record i into an instance of record_class, store[i:j] gives a list, iteration goes over all of
+    them. store.append(obj) and store.extend(objs) write at the end in the 'a' mode. A store opened for reading sees
+    the records appended later by another store: len(), indexing and iteration look at the size of the index file, and
+    the files are mapped again when a record after the mapped ones is read.
+    """
+    MAGIC: bytes = b'ATSTORE1'
+    OFFSET: struct.Struct = struct.Struct('<Q')
+
+    def __init__(self, path: str, mode: str = 'r', record_class: type = None) -> None:
+        if mode not in ('r', 'a'):
+            raise ValueError(f"mode must be 'r' or 'a', not {mode!r}")
+        self.path: str = path
+        self.index_path: str = path + '.index'
+        self.mode: str = mode
+        self.record_class: type = AllTypes if record_class is None else record_class
+        self._writers: List[Callable[[Any, Any], None]] = self.record_class._field_writers()
+        if mode == 'a' and not os.path.exists(path):
+            with open(path, 'wb') as file:
+                file.write(self.MAGIC)
+            open(self.index_path, 'wb').close()
+        self._data: IO = open(path, 'r+b' if mode == 'a' else 'rb')
+        if self._data.read(len(self.MAGIC)) != self.MAGIC:
+            self._data.close()
+            raise ValueError(f'{path} is not an AllTypesStore file')
+        try:
+            self._index: IO = open(self.index_path, 'r+b' if mode == 'a' else 'rb')
+        except OSError:
+            self._data.close()
+            raise
+        self._length: int = os.fstat(self._index.fileno()).st_size // self.OFFSET.size
+        self._data_maps: Tuple[mmap.mmap, memoryview] = None
+        self._index_maps: Tuple[mmap.mmap, memoryview] = None
+        self._map()
 
-        for obj in self.__dict__.values():
-            if callable(obj):
-                callable_obj.append(obj)
-        if callable_obj:
-            for call_obj in callable_obj:
-                result_funcs[call_obj.__name__] = call_obj(*args, **kwargs)
-        return result_funcs
+    @classmethod
+    def open(cls, path: str, mode: str = 'r', record_class: type = None) -> 'AllTypesStore':
+        """Open the store at path: 'r' - to read, 'a' - to read and append, creating the files if they do not exist."""
+        return cls(path, mode, record_class)
+
+    def _map(self) -> None:
+        """Map the files again, after appends made them longer."""
+        self._unmap()
+        if self._length:
+            maps: List[Tuple[mmap.mmap, memoryview]] = []
+            for file in (self._data, self._index):
+                file_map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                maps.append((file_map, memoryview(file_map)))
+            self._data_maps, self._index_maps = maps
+        self._mapped: int = self._length
+
+    def _unmap(self) -> None:
+        for maps in (self._data_maps, self._index_maps):
+            if maps is not None:
+                maps[1].release()
+                maps[0].close()
+        self._data_maps = self._index_maps = None
+
+    def _refresh(self) -> int:
+        """Take the records appended since the last call into account, return the number of records."""
+        # A writer writes the offset of a record after the record, so every indexed record is complete.
+        length: int = os.fstat(self._index.fileno()).st_size // self.OFFSET.size
+        if length > self._length:
+            self._length = length
+        return self._length
 
-    # Context manager
-    def __enter__(self) -> Tuple[FileObj]:
-        """Looks for an object that has the attribute "close", and returns a list of these objects."""
-        file_obj: FileObj = []
-        for obj in self.__dict__.values():
-            if hasattr(obj, 'close'):
-                file_obj.append(obj)
-        return tuple(file_obj)
+    def __len__(self) -> int:
+        return self._refresh()
+
+    def _offset(self, index: int) -> int:
+        return self.OFFSET.unpack_from(self._index_maps[1], index * self.OFFSET.size)[0]
+
+    def _record(self, index: int) -> ClassInstance:
+        if index >= self._mapped:
+            self._map()
+        values, _ = RecordCodec.decode_record(self._data_maps[1], self._offset(index))
+        return self.record_class._from_values(values, self._writers)
+
+    def __getitem__(self, item: int or slice) -> ClassInstance or List[ClassInstance]:
+        if isinstance(item, slice):
+            return [self._record(index) for index in range(self._refresh())[item]]
+        length: int = self._refresh()
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError('store index out of range')
+        return self._record(item)
+
+    def __iter__(self) -> Iterator[ClassInstance]:
+        index: int = 0
+        while index < self._length or index < self._refresh():
+            yield self._record(index)
+            index += 1
+
+    def append(self, instance: ClassInstance) -> int:
+        """Write the instance at the end of the store, return its index."""
+        self.extend((instance,))
+        return self._length - 1
+
+    def extend(self, instances: Iterable[ClassInstance]) -> None:
+        """Write the instances at the end of the store."""
+        if self.mode != 'a':
+            raise ValueError("The store is opened for reading, open it with mode='a' to append")
+        # After the last indexed record: a record that was written without its offset is dropped.
+        end: int = len(self.MAGIC)
+        if self._length:
+            if self._length > self._mapped:
+                self._map()
+            end = RecordCodec.decode_record(self._data_maps[1], self._offset(self._length - 1))[1]
+        records: bytearray = bytearray()
+        offsets: bytearray = bytearray()
+        for instance in instances:
+            owner: type = type(instance)
+            offsets += self.OFFSET.pack(end + len(records))
+            records += RecordCodec.encode_record([getattr(owner, name).stored(instance) for name in NAME_ALL_TYPES])
+        self._data.seek(end)
+        self._data.write(records)
+        self._data.truncate()
+        self._data.flush()
+        self._index.seek(self._length * self.OFFSET.size)
+        self._index.write(offsets)
+        self._index.flush()
+        self._length += len(offsets) // self.OFFSET.size
+
+    def close(self) -> None:
+        self._unmap()
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self) -> 'AllTypesStore':
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Looks for an object that has the attribute "close", and call method "close"."""
-        for obj in self.__dict__.values():
-            if hasattr(obj, 'close'):
-                obj.close()
-    # End context manager
-
-    def __copy__(self) -> ClassInstance:
-        copy_obj = AllTypes()
-        copy_obj.__dict__ = self.__dict__.copy()
-        return copy_obj
+        self.close()
 
-    def __deepcopy__(self, memodict={}) -> ClassInstance:
-        deepcopy_obj = AllTypes()
-        deepcopy_obj.__dict__ = self.deepcopy(self.__dict__)
-        return deepcopy_obj
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.path!r} of {self._length} records>'
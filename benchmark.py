@@ -0,0 +1,299 @@
+#!usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""                                              Benchmark modulo.
+Measurements of the all_types modulo. Run it as a script to print the results in JSON: python benchmark.py
+
+Every operator of AllTypes (forward, reflected and in-place arithmetic, the six comparisons, hash, iteration, indexing,
+copies and construction, with and without define_max_instance) is timed with fields of the small, medium and large
+size. The results can be saved and used as the baseline of a later run, which then lists the regressions:
+    python benchmark.py --output before.json
+    python benchmark.py --baseline before.json --threshold 0.2
+The exit code is 1 when an operator became slower than the baseline by more than the threshold. With --parallel the
+scaling of AllTypes.parallel_map from 1 to 16 workers is measured too, with --serialization the records per second of
+AllTypes.dump_many and load_many against pickle, with --intern the memory saved by AllTypes.intern.
+"""
+
+import argparse
+import io
+import json
+import os
+import pickle
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from copy import copy, deepcopy
+from typing import Any, Callable, Dict, IO, Iterable, List
+
+from all_types import AllTypes, BaseAllTypes, CompactAllTypes
+
+__author__ = '©Pushok8'
+
+# Annotation
+Report = Dict[str, Any]
+Setup = Callable[[AllTypes, Dict[str, Any]], Callable[[], Any]]
+
+SAMPLE: Dict[str, Any] = dict(boolean=False, integer=4, float_num=-2.5, complex_num=(3-2j), string='sing',
+                              array=[1, 4], tuple_=(6, 1), dictionary={5: '5'}, set_={1, 6},
+                              frozenset_=frozenset([12, 5]))
+
+
+def instance_size(instance: BaseAllTypes) -> int:
+    """sys.getsizeof of the instance plus its __dict__, if it has one. The values of the fields are not counted."""
+    size: int = sys.getsizeof(instance)
+    if '__dict__' in dir(type(instance)):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def traced_size(cls: type, count: int) -> float:
+    """Average number of bytes allocated by tracemalloc for one of count instances, the fields values included."""
+    tracemalloc.start()
+    start: int = tracemalloc.get_traced_memory()[0]
+    instances = [cls(**SAMPLE) for _ in range(count)]
+    size: int = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return size / count
+
+
+def compare_memory(count: int = 10000) -> Report:
+    """Compare the memory taken by one instance of AllTypes and of CompactAllTypes."""
+    report: Report = {}
+    for cls in (AllTypes, CompactAllTypes):
+        report[cls.__name__] = {'getsizeof': instance_size(cls(**SAMPLE)), 'tracemalloc': traced_size(cls, count)}
+    report['saving'] = {key: report['AllTypes'][key] - report['CompactAllTypes'][key]
+                        for key in ('getsizeof', 'tracemalloc')}
+    return report
+
+
+def parallel_scaling(count: int = 200000, workers: Iterable[int] = (1, 2, 4, 8, 16), symbol: str = '**',
+                     operand: Any = 2, chunksize: int = 4096) -> Report:
+    """
+    Time AllTypes.parallel_map over count instances for every number of workers. The speedup is the time with one
+    worker divided by the time with n workers, the efficiency is the speedup divided by n (1.0 is perfect scaling).
+    More workers than cpu_count only share the same cores.
+    """
+    instances: List[AllTypes] = [AllTypes(**SAMPLE) for _ in range(count)]
+    report: Report = {'cpu_count': os.cpu_count(), 'count': count, 'operator': symbol, 'workers': {}}
+    single: float = None
+    for number in workers:
+        start: float = time.perf_counter()
+        AllTypes.parallel_map(instances, symbol, operand, workers=number, chunksize=chunksize)
+        seconds: float = time.perf_counter() - start
+        single = single or seconds
+        report['workers'][number] = {'seconds': round(seconds, 4), 'speedup': round(single / seconds, 3),
+                                     'efficiency': round(single / seconds / number, 3)}
+    return report
+
+
+def serialization_throughput(count: int = 50000) -> Report:
+    """Records per second and bytes per record of AllTypes.dump_many/load_many and of pickle, for count records."""
+    # Distinct values: pickle would store the shared ones only once.
+    instances: List[AllTypes] = [AllTypes(bool(i % 2), i, i / 7, complex(i, -i), f'string {i}', [i, i + 1], (i, -i),
+                                          {i: str(i)}, {i, 2 * i}, frozenset([-i])) for i in range(count)]
+    report: Report = {'count': count}
+
+    def measure(dump: Callable[[IO], Any], load: Callable[[IO], Any]) -> Report:
+        file: io.BytesIO = io.BytesIO()
+        start: float = time.perf_counter()
+        dump(file)
+        dumped: float = time.perf_counter() - start
+        file.seek(0)
+        start = time.perf_counter()
+        load(file)
+        loaded: float = time.perf_counter() - start
+        return {'dump_records_per_s': round(count / dumped), 'load_records_per_s': round(count / loaded),
+                'bytes_per_record': round(len(file.getvalue()) / count, 1)}
+
+    report['all_types'] = measure(lambda file: AllTypes.dump_many(instances, file),
+                                  lambda file: list(AllTypes.load_many(file)))
+    report['pickle'] = measure(lambda file: pickle.dump(instances, file, pickle.HIGHEST_PROTOCOL),
+                               lambda file: pickle.load(file))
+    return report
+
+
+def intern_memory(count: int = 20000, distinct: int = 100) -> Report:
+    """
+    Bytes allocated by tracemalloc for count records built from distinct templates, every record with its own objects
+    (as if read from a file), without interning and with AllTypes.intern. The duplicated corpus repeats whole records,
+    the other one differs in the integer field of every record, so only the values of the other fields are shared.
+    """
+    def record(index: int, unique: int) -> AllTypes:
+        number: int = index % distinct
+        return AllTypes(bool(number % 2), unique, number / 7, complex(number, -1), f'string {number}' * 4,
+                        [number, number + 1], (number, str(number)), {'key': number}, {number}, frozenset([-number]))
+
+    def traced(make: Callable[[int], AllTypes]) -> int:
+        tracemalloc.start()
+        start: int = tracemalloc.get_traced_memory()[0]
+        instances: List[AllTypes] = [make(index) for index in range(count)]
+        size: int = tracemalloc.get_traced_memory()[0] - start
+        tracemalloc.stop()
+        del instances
+        return size
+
+    report: Report = {'count': count, 'distinct': distinct}
+    for corpus, unique in (('duplicated', lambda index: 0), ('shared_values', lambda index: 10 ** 6 + index)):
+        plain: int = traced(lambda index: record(index, unique(index)))
+        interned: int = traced(lambda index: AllTypes.intern(record(index, unique(index))))
+        report[corpus] = {'plain_bytes': plain, 'interned_bytes': interned,
+                          'reduction': round(1 - interned / plain, 3)}
+    return report
+
+
+# Number of items of the string, array, tuple_, dictionary, set_ and frozenset_ fields.
+SIZES: Dict[str, int] = {'small': 1, 'medium': 100, 'large': 10000}
+# Operands of the forward and reflected operators: numbers, as in obj + 3.
+OPERANDS: Dict[str, Any] = {'+': 3, '-': 3, '*': 3, '/': 3, '//': 3, '%': 3, 'divmod': 3, '**': 2, '<<': 2, '>>': 2,
+                            '&': 3, '|': 3, '^': 3}
+# Operands of the in-place operators, they keep the fields the same size, so repeated calls on one instance take the
+# same time.
+INPLACE_OPERANDS: Dict[str, Any] = {'+': '', '-': set(), '*': 1, '/': 1, '//': 1, '%': 1, '**': 1, '<<': 0, '>>': 0,
+                                    '&': set(), '|': set(), '^': set()}
+FORWARD: Dict[str, str] = {'+': '__add__', '-': '__sub__', '*': '__mul__', '/': '__truediv__', '//': '__floordiv__',
+                           '%': '__mod__', 'divmod': '__divmod__', '**': '__pow__', '<<': '__lshift__',
+                           '>>': '__rshift__', '&': '__and__', '|': '__or__', '^': '__xor__'}
+INPLACE: Dict[str, str] = {symbol: '__i' + name[2:] for symbol, name in FORWARD.items() if symbol != 'divmod'}
+COMPARISONS: Dict[str, str] = {'==': '__eq__', '!=': '__ne__', '<': '__lt__', '>': '__gt__', '<=': '__le__',
+                               '>=': '__ge__'}
+# Operand of the comparisons, every field is compared with it, as in obj < 2.5.
+COMPARED: float = 2.5
+
+
+def sized_sample(size: int) -> Dict[str, Any]:
+    """Values of the ten fields, the containers have size items."""
+    return dict(boolean=True, integer=size, float_num=size / 3, complex_num=complex(size, -1), string='s' * size,
+                array=list(range(size)), tuple_=tuple(range(size)), dictionary={i: str(i) for i in range(size)},
+                set_=set(range(size)), frozenset_=frozenset(range(size)))
+
+
+def pooled_construction(instance: AllTypes, sample: Dict[str, Any]) -> Callable[[], Any]:
+    """
+    Construction through define_max_instance, in a subclass made once so that AllTypes keeps its own limit. A class
+    takes define_max_instance only once, so the flag that records it is reset before every call.
+    """
+    pooled: type = type('PooledAllTypes', (AllTypes,), {})
+
+    def construct() -> Any:
+        pooled._max_val_is_changed = False
+        return pooled.define_max_instance(1, **sample)
+    return construct
+
+
+def operations() -> Dict[str, Setup]:
+    """Name of every timed operation and the function that prepares the call timed on an instance."""
+    setups: Dict[str, Setup] = {}
+    for symbol, name in FORWARD.items():
+        operand: Any = OPERANDS[symbol]
+        setups[name] = lambda instance, sample, name=name, operand=operand: lambda: getattr(instance, name)(operand)
+        reflected: str = '__r' + name[2:]
+        setups[reflected] = lambda instance, sample, name=reflected, operand=operand: \
+            lambda: getattr(instance, name)(operand)
+    for symbol, name in INPLACE.items():
+        operand = INPLACE_OPERANDS[symbol]
+        setups[name] = lambda instance, sample, name=name, operand=operand: lambda: getattr(instance, name)(operand)
+    for name in COMPARISONS.values():
+        setups[name] = lambda instance, sample, name=name: lambda: getattr(instance, name)(COMPARED)
+    setups.update({
+        '__hash__': lambda instance, sample: lambda: hash(instance),
+        '__iter__': lambda instance, sample: lambda: list(instance),
+        '__getitem__': lambda instance, sample: lambda: instance[5],
+        '__copy__': lambda instance, sample: lambda: copy(instance),
+        '__deepcopy__': lambda instance, sample: lambda: deepcopy(instance),
+        '__init__': lambda instance, sample: lambda: AllTypes(**sample),
+        'define_max_instance': pooled_construction,
+    })
+    return setups
+
+
+def time_call(call: Callable[[], Any], repeat: int = 5, duration: float = 0.02) -> Report:
+    """Best and median time of one call in microseconds, from repeat rounds of about duration seconds each."""
+    timer: timeit.Timer = timeit.Timer(call)
+    number: int = max(1, int(duration / max(timer.timeit(1), 1e-9)))
+    times: List[float] = [total / number * 1e6 for total in timer.repeat(repeat, number)]
+    return {'best_us': round(min(times), 3), 'median_us': round(statistics.median(times), 3), 'number': number}
+
+
+def run_operators(sizes: Iterable[str] = tuple(SIZES), names: Iterable[str] = None, repeat: int = 5) -> Report:
+    """
+    Time the operations (all of them if names is None) for every size. The key of a result is "name/size", an
+    operation that raises is reported with the error instead of the times.
+    """
+    setups: Dict[str, Setup] = operations()
+    report: Report = {}
+    for size_name in sizes:
+        sample: Dict[str, Any] = sized_sample(SIZES[size_name])
+        for name in (setups if names is None else names):
+            # Every operation gets its own instance: the in-place operators change it.
+            instance: AllTypes = AllTypes(**sample)
+            call: Callable[[], Any] = setups[name](instance, sample)
+            try:
+                call()
+            except Exception as error:
+                report[f'{name}/{size_name}'] = {'error': f'{error.__class__.__name__}: {error}'}
+                continue
+            report[f'{name}/{size_name}'] = time_call(call, repeat)
+    return report
+
+
+def compare_baseline(current: Report, baseline: Report, threshold: float = 0.1) -> Report:
+    """
+    Compare the best times with the ones of the baseline. An operation is a regression when it is slower than the
+    baseline by more than threshold (0.1 is 10 %), and an improvement when it is faster by more than threshold.
+    """
+    regressions: List[Report] = []
+    improvements: List[Report] = []
+    for key, result in current.items():
+        before: Report = baseline.get(key, {})
+        if 'best_us' not in result or 'best_us' not in before:
+            continue
+        ratio: float = result['best_us'] / max(before['best_us'], 1e-9)
+        entry: Report = {'name': key, 'baseline_us': before['best_us'], 'current_us': result['best_us'],
+                         'ratio': round(ratio, 3)}
+        if ratio > 1 + threshold:
+            regressions.append(entry)
+        elif ratio < 1 - threshold:
+            improvements.append(entry)
+    return {'threshold': threshold, 'regressions': regressions, 'improvements': improvements}
+
+
+def main(argv: List[str] = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Benchmark of the all_types modulo.')
+    parser.add_argument('--sizes', nargs='+', choices=tuple(SIZES), default=tuple(SIZES))
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='time only these operations, e.g. __add__ __eq__')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', help='JSON file written by an earlier run with --output')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown, 0.1 is 10 %%')
+    parser.add_argument('--output', help='also write the results to this JSON file')
+    parser.add_argument('--no-memory', action='store_true', help='skip the memory comparison')
+    parser.add_argument('--parallel', action='store_true', help='also measure the scaling of AllTypes.parallel_map')
+    parser.add_argument('--serialization', action='store_true', help='also compare AllTypes.dump_many with pickle')
+    parser.add_argument('--intern', action='store_true', help='also measure the memory saved by AllTypes.intern')
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    results: Report = {'python': platform.python_version(), 'sizes': {name: SIZES[name] for name in args.sizes},
+                       'operators': run_operators(args.sizes, args.only, args.repeat)}
+    if not args.no_memory:
+        results['memory'] = compare_memory()
+    if args.parallel:
+        results['parallel'] = parallel_scaling()
+    if args.serialization:
+        results['serialization'] = serialization_throughput()
+    if args.intern:
+        results['intern'] = intern_memory()
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline: Report = json.load(file)
+        results['comparison'] = compare_baseline(results['operators'], baseline['operators'], args.threshold)
+    print(json.dumps(results, indent=2))
+    return 1 if results.get('comparison', {}).get('regressions') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+import pytest
+
+from all_types import AllTypes, CompactAllTypes
+
+
+@pytest.fixture(params=[AllTypes, CompactAllTypes])
+def cls(request):
+    """Both classes of records, every test taking cls runs for each of them."""
+    return request.param
+
+
+@pytest.fixture
+def subclass(cls):
+    """A new subclass of cls, so that the class settings changed by a test do not leak into the other tests."""
+    class Subclass(cls):
+        __slots__ = ()
+    return Subclass
+
+
+@pytest.fixture
+def reads(cls, monkeypatch):
+    """Names of the fields read through their descriptors, by attribute access or by the readers of the kernels."""
+    names = []
+    descriptor = type(getattr(cls, 'string'))
+
+    def recording(read):
+        def method(self, instance, *args):
+            if instance is not None:
+                names.append(self._name)
+            return read(self, instance, *args)
+        return method
+    for method_name in ('__get__', 'stored', 'raw', 'own'):
+        monkeypatch.setattr(descriptor, method_name, recording(getattr(descriptor, method_name)))
+    return names
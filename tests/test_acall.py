@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from all_types import AllTypes
+
+
+def test_calls_run_together_and_give_the_dictionary_of_obj_call():
+    async def wait(seconds):
+        await asyncio.sleep(seconds)
+        return 'async'
+
+    def block(seconds):
+        time.sleep(seconds)
+        return 'thread'
+
+    obj = AllTypes()
+    obj.first, obj.second, obj.third = wait, block, block
+    start = time.monotonic()
+    results = asyncio.run(obj.acall(0.2))
+    assert time.monotonic() - start < 0.5
+    assert results == {'wait': 'async', 'block': 'thread'}
+
+
+def test_exceptions_and_timeouts_are_returned():
+    async def slow():
+        await asyncio.sleep(1)
+
+    def fail():
+        raise KeyError('k')
+
+    def ok():
+        return 1
+
+    obj = AllTypes()
+    obj.slow, obj.fail, obj.ok = slow, fail, ok
+    results = asyncio.run(obj.acall(timeout=0.05))
+    assert isinstance(results['slow'], asyncio.TimeoutError)
+    assert isinstance(results['fail'], KeyError)
+    assert results['ok'] == 1
+
+
+def test_no_callable_gives_an_empty_dictionary():
+    assert asyncio.run(AllTypes(integer=1).acall()) == {}
@@ -0,0 +1,34 @@
+from all_types import NAME_ALL_TYPES
+
+VALUES = (True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1, 5}, frozenset({2}))
+
+
+def test_results_are_the_operator_results(cls):
+    obj = cls(*VALUES)
+    results = obj.apply_many([('==', 4), ('<', 2.5), ('+', 'x'), ('&', {1, 2}), ('**', 2, 'left', 3),
+                              ('-', 10, 'right'), ('|', {9}), ('divmod', 3)])
+    assert results == [obj == 4, obj < 2.5, obj + 'x', obj & {1, 2}, pow(obj, 2, 3), 10 - obj, obj | {9},
+                       divmod(obj, 3)]
+
+
+def test_errors_are_given_in_place_of_the_results(cls):
+    obj = cls(*VALUES)
+    results = obj.apply_many([('/', 0), ('bogus', 1), ('+', 1, 'equally'), ('*', 2)])
+    assert isinstance(results[0], ZeroDivisionError)
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], ValueError)
+    assert results[3] == obj * 2
+    assert tuple(obj) == VALUES
+
+
+def test_results_are_tuples_in_every_result_mode(subclass):
+    subclass.set_result_mode('lazy')
+    obj = subclass(*VALUES)
+    assert type(obj.apply_many([('+', 1)])[0]) is tuple
+
+
+def test_fields_are_read_once(subclass, reads):
+    obj = subclass(*VALUES)
+    reads.clear()
+    obj.apply_many([('+', 1), ('*', 2), ('&', {1}), ('==', 4)])
+    assert sorted(reads) == sorted(NAME_ALL_TYPES)
@@ -0,0 +1,34 @@
+import pytest
+
+from all_types import AllTypesOperators
+
+
+@pytest.fixture
+def obj(cls):
+    return cls(True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1}, frozenset({2}))
+
+
+def test_operators_of_the_fields(obj):
+    assert obj + 1 == (2, 5, -1.5, 4 - 2j)
+    assert 1 - obj == (0, -3, 3.5, -2 + 2j)
+    assert obj * 2 == (2, 8, -5.0, 6 - 4j, 'abab', [1, 1], (2, 2))
+    assert divmod(obj, 3) == ((0, 1), (1, 1), (-1.0, 0.5))
+    assert pow(obj, 2, 5) == (1, 1, 4)
+    assert obj << 1 == (2, 8, -4)
+
+
+def test_set_operand_converts_every_field(obj):
+    assert obj - {1} == (set(), {4}, {-2.5}, {3 - 2j}, {'a', 'b'}, set(), {2}, set(), set(), {2})
+
+
+def test_kernels_are_built_once(obj):
+    obj + 1
+    kernel = AllTypesOperators._kernels[('+', 'left', int)]
+    obj + 2
+    assert AllTypesOperators._kernels[('+', 'left', int)] is kernel
+
+
+def test_unknown_operator_raises_and_is_not_cached(obj):
+    with pytest.raises(ValueError):
+        obj._arithmetic(1, 'bogus')
+    assert not [key for key in AllTypesOperators._kernels if key[0] == 'bogus']
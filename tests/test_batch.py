@@ -0,0 +1,48 @@
+import pytest
+
+from all_types import AllTypesBatch, CompactAllTypes
+
+
+@pytest.fixture
+def records(cls):
+    return [cls(True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1}, frozenset({2})),
+            cls(False, 2 ** 70, 1.5, 1j, '', [], (), {}, set(), frozenset()),
+            cls(integer=-3, string='x', set_={5})]
+
+
+@pytest.mark.parametrize('operand', [3, 2.5, 'x', [1], {1}])
+@pytest.mark.parametrize('symbol', ['+', '-', '*', '<<', '&'])
+def test_columns_match_the_records(records, symbol, operand):
+    batch = AllTypesBatch(records)
+    for layout in ('left', 'right'):
+        expected = []
+        for record in records:
+            try:
+                expected.append(record._arithmetic(operand, symbol, layout))
+            except Exception as error:
+                expected.append(type(error))
+        if any(isinstance(result, type) for result in expected):
+            with pytest.raises(Exception):
+                batch._arithmetic(operand, symbol, layout)
+            continue
+        columns = batch._arithmetic(operand, symbol, layout)
+        assert [tuple(column[j] for column in columns) for j in range(len(records))] == expected
+
+
+def test_comparisons_match_the_records(records):
+    columns = AllTypesBatch(records) < 2
+    assert [tuple(column[j] for column in columns) for j in range(len(records))] == [r < 2 for r in records]
+
+
+def test_records_come_back(records):
+    batch = AllTypesBatch(records)
+    assert len(batch) == 3
+    assert batch.column('integer') == [4, 2 ** 70, -3]
+    assert [record.all_types for record in batch.to_instances(CompactAllTypes)] == [r.all_types for r in records]
+    assert batch[1].all_types == records[1].all_types
+
+
+def test_in_place_operators_raise(records):
+    batch = AllTypesBatch(records)
+    with pytest.raises(TypeError):
+        batch += 1
@@ -0,0 +1,36 @@
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+
+@pytest.fixture
+def obj(cls):
+    return cls(True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1}, frozenset({2}))
+
+
+@pytest.mark.parametrize('symbol', ['+', '-', '*', '/', '//', '**', '<<', '>>', '&', '==', '<='])
+@pytest.mark.parametrize('layout', ['left', 'right'])
+def test_items_match_the_scalar_operator(obj, symbol, layout):
+    operands = numpy.array([1, 2, 3])
+    columns = obj.broadcast(symbol, operands, layout)
+    for index, operand in enumerate(operands.tolist()):
+        expected = obj._comparison(operand, symbol) if symbol in ('==', '<=') else \
+            obj._arithmetic(operand, symbol, layout)
+        assert tuple(column[index] for column in columns) == expected
+
+
+def test_operators_with_an_array_broadcast(obj):
+    operands = numpy.array([1.5, -2.0])
+    assert [list(column) for column in obj + operands] == [list(column) for column in obj.broadcast('+', operands)]
+    assert [list(column) for column in operands * obj] == \
+        [list(column) for column in obj.broadcast('*', operands, 'right')]
+
+
+def test_division_by_zero_raises_as_in_python(obj):
+    with pytest.raises(ZeroDivisionError):
+        obj.broadcast('/', numpy.array([1, 0]))
+
+
+def test_in_place_operators_can_not_broadcast(obj):
+    with pytest.raises(TypeError):
+        obj.broadcast('+', numpy.array([1]), 'equally')
@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+from all_types import AllTypes
+
+VALUES = (True, 2 ** 70, -1.5, 1 - 2j, 'strß', [1, 'a', (2, 3), 2 ** 80, b'x', None, 1.5, 1j, {1}], (None, b'x'),
+          {'k': [1]}, {1, 'q'}, frozenset({2.5}))
+
+
+def test_bytes_round_trip(cls):
+    obj = cls(*VALUES)
+    assert cls.from_bytes(obj.to_bytes()).all_types == VALUES
+
+
+def test_default_instance_round_trip(cls):
+    assert cls.from_bytes(cls().to_bytes()).all_types == cls().all_types
+
+
+def test_dump_many_and_load_many(cls):
+    records = [cls(*VALUES)] + [cls(integer=index, string=str(index)) for index in range(100)]
+    file = io.BytesIO()
+    assert cls.dump_many(records, file) == len(records)
+    file.seek(0)
+    assert [record.all_types for record in cls.load_many(file, buffer_size=64)] == \
+        [record.all_types for record in records]
+
+
+def test_truncated_record_raises_value_error():
+    data = AllTypes(*VALUES).to_bytes()
+    for size in range(len(data)):
+        with pytest.raises(ValueError):
+            AllTypes.from_bytes(data[:size])
+
+
+def test_malformed_record_raises_value_error():
+    data = AllTypes(string='abc', array=[1, 'x']).to_bytes()
+    with pytest.raises(ValueError):
+        AllTypes.from_bytes(data + b'\0')
+    with pytest.raises(ValueError):
+        AllTypes.from_bytes(b'\x70' + data[1:])
+    file = io.BytesIO()
+    AllTypes.dump_many([AllTypes()], file)
+    with pytest.raises(ValueError):
+        list(AllTypes.load_many(io.BytesIO(file.getvalue()[:-1])))
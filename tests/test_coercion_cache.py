@@ -0,0 +1,63 @@
+import pytest
+
+from all_types import CoercionCache, LRUCache, ResultCache
+
+VALUES = (True, 4, -2.5, 3 - 2j, 'ab', [1, 3], (2, 3), {1: 2, 3: 4}, {1, 3}, frozenset({3}))
+OPERANDS = [{3}, frozenset({1, 2}), [9], (9,), (1, 2)]
+
+
+def outcome(call):
+    try:
+        return 'ok', call()
+    except Exception as error:
+        return 'error', type(error)
+
+
+@pytest.fixture
+def cached_class(subclass):
+    subclass.enable_coercion_cache(maxsize=4)
+    return subclass
+
+
+def test_same_results_as_without_the_cache(cls, cached_class):
+    plain, cached = cls(*VALUES), cached_class(*VALUES)
+    for operand in OPERANDS:
+        for call in (lambda obj: obj & operand, lambda obj: obj - operand, lambda obj: operand | obj,
+                     lambda obj: obj + operand, lambda obj: obj == operand, lambda obj: obj < operand):
+            assert outcome(lambda: call(cached)) == outcome(lambda: call(plain))
+            assert outcome(lambda: call(cached)) == outcome(lambda: call(plain))
+
+
+def test_repeated_conversions_hit(cached_class):
+    obj = cached_class(*VALUES)
+    obj & {3}
+    assert cached_class.coercion_cache_info()['misses'] == 1
+    obj & {4}
+    {5} - obj
+    assert cached_class.coercion_cache_info()['hits'] == 2
+
+
+def test_a_write_invalidates_the_conversions(cached_class):
+    obj = cached_class(*VALUES)
+    assert (obj & {3})[5] == {3}
+    obj.array = [4]
+    assert (obj & {3})[5] == set()
+    obj += [3]
+    assert (obj & {3})[5] == {3}
+
+
+def test_least_recently_used_entries_are_evicted(cached_class):
+    objects = [cached_class(integer=index) for index in range(6)]
+    for obj in objects:
+        obj & {1}
+    info = cached_class.coercion_cache_info()
+    assert info['size'] == 4 and info['evictions'] == 2
+
+
+def test_caches_share_the_lru_base():
+    assert issubclass(ResultCache, LRUCache) and issubclass(CoercionCache, LRUCache)
+    cache = CoercionCache(maxsize=1)
+    cache.clear()
+    assert cache.info() == {'hits': 0, 'misses': 0, 'evictions': 0, 'bypasses': 0, 'size': 0, 'maxsize': 1}
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.fixture
+def obj(cls):
+    return cls(True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1}, frozenset({2}))
+
+
+def test_number_operand_compares_the_numbers(obj):
+    assert (obj == 4) == (False, True, False)
+    assert (obj < 3) == (True, False, True)
+    assert (obj != 4) == (True, False, True)
+
+
+def test_container_operand_compares_every_field(obj):
+    assert (obj == [1]) == (True, False, False, False, False, True, False, True, True, False)
+
+
+def test_unknown_comparison_raises(obj):
+    with pytest.raises(NameError):
+        obj._comparison(1, '~')
@@ -0,0 +1,41 @@
+from copy import copy, deepcopy
+
+from all_types import CompactAllTypes
+
+
+def test_copy_and_original_do_not_alias(cls):
+    obj = cls(array=[1], dictionary={'k': 1}, set_={1})
+    duplicate = copy(obj)
+    duplicate += [3]
+    duplicate.dictionary = {'k': 2}
+    assert obj.array == [1] and obj.dictionary == {'k': 1} and obj.set_ == {1}
+    assert duplicate.array == [1, 3] and duplicate.dictionary == {'k': 2}
+    obj -= {1}
+    assert obj.set_ == set() and duplicate.set_ == {1, 3}
+
+
+def test_direct_reads_end_the_sharing(subclass):
+    subclass.set_read_mode('direct')
+    obj = subclass(array=[1])
+    duplicate = copy(obj)
+    duplicate.array.append(2)
+    assert obj.array == [1] and duplicate.array == [1, 2]
+
+
+def test_deepcopy_copies_nested_containers(cls):
+    obj = cls(array=[[1]], dictionary={'k': [1]}, tuple_=([1],))
+    duplicate = deepcopy(obj)
+    duplicate.array[0].append(2)
+    duplicate.dictionary['k'].append(2)
+    duplicate.tuple_[0].append(2)
+    assert obj.array == [[1]] and obj.dictionary == {'k': [1]} and obj.tuple_ == ([1],)
+
+
+def test_copy_keeps_the_slots_of_a_subclass():
+    class Extended(CompactAllTypes):
+        __slots__ = ('extra', 'items')
+    obj = Extended(integer=3)
+    obj.extra, obj.items = 'e', [1]
+    for duplicate in (copy(obj), deepcopy(obj)):
+        assert (duplicate.extra, duplicate.items, duplicate.integer) == ('e', [1], 3)
+    assert deepcopy(obj).items is not obj.items
@@ -0,0 +1,80 @@
+import operator
+
+import pytest
+
+VALUES = (True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1, 5}, frozenset({2}))
+SYMBOLS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv, '//': operator.floordiv,
+           '%': operator.mod, '**': operator.pow, '<<': operator.lshift, '&': operator.and_, '|': operator.or_,
+           '<': operator.lt, '==': operator.eq}
+OPERANDS = [3, -0.5, 2j, 'x', [1], (1,), {1}]
+
+
+def outcome(call):
+    try:
+        return 'ok', call()
+    except Exception as error:
+        return 'error', type(error)
+
+
+def apply(target, symbol, operand):
+    """The operator on an instance or an expression, through its magic method."""
+    if symbol in ('<', '=='):
+        return target._comparison(operand, symbol)
+    return target._arithmetic(operand, symbol)
+
+
+def by_hand(obj, steps):
+    """The first operator on the instance, the next ones on every item of the previous result."""
+    (symbol, operand), rest = steps[0], steps[1:]
+    values = apply(obj, symbol, operand)
+    for symbol, operand in rest:
+        values = tuple(SYMBOLS[symbol](value, operand) for value in values)
+    return values
+
+
+@pytest.mark.parametrize('first', [('+', 3), ('-', -0.5), ('*', 2), ('+', [1]), ('-', {1}), ('+', 'x'), ('<', 3)])
+@pytest.mark.parametrize('symbol', list(SYMBOLS))
+def test_evaluate_matches_the_chain_by_hand(cls, first, symbol):
+    obj = cls(*VALUES)
+    for operand in OPERANDS:
+        expression = apply(apply(obj.expr(), *first), symbol, operand)
+        assert outcome(expression.evaluate) == outcome(lambda: by_hand(obj, [first, (symbol, operand)]))
+
+
+def test_three_steps(cls):
+    obj = cls(*VALUES)
+    assert ((obj.expr() + 3) * 2 - 1).evaluate() == by_hand(obj, [('+', 3), ('*', 2), ('-', 1)])
+    assert ((obj.expr() + 3) * 2 - 1).evaluate() == (7, 13, 0.0, 11 - 4j)
+
+
+def test_intermediate_of_another_type_raises(cls):
+    obj = cls(*VALUES)
+    with pytest.raises(TypeError):
+        ((obj.expr() - 0.5) << 1).evaluate()
+    with pytest.raises(TypeError):
+        ((obj.expr() + [1]) - {1}).evaluate()
+
+
+def test_reflected_and_modulo_steps(cls):
+    obj = cls(*VALUES)
+    assert (10 - (obj.expr() + 1)).evaluate() == tuple(10 - value for value in obj + 1)
+    with pytest.raises(TypeError):
+        tuple(pow(value, 2, 7) for value in obj + 1)
+    with pytest.raises(TypeError):
+        pow(obj.expr() + 1, 2, 7).evaluate()
+    integers = cls(integer=4, boolean=True)
+    assert pow(integers.expr() << 0, 2, 7).evaluate() == tuple(pow(value, 2, 7) for value in integers << 0)
+
+
+def test_expressions_do_not_change(cls):
+    expression = cls(integer=4).expr() + 1
+    alias = expression
+    expression += 2
+    assert alias.evaluate()[1] == 5 and expression.evaluate()[1] == 7
+
+
+def test_fields_are_read_when_evaluated(cls):
+    obj = cls(integer=4)
+    expression = obj.expr() * 2
+    obj.integer = 5
+    assert expression.evaluate()[1] == 10
@@ -0,0 +1,40 @@
+import pytest
+
+from all_types import NAME_ALL_TYPES
+
+VALUES = (True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1}, frozenset({2}))
+
+
+def test_failed_operator_leaves_the_instance_unchanged(cls):
+    obj = cls(*VALUES)
+    with pytest.raises(TypeError):
+        # boolean and integer give 'x', 'xxxx', the float_num raises.
+        obj *= 'x'
+    assert obj.all_types == VALUES
+
+
+def test_in_place_results_are_the_operator_results(cls):
+    for operand in (2, 2.5, 1j):
+        obj, expected = cls(*VALUES), cls(*VALUES) + operand
+        obj += operand
+        # The results are stored as they are, a reading would convert them to the types of the fields.
+        assert tuple(getattr(cls, name).raw(obj) for name in NAME_ALL_TYPES[:len(expected)]) == expected
+
+
+def test_lists_and_sets_are_changed_in_place(cls):
+    class Direct(cls):
+        __slots__ = ()
+    Direct.set_read_mode('direct')
+    obj = Direct(array=[1], set_={1})
+    array, set_ = obj.array, obj.set_
+    obj += [2]
+    obj |= {3}
+    assert obj.array is array and array == [1, 2]
+    assert obj.set_ is set_ and set_ == {1, 2, 3}
+
+
+def test_in_place_operator_changes_the_version(cls):
+    obj = cls(integer=1)
+    version = obj._version
+    obj += 1
+    assert obj._version != version
@@ -0,0 +1,57 @@
+import gc
+
+import pytest
+
+from all_types import AllTypes, CompactAllTypes
+
+
+def record(**kwargs):
+    # Values built at run time, so that equal ones are not the same object to begin with.
+    return AllTypes(string=''.join(['inter', 'ned']), tuple_=tuple([1, 2, 3]), frozenset_=frozenset([4, 5]), **kwargs)
+
+
+def test_equal_instances_are_shared():
+    first = AllTypes.intern(record(integer=1))
+    second = record(integer=1)
+    hits = AllTypes.intern_info()['hits']
+    assert AllTypes.intern(second) is first
+    assert AllTypes.intern_info()['hits'] == hits + 1
+    assert AllTypes.interned(integer=1, string='other') is not first
+
+
+def test_equal_values_are_shared():
+    first = AllTypes.intern(record(integer=1))
+    second = AllTypes.intern(record(integer=2))
+    assert second is not first
+    assert second.string is first.string
+    assert second.tuple_ is first.tuple_
+    assert second.frozenset_ is first.frozenset_
+
+
+def test_unhashable_values_are_not_shared():
+    first = AllTypes.intern(AllTypes(integer=1, tuple_=([1],)))
+    second = AllTypes.intern(AllTypes(integer=2, tuple_=([1],)))
+    assert second is not first
+    assert second.tuple_ is not first.tuple_
+
+
+def test_changed_instance_is_not_returned():
+    first = AllTypes.intern(record(integer=7))
+    first.integer = 8
+    second = record(integer=7)
+    assert AllTypes.intern(second) is second
+
+
+def test_collected_instances_are_dropped():
+    instances = AllTypes.intern_info()['instances']
+    obj = AllTypes.intern(record(integer=123456))
+    assert AllTypes.intern_info()['instances'] == instances + 1
+    del obj
+    gc.collect()
+    AllTypes.intern(AllTypes())
+    assert AllTypes.intern_info()['instances'] <= instances + 1
+
+
+def test_instances_without_weak_references_are_refused():
+    with pytest.raises(TypeError):
+        CompactAllTypes.intern(CompactAllTypes())
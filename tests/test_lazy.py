@@ -0,0 +1,41 @@
+import pytest
+
+
+@pytest.fixture
+def lazy_class(subclass):
+    subclass.set_result_mode('lazy')
+    return subclass
+
+
+def test_lazy_result_equals_the_eager_tuple(cls, lazy_class):
+    values = (True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1}, frozenset({2}))
+    for operand in (3, 'x', [1], {1}):
+        assert lazy_class(*values) + operand == cls(*values) + operand
+        assert (lazy_class(*values) == operand) == (cls(*values) == operand)
+
+
+def test_items_are_computed_on_access(lazy_class):
+    obj = lazy_class(integer=4, string='ab')
+    result = obj / 0
+    with pytest.raises(ZeroDivisionError):
+        result[1]
+    result = obj + [1, 2]
+    assert result[1] == [4, 1, 2]
+
+
+def test_later_writes_do_not_change_the_result(lazy_class):
+    obj = lazy_class(integer=4, array=[1])
+    result = obj + [2]
+    obj.integer = 10
+    obj += [3]
+    assert result[1] == [4, 2] and result[5] == [1, 2]
+
+
+def test_indexing_behaves_like_a_tuple(lazy_class):
+    result = lazy_class(integer=4) + 1
+    assert result[-3] == 5 and result[True] == 5 and result[1:3] == (5, 1.0)
+    with pytest.raises(IndexError):
+        result[4]
+    for item in ('a', 1.0):
+        with pytest.raises(TypeError, match='tuple indices must be integers or slices'):
+            result[item]
@@ -0,0 +1,30 @@
+import pytest
+
+
+@pytest.fixture
+def records(cls):
+    return [cls(integer=index, float_num=index / 2, string=str(index), array=[index]) for index in range(-5, 45)]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_results_in_the_order_of_the_instances(cls, records, workers):
+    for symbol, operand, layout in (('**', 2, 'left'), ('-', 3, 'right'), ('>=', 10, 'left'), ('+', [0], 'left')):
+        expected = [record._comparison(operand, symbol) if symbol == '>='
+                    else record._arithmetic(operand, symbol, layout) for record in records]
+        assert cls.parallel_map(records, symbol, operand, layout, workers=workers, chunksize=7) == expected
+
+
+def test_stream_gives_the_same_results(cls, records):
+    results = cls.parallel_map(records, '*', 3, workers=2, chunksize=4, stream=True)
+    assert list(results) == [record * 3 for record in records]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_first_exception_is_raised(cls, records, workers):
+    with pytest.raises(ZeroDivisionError):
+        cls.parallel_map(records, '/', 0, workers=workers, chunksize=5)
+
+
+def test_in_place_operators_are_refused(cls, records):
+    with pytest.raises(TypeError):
+        cls.parallel_map(records, '+', 1, 'equally')
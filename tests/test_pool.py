@@ -0,0 +1,72 @@
+import gc
+import io
+
+import pytest
+
+from all_types import AllTypes, CompactAllTypes
+
+
+@pytest.fixture
+def pooled():
+    return type('Pooled', (AllTypes,), {})
+
+
+def test_constructor_returns_the_last_instance_when_full(pooled):
+    first = pooled.define_max_instance(2, integer=1)
+    second = pooled(integer=2)
+    assert pooled(integer=3) is second
+    assert pooled.pool_info()['in_use'] == 2
+    assert first.integer == 1
+
+
+def test_released_instance_is_reused(pooled):
+    first = pooled.define_max_instance(2, integer=1)
+    second = pooled(integer=2)
+    pooled.release(second)
+    reused = pooled(integer=4)
+    assert reused is second and reused.integer == 4
+    assert pooled.pool_info()['reuses'] == 1
+    assert first.integer == 1
+
+
+def test_reused_instance_starts_empty(pooled):
+    file = io.StringIO()
+    first = pooled.define_max_instance(1, integer=1)
+    first.hello = lambda: 'hello'
+    first.file = file
+    hash(first)
+    pooled.release(first)
+    reused = pooled(integer=2)
+    assert reused is first
+    assert reused() == {} and reused.__enter__() == ()
+    with reused:
+        pass
+    assert not file.closed
+    assert hash(reused) == hash(AllTypes(integer=2))
+
+
+def test_reused_compact_instance_starts_empty():
+    class Pooled(CompactAllTypes):
+        __slots__ = ('hello',)
+    first = Pooled.define_max_instance(1, integer=1, array=[1])
+    first.hello = lambda: 'hello'
+    Pooled.release(first)
+    reused = Pooled(string='x')
+    assert reused is first
+    assert reused() == {} and reused.all_types == CompactAllTypes(string='x').all_types
+
+
+def test_collected_instance_gives_its_slot_back(pooled):
+    first = pooled.define_max_instance(1, integer=1)
+    del first
+    gc.collect()
+    second = pooled(integer=2)
+    assert second.integer == 2
+    assert pooled.pool_info()['reclaims'] == 1
+
+
+def test_acquire_times_out_when_full(pooled):
+    kept = pooled.define_max_instance(1)
+    with pytest.raises(TimeoutError):
+        pooled.acquire(timeout=0.01)
+    assert kept.pool_info()['waits'] == 1
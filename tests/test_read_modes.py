@@ -0,0 +1,57 @@
+from types import MappingProxyType
+
+import pytest
+
+from all_types import AllTypes, ListView, OnlySelfType, SetView
+
+
+def test_copy_mode_returns_new_objects(subclass):
+    obj = subclass(array=[1], set_={1})
+    obj.array.append(2)
+    obj.set_.add(2)
+    assert obj.array == [1] and obj.set_ == {1}
+
+
+def test_direct_mode_returns_the_stored_objects(subclass):
+    subclass.set_read_mode('direct')
+    obj = subclass(array=[1], dictionary={})
+    assert obj.array is obj.array
+    obj.array.append(2)
+    obj.dictionary['k'] = 1
+    assert obj.array == [1, 2] and obj.dictionary == {'k': 1}
+
+
+def test_direct_mode_after_in_place_operators(subclass):
+    subclass.set_read_mode('direct')
+    obj = subclass(array=[1], set_={1, 2})
+    array = obj.array
+    obj += [3]
+    assert array == [1, 3] and obj.array is array
+    obj -= frozenset({1})
+    obj.set_.add(99)
+    assert obj.set_ == {2, 3, 99}
+
+
+def test_view_mode_is_read_only_and_live(subclass):
+    subclass.set_read_mode('view')
+    obj = subclass(array=[1], dictionary={'k': 1}, set_={1})
+    array, dictionary, set_ = obj.array, obj.dictionary, obj.set_
+    assert (type(array), type(dictionary), type(set_)) == (ListView, MappingProxyType, SetView)
+    with pytest.raises(AttributeError):
+        array.append(2)
+    obj += [2]
+    assert list(array) == [1, 2]
+
+
+def test_read_mode_of_a_field_wins_over_the_class():
+    class Mixed(AllTypes):
+        array = OnlySelfType(list, read_mode='direct')
+    obj = Mixed(array=[1], set_={1})
+    obj.array.append(2)
+    obj.set_.add(2)
+    assert obj.array == [1, 2] and obj.set_ == {1}
+
+
+def test_unknown_read_mode_raises():
+    with pytest.raises(ValueError):
+        OnlySelfType(list, read_mode='deep')
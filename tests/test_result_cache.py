@@ -0,0 +1,41 @@
+import pytest
+
+
+@pytest.fixture
+def cached_class(subclass):
+    subclass.enable_result_cache()
+    yield subclass
+    subclass.disable_result_cache()
+
+
+def test_repeated_operator_is_a_hit(cached_class):
+    obj = cached_class(integer=4, array=[1, 2])
+    assert obj + 'x' == obj + 'x'
+    info = cached_class.result_cache_info()
+    assert (info['hits'], info['misses']) == (1, 1)
+
+
+def test_write_of_a_field_invalidates(cached_class):
+    obj = cached_class(integer=4)
+    assert (obj + 1)[1] == 5
+    obj.integer = 10
+    assert (obj + 1)[1] == 11
+    obj += 1
+    assert (obj + 1)[1] == 12
+
+
+def test_nested_mutation_is_not_served_stale(cached_class):
+    obj = cached_class(array=[[1]], dictionary={'k': [1]})
+    obj + 'x'
+    obj.array[0].append(2)
+    obj.dictionary['k'].append(5)
+    result = obj + 'x'
+    assert result[5] == '[[1, 2]]x'
+    assert result[7] == "{'k': [1, 5]}x"
+
+
+def test_cached_result_can_not_be_changed_by_the_caller(cached_class):
+    obj = cached_class(array=[1])
+    first = obj - {1}
+    first[5].add(2)
+    assert (obj - {1})[5] == set()
@@ -0,0 +1,35 @@
+import pytest
+
+VALUES = (True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1, 5}, frozenset({2}))
+
+
+def test_results_are_the_operator_results(cls):
+    obj = cls(*VALUES)
+    assert obj.only('integer', 'string') + 5 == {'integer': (obj + 5)[1]}
+    assert obj.only('string', 'array') * 2 == {'string': 'abab', 'array': [1, 1]}
+    assert (obj.only('float_num', 'set_') < 0) == {'float_num': True}
+    assert obj.apply('-', {1}, fields=('set_', 'frozenset_')) == {'set_': {5}, 'frozenset_': frozenset({2})}
+
+
+def test_only_the_selected_fields_are_read(subclass, reads):
+    obj = subclass(*VALUES)
+    reads.clear()
+    assert obj.only('integer', 'string') + 5 == {'integer': 9}
+    assert reads == ['integer']
+    reads.clear()
+    obj.only('integer', 'array') * 2
+    assert sorted(reads) == ['array', 'integer']
+
+
+def test_in_place_changes_the_selected_fields(cls):
+    obj = cls(*VALUES)
+    selection = obj.only('integer')
+    selection += 1
+    assert obj.integer == 5 and obj.float_num == -2.5 and obj.boolean is True
+
+
+def test_unknown_fields_raise(cls):
+    with pytest.raises(ValueError, match='Unknown fields'):
+        cls().only('integer', 'missing')
+    with pytest.raises(ValueError, match='Unknown fields'):
+        cls().apply('+', 1, fields=('missing',))
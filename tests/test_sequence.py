@@ -0,0 +1,45 @@
+import pytest
+
+from all_types import NAME_ALL_TYPES
+
+VALUES = (True, 4, -2.5, 3 - 2j, 'ab', [1], (2,), {1: 2}, {1, 5}, frozenset({2}))
+
+
+def test_sequence_protocol(cls):
+    obj = cls(*VALUES)
+    assert len(obj) == len(NAME_ALL_TYPES)
+    assert tuple(obj) == VALUES
+    assert tuple(reversed(obj)) == VALUES[::-1]
+    assert obj[4] == 'ab' and obj[-1] == frozenset({2})
+    assert obj[2:5] == VALUES[2:5] and obj[::-3] == VALUES[::-3]
+    assert 'ab' in obj and [1] in obj and 'missing' not in obj
+    with pytest.raises(IndexError):
+        obj[len(NAME_ALL_TYPES)]
+
+
+def test_an_item_reads_only_its_field(cls, reads):
+    obj = cls(*VALUES)
+    reads.clear()
+    assert obj[5] == [1]
+    assert reads == ['array']
+
+
+def test_iteration_reads_each_field_once(cls, reads):
+    obj = cls(*VALUES)
+    reads.clear()
+    list(obj)
+    assert reads == list(NAME_ALL_TYPES)
+
+
+def test_nested_iterations_are_independent(cls):
+    obj = cls(*VALUES)
+    pairs = [(outer, inner) for outer in obj for inner in obj]
+    assert pairs == [(outer, inner) for outer in VALUES for inner in VALUES]
+    first, second = iter(obj), iter(obj)
+    assert next(first) is True and next(first) == 4 and next(second) is True
+
+
+def test_items_are_copies(cls):
+    obj = cls(*VALUES)
+    obj[5].append(2)
+    assert obj.array == [1]
@@ -0,0 +1,39 @@
+import pytest
+
+
+@pytest.fixture
+def measured(subclass):
+    subclass.enable_stats()
+    yield subclass
+    subclass.disable_stats()
+
+
+def test_calls_and_errors_by_method_and_operand_type(measured):
+    obj = measured(integer=2)
+    obj + 1
+    obj + 1
+    1 - obj
+    with pytest.raises(ZeroDivisionError):
+        obj / 0
+    operators = measured.stats()['operators']
+    assert operators['__add__']['int']['calls'] == 2
+    assert operators['__rsub__']['int']['calls'] == 1
+    assert (operators['__truediv__']['int']['calls'], operators['__truediv__']['int']['errors']) == (1, 1)
+    assert sum(operators['__add__']['int']['histogram_us'].values()) == 2
+
+
+def test_comparison_branches(measured):
+    obj = measured(integer=2)
+    obj == 2
+    obj < [1]
+    assert measured.stats()['comparison_branches'] == {'__eq__': {'number': 1}, '__lt__': {'container': 1}}
+
+
+def test_reset_and_disable(measured):
+    obj = measured(integer=2)
+    obj + 1
+    measured.reset_stats()
+    assert measured.stats()['operators'] == {}
+    measured.disable_stats()
+    obj + 1
+    assert measured.stats() == {}
@@ -0,0 +1,48 @@
+import pytest
+
+from all_types import AllTypes, AllTypesStore
+
+VALUES = (True, 2 ** 70, -1.5, 1 - 2j, 'strß', [1, 'a', (2, 3)], (None, b'x'), {'k': [1]}, {1, 'q'}, frozenset({2.5}))
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'records')
+
+
+def test_random_access(path, cls):
+    with AllTypesStore.open(path, 'a', cls) as store:
+        store.extend(cls(integer=index) for index in range(5))
+        assert store.append(cls(*VALUES)) == 5
+    with AllTypesStore.open(path, record_class=cls) as store:
+        assert len(store) == 6
+        assert type(store[2]) is cls and store[2].integer == 2
+        assert [record.integer for record in store[1:3]] == [1, 2]
+        assert store[-1].all_types == VALUES
+        assert [record.integer for record in store][:5] == [0, 1, 2, 3, 4]
+        with pytest.raises(IndexError):
+            store[6]
+
+
+def test_reader_sees_later_appends(path):
+    with AllTypesStore.open(path, 'a') as writer, AllTypesStore.open(path) as reader:
+        assert len(reader) == 0 and list(reader) == []
+        writer.append(AllTypes(integer=1))
+        assert len(reader) == 1 and reader[0].integer == 1
+        writer.extend(AllTypes(integer=index) for index in range(2, 100))
+        assert len(reader) == 99 and reader[-1].integer == 99
+        assert [record.integer for record in reader] == list(range(1, 100))
+
+
+def test_reading_store_refuses_appends(path):
+    AllTypesStore.open(path, 'a').close()
+    with AllTypesStore.open(path) as store:
+        with pytest.raises(ValueError):
+            store.append(AllTypes())
+
+
+def test_other_file_is_refused(tmp_path):
+    other = tmp_path / 'other'
+    other.write_bytes(b'not a store')
+    with pytest.raises(ValueError):
+        AllTypesStore.open(str(other))
@@ -0,0 +1,50 @@
+import pytest
+
+from all_types import CompactAllTypes
+
+
+@pytest.fixture
+def records(cls):
+    return [cls(integer=index, float_num=index / 2, string=str(index)) for index in range(10)]
+
+
+def test_steps_are_the_operators_of_the_records(cls, records):
+    results = list(cls.stream(records).add(3).mul(2).where('integer', '>=', 14))
+    assert [record.integer for record in results] == [14, 16, 18, 20, 22, 24]
+    assert [record.float_num for record in results] == [(index / 2 + 3) * 2 for index in range(4, 10)]
+    assert all(type(record) is cls for record in results)
+    assert [record.string for record in results] == [str(index) * 2 for index in range(4, 10)]
+
+
+def test_nothing_is_read_before_iteration(cls):
+    read = []
+
+    def source():
+        for index in range(1000):
+            read.append(index)
+            yield cls(integer=index)
+
+    stream = cls.stream(source()).add(1)
+    assert read == []
+    assert [record.integer for record in stream.limit(3)] == [1, 2, 3]
+    assert read == [0, 1, 2]
+
+
+def test_batches(cls, records):
+    assert [len(batch) for batch in cls.stream(records).batches(4)] == [4, 4, 2]
+
+
+def test_result_that_does_not_fit_raises_type_error(cls):
+    with pytest.raises(TypeError):
+        list(cls.stream([cls()]).add('x'))
+    with pytest.raises(TypeError):
+        list(cls.stream([cls()]).sub({1}))
+
+
+def test_where_needs_a_compared_field(cls, records):
+    with pytest.raises(ValueError):
+        cls.stream(records).where('string', '<', 1)
+
+
+def test_records_of_another_class(records):
+    assert {type(record) for record in CompactAllTypes.stream(records).add(1)} == {CompactAllTypes}
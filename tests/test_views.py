@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+
+from all_types import SequenceView
+
+
+@pytest.fixture
+def viewing(subclass):
+    subclass.set_result_mode('view')
+    return subclass
+
+
+def test_repetition_is_a_view(viewing):
+    obj = viewing(string='ab', array=[1, 2], tuple_=(3,))
+    result = obj * 1000
+    for index, value in ((4, 'ab'), (5, [1, 2]), (6, (3,))):
+        view = result[index]
+        assert isinstance(view, SequenceView)
+        expected = value * 1000
+        assert len(view) == len(expected) and view == expected and view.materialize() == expected
+        assert view[0] == expected[0] and view[-1] == expected[-1] and view[999] == expected[999]
+        assert view[3:9] == expected[3:9] and view[::-7] == expected[::-7]
+        assert list(view) == list(expected)
+
+
+def test_memory_does_not_grow_with_the_count(viewing):
+    obj = viewing(string='ab' * 100)
+    assert sys.getsizeof((obj * 10)[4]) == sys.getsizeof((obj * 10 ** 6)[4])
+
+
+def test_concatenation_is_a_view(viewing):
+    obj = viewing(string='ab', array=[1, 2], tuple_=(3,))
+    result = obj + [4]
+    assert isinstance(result[5], SequenceView) and result[5] == [1, 2, 4] and 4 in result[5]
+    text = (obj + 'cd')[4]
+    assert text == 'abcd' and 'bc' in text and text[1:3] == 'bc'
+
+
+def test_views_do_not_change_with_the_instance(viewing):
+    obj = viewing(array=[1])
+    view = (obj * 3)[5]
+    obj.array.append(2)
+    obj.array = [5]
+    assert view == [1, 1, 1]
+
+
+def test_index_errors(viewing):
+    view = (viewing(array=[1, 2]) * 2)[5]
+    with pytest.raises(IndexError):
+        view[4]
+    with pytest.raises(TypeError, match='list indices must be integers or slices, not str'):
+        view['0']
+
+
+def test_eager_mode_builds_the_sequences(cls):
+    assert type((cls(string='ab') * 2)[4]) is str